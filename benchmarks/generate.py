@@ -0,0 +1,106 @@
+"""
+Generator of synthetic (but valid) Latte programs of configurable size.
+"""
+import argparse
+
+
+def gen_functions(count: int, expr_length: int) -> list:
+    """ `count` top level functions calling their predecessors. """
+    lines = []
+    for i in range(count):
+        terms = ' + '.join(
+            f'{"a" if k % 2 else "b"} * {k % 7 + 1}'
+            for k in range(expr_length)
+        )
+        lines += [
+            f'int fun{i}(int a, int b) {{',
+            f'    int x = {terms};',
+            f'    if (x > {i}) {{',
+            f'        x = x - {i};',
+            '    } else {',
+            '        x++;',
+            '    }',
+        ]
+        if i > 0:
+            lines.append(f'    x = x + fun{i - 1}(a - 1, b) % 3;')
+        lines += ['    return x;', '}', '']
+    return lines
+
+
+def gen_classes(depth: int, methods: int) -> list:
+    """ A chain of `depth` classes, each overriding all `methods`. """
+    lines = []
+    for i in range(depth):
+        parent = f' extends Cls{i - 1}' if i else ''
+        lines += [f'class Cls{i}{parent} {{', f'    int field{i};']
+        for m in range(methods):
+            lines += [
+                f'    int method{m}(int v) {{',
+                f'        field{i} = field{i} + v * {m + 1};',
+                f'        return field{i} + {i};',
+                '    }',
+            ]
+        lines += ['}', '']
+    return lines
+
+
+def gen_nested(depth: int) -> list:
+    """ Function with `depth` nested blocks (alternating if and while). """
+    lines = ['int nested(int n) {', '    int acc = 0;']
+    for d in range(depth):
+        indent = '    ' * (d + 1)
+        if d % 2:
+            lines.append(f'{indent}while (n > {d}) {{ n--; int v{d} = n;')
+        else:
+            lines.append(f'{indent}if (n > {d}) {{ int v{d} = n + {d};')
+        lines.append(f'{indent}    acc = acc + v{d};')
+    for d in range(depth - 1, -1, -1):
+        lines.append('    ' * (d + 1) + '}')
+    lines += ['    return acc;', '}', '']
+    return lines
+
+
+def gen_main(functions: int, classes: int, methods: int, strings: int):
+    lines = ['int main() {']
+    for i in range(strings):
+        lines.append(f'    printString("string literal number {i}");')
+    if functions:
+        lines.append(f'    printInt(fun{functions - 1}(10, 20));')
+    if classes:
+        lines.append(f'    Cls0 obj = new Cls{classes - 1};')
+        for m in range(methods):
+            lines.append(f'    printInt(obj.method{m}({m}));')
+    lines += ['    printInt(nested(100));', '    return 0;', '}', '']
+    return lines
+
+
+def generate(
+        functions: int = 100, classes: int = 10, methods: int = 5,
+        depth: int = 20, expr_length: int = 10, strings: int = 100
+) -> str:
+    lines = gen_classes(classes, methods)
+    lines += gen_functions(functions, expr_length)
+    lines += gen_nested(depth)
+    lines += gen_main(functions, classes, methods, strings)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generates a synthetic Latte program.'
+    )
+    parser.add_argument('--functions', type=int, default=100)
+    parser.add_argument('--classes', type=int, default=10)
+    parser.add_argument('--methods', type=int, default=5)
+    parser.add_argument('--depth', type=int, default=20)
+    parser.add_argument('--expr-length', type=int, default=10)
+    parser.add_argument('--strings', type=int, default=100)
+    args = parser.parse_args()
+    print(generate(
+        args.functions, args.classes, args.methods,
+        args.depth, args.expr_length, args.strings
+    ))
+
+
+if __name__ == '__main__':
+    main()
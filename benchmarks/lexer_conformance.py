@@ -0,0 +1,110 @@
+"""
+Conformance test of the hand-written lexer (src/fast_lexer.py).
+
+Lexes the example programs and a corpus of fuzzed sources (random token
+soup with comments, broken strings, stray characters and non-ASCII
+letters) with both antlr's generated lexer and the hand-written one,
+failing on the first difference in produced tokens or reported errors.
+Lexing times of both lexers are reported as well.
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+from antlr4.error.ErrorListener import ErrorListener  # noqa: E402
+
+from fast_lexer import FastLexer, LatteLexer, LITERALS  # noqa: E402
+
+
+PIECES = list(LITERALS) + [
+    ' ', '  ', '\n', '\r\n', '\t', 'x', 'foo_1', '_', 'Zażółć', 'ÿß', '×',
+    '÷', 'λ', '0', '42', '007', '"', '"str"', '"a\\tb\\n\\"c\\\\"', '"\\q"',
+    '"\\', '"new\nline"', '#', '# comment', '// comment', '/*', '*/',
+    '/* multi\nline */', '&', '|', '@', '$', '\\', "'", '?', '\x00', ' ',
+]
+
+
+class Collector(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(f'line {line}:{column} {msg}')
+
+
+def lex(lexer_class, source: str):
+    """ Tokens (as comparable tuples) and errors reported while lexing. """
+    lexer = lexer_class(InputStream(source))
+    collector = Collector()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(collector)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    tokens = [
+        (t.type, t.channel, t.text, t.line, t.column, t.start, t.stop)
+        for t in stream.tokens
+    ]
+    return tokens, collector.errors
+
+
+def fuzzed(rng: random.Random, length: int) -> str:
+    return ''.join(rng.choice(PIECES) for _ in range(length))
+
+
+def corpus(count: int, seed: int):
+    for path in sorted(glob.glob(os.path.join(HERE, '..', 'tests', '*.lat'))):
+        with open(path, encoding='utf-8') as f:
+            yield path, f.read()
+    rng = random.Random(seed)
+    for i in range(count):
+        yield f'fuzzed #{i}', fuzzed(rng, rng.randint(0, 200))
+
+
+def first_difference(expected: list, actual: list) -> str:
+    for i, (e, a) in enumerate(zip(expected, actual)):
+        if e != a:
+            return f'at {i}: antlr {e!r}, fast {a!r}'
+    return f'lengths: antlr {len(expected)}, fast {len(actual)}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lexer conformance test.')
+    parser.add_argument(
+        '--count', type=int, default=2000, help='Number of fuzzed sources.'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Fuzzing seed.')
+    args = parser.parse_args()
+
+    times = {LatteLexer: 0.0, FastLexer: 0.0}
+    sources = 0
+    for name, source in corpus(args.count, args.seed):
+        results = {}
+        for lexer_class in times:
+            start = time.perf_counter()
+            results[lexer_class] = lex(lexer_class, source)
+            times[lexer_class] += time.perf_counter() - start
+        for expected, actual, what in zip(
+                results[LatteLexer], results[FastLexer], ('tokens', 'errors')
+        ):
+            if expected != actual:
+                print(f'{name}: {what} differ', file=sys.stderr)
+                print(repr(source), file=sys.stderr)
+                print(first_difference(expected, actual), file=sys.stderr)
+                raise SystemExit(1)
+        sources += 1
+
+    print(
+        f'{sources} sources lexed identically, '
+        f'antlr {times[LatteLexer]:.2f}s, fast {times[FastLexer]:.2f}s'
+    )
+
+
+if __name__ == '__main__':
+    main()
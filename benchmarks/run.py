@@ -0,0 +1,204 @@
+"""
+Compiler throughput benchmark.
+
+Compiles synthetic programs (see generate.py) of growing size, reporting
+lines per second and time of each pass. Results are compared with a stored
+baseline and each pass is checked for superlinear scaling (in the size of
+the source in characters, as lines of larger programs are longer).
+With `--nested` the programs are single functions of deeply nested blocks,
+which checks that entering and leaving scopes is constant time.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from generate import generate  # noqa: E402
+from latc import run_passes  # noqa: E402
+from pass_manager import optimizations  # noqa: E402
+from pass_stats import PassStats  # noqa: E402
+
+
+BASELINE_PATH = os.path.join(HERE, 'baseline.json')
+
+# program at scale 1, every dimension grows linearly with the scale
+BASE_SIZE = {
+    'functions': 50,
+    'classes': 5,
+    'methods': 5,
+    'depth': 10,
+    'expr_length': 10,
+    'strings': 50
+}
+
+# nesting depth of the program at scale 1 for `--nested`
+NESTED_DEPTH = 50
+
+
+def measure(source: str, repeat: int) -> dict:
+    """ Best of `repeat` times of every pass. """
+    from antlr4 import InputStream
+    best = {}
+    for _ in range(repeat):
+        # garbage of the previous compilation is not this one's to collect
+        gc.collect()
+        stats = PassStats(trace_memory=False)
+        run_passes(InputStream(source), optimizations(), stats)
+        for p in stats.passes:
+            best[p['pass']] = min(best.get(p['pass'], math.inf), p['time'])
+    return best
+
+
+def program(scale: int, nested: bool) -> str:
+    if nested:
+        return generate(0, 0, 0, NESTED_DEPTH * scale, 0, 0)
+    size = {k: v * scale for k, v in BASE_SIZE.items()}
+    # nesting of the programs the baseline was measured on
+    size['depth'] = min(size['depth'], 40)
+    return generate(**size)
+
+
+def run(scales: list, repeat: int, nested: bool = False) -> dict:
+    # the first compilation warms up antlr's caches
+    measure(generate(**BASE_SIZE), 1)
+    results = {}
+    for scale in scales:
+        source = program(scale, nested)
+        passes = measure(source, repeat)
+        lines = source.count('\n') + 1
+        total = sum(passes.values())
+        results[str(scale)] = {
+            'lines': lines,
+            'chars': len(source),
+            'total': total,
+            'lines_per_second': lines / total,
+            'passes': passes
+        }
+    return results
+
+
+def print_results(results: dict):
+    passes = list(next(iter(results.values()))['passes'])
+    print(
+        f'{"scale":>6}{"lines":>8}{"lines/s":>10}' +
+        ''.join(f'{p[:12]:>13}' for p in passes)
+    )
+    for scale, r in results.items():
+        print(
+            f'{scale:>6}{r["lines"]:>8}{r["lines_per_second"]:>10.0f}' +
+            ''.join(f'{1000 * r["passes"][p]:>11.1f}ms' for p in passes)
+        )
+
+
+def check_regressions(results: dict, baseline: dict, threshold: float):
+    """ Passes slower (per line) than `threshold` times the baseline. """
+    problems = []
+    for scale, r in results.items():
+        if scale not in baseline:
+            continue
+        base = baseline[scale]
+        for name, t in r['passes'].items():
+            if name not in base['passes']:
+                continue
+            per_line = t / r['lines']
+            base_per_line = base['passes'][name] / base['lines']
+            if per_line > threshold * base_per_line:
+                problems.append(
+                    f'{name} at scale {scale}: {1000 * t:.1f}ms, '
+                    f'baseline {1000 * base["passes"][name]:.1f}ms'
+                )
+    return problems
+
+
+def check_scaling(results: dict, max_exponent: float):
+    """
+    Passes whose time grows faster than chars ** `max_exponent`
+    between the smallest and the largest program.
+    """
+    if len(results) < 2:
+        return []
+    scales = sorted(results, key=lambda s: results[s]['chars'])
+    small, large = results[scales[0]], results[scales[-1]]
+    problems = []
+    for name, t in large['passes'].items():
+        t0 = small['passes'].get(name)
+        if not t0 or not t:
+            continue
+        exponent = (
+            math.log(t / t0) / math.log(large['chars'] / small['chars'])
+        )
+        if exponent > max_exponent:
+            problems.append(
+                f'{name} scales as chars^{exponent:.2f} '
+                f'({1000 * t0:.1f}ms -> {1000 * t:.1f}ms)'
+            )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compiler benchmark.')
+    parser.add_argument(
+        '--scales', type=str, default='1,2,4',
+        help='Comma separated sizes of generated programs.'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='Compilations per size (best time is taken).'
+    )
+    parser.add_argument(
+        '--baseline', type=str, default=BASELINE_PATH,
+        help='Baseline to compare with.'
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help='Store results as the new baseline.'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=1.5,
+        help='Slowdown (relative to the baseline) reported as regression.'
+    )
+    parser.add_argument(
+        '--max-exponent', type=float, default=1.4,
+        help='Growth of pass time (as power of characters) reported as '
+             'superlinear scaling.'
+    )
+    parser.add_argument(
+        '--nested', action='store_true',
+        help='Measure deeply nested blocks (not compared with the baseline).'
+    )
+    parser.add_argument('--json', type=str, help='Write results as json.')
+    args = parser.parse_args()
+    if args.nested and args.save_baseline:
+        parser.error('--nested results cannot be stored as the baseline')
+
+    scales = [int(s) for s in args.scales.split(',')]
+    results = run(scales, args.repeat, args.nested)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        return
+
+    problems = check_scaling(results, args.max_exponent)
+    if os.path.exists(args.baseline) and not args.nested:
+        with open(args.baseline) as f:
+            problems += check_regressions(
+                results, json.load(f), args.threshold
+            )
+    for problem in problems:
+        print(f'REGRESSION: {problem}')
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Compiles and runs Latte test programs in parallel.
+
+For each tests/<name>.lat the output of the compiled program
+(fed with <name>.input, if present) is compared with <name>.expected.
+Every program is compiled with the options of each configuration
+(optimization levels, backends, ...); configurations other than the
+default one build in tests/build/<configuration>.
+Programs are recompiled only if the source, compiler or runtime changed.
+The hand-written lexer is also compared with antlr's on the programs and
+a fuzzed corpus (benchmarks/lexer_conformance.py, with a fixed seed).
+"""
+import argparse
+import glob
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COMPILER = 'bash ' + shlex.quote(os.path.join(HERE, 'latc_x86'))
+LEXER_CONFORMANCE = os.path.join(HERE, 'benchmarks', 'lexer_conformance.py')
+COMPILER_FILES = glob.glob(os.path.join(HERE, 'src', '*.py')) + [
+    os.path.join(HERE, 'lib', 'runtime.o')
+]
+
+# configuration -> options of the compiler
+CONFIGS = {
+    'default': [],
+    'O0': ['-O0'],
+    'O2': ['-O2'],
+    'ir': ['--backend', 'ir'],
+    'ir-ssa': ['--backend', 'ir', '--ssa', 'T'],
+    'ir-O3': ['--backend', 'ir', '--ssa', 'T', '-O3'],
+    'stream': ['--stream'],
+    'codegen-jobs': ['--codegen-jobs', '2'],
+    'incremental': ['--incremental'],
+    # compiled as a module, then linked alone
+    'module': ['--module'],
+}
+
+GREEN, RED, RESET = '\033[0;92m', '\033[0;31m', '\033[0m'
+
+
+class TestResult:
+    def __init__(self, name, config='default'):
+        self.name = name
+        self.config = config
+        self.status = 'passed'
+        self.message = ''
+        self.compile_time = 0.
+        self.run_time = 0.
+        self.compiled = False
+
+    def fail(self, status, message):
+        self.status = status
+        self.message = message
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'config': self.config,
+            'status': self.status,
+            'message': self.message,
+            'compiled': self.compiled,
+            'compile_time': self.compile_time,
+            'run_time': self.run_time
+        }
+
+
+def up_to_date(source: str, executable: str) -> bool:
+    if not os.path.exists(executable):
+        return False
+    built = os.path.getmtime(executable)
+    return all(
+        os.path.getmtime(path) < built
+        for path in [source] + COMPILER_FILES if os.path.exists(path)
+    )
+
+
+def build_source(source: str, config: str) -> str:
+    """ Where `source` is compiled in configuration `config`. """
+    if config == 'default':
+        return source
+    directory = os.path.join(os.path.dirname(source), 'build', config)
+    os.makedirs(directory, exist_ok=True)
+    copy = os.path.join(directory, os.path.basename(source))
+    # (keeping its time, so that up_to_date sees when the source changed)
+    shutil.copy2(source, copy)
+    return copy
+
+
+def compile_test(source: str, config: str, args):
+    """ Builds `source` into an executable, returns the compiler's run. """
+    base = os.path.splitext(source)[0]
+    compiler = shlex.split(args.compiler)
+    proc = subprocess.run(
+        compiler + CONFIGS[config] + [source],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    if proc.returncode == 0 and config == 'module':
+        link = subprocess.run(
+            compiler + ['--link', base + '.out', base + '.o'],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        link.stdout = proc.stdout + link.stdout
+        return link
+    return proc
+
+
+def run_test(test: str, config: str, args) -> TestResult:
+    expected_base = os.path.splitext(test)[0]
+    source = build_source(test, config)
+    base = os.path.splitext(source)[0]
+    result = TestResult(os.path.basename(source), config)
+
+    if args.force or not up_to_date(source, base + '.out'):
+        start = time.perf_counter()
+        proc = compile_test(source, config, args)
+        result.compile_time = time.perf_counter() - start
+        result.compiled = True
+        if proc.returncode != 0 or not os.path.exists(base + '.out'):
+            result.fail('compile error', proc.stdout)
+            return result
+
+    stdin = b''
+    if os.path.exists(expected_base + '.input'):
+        with open(expected_base + '.input', 'rb') as f:
+            stdin = f.read()
+    command = shlex.split(args.machine) + [base + '.out']
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            command, input=stdin, timeout=args.timeout,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+    except subprocess.TimeoutExpired:
+        result.run_time = time.perf_counter() - start
+        result.fail('timeout', f'Killed after {args.timeout}s.')
+        return result
+    result.run_time = time.perf_counter() - start
+
+    if not os.path.exists(expected_base + '.expected'):
+        return result
+    with open(expected_base + '.expected', 'rb') as f:
+        expected = f.read()
+    output = proc.stdout
+    # like the shell's $(...), ignore trailing newlines
+    if output.rstrip(b'\n') != expected.rstrip(b'\n'):
+        result.fail(
+            'bad output',
+            f'Expected:\n{expected.decode(errors="replace")}\n'
+            f'Got:\n{output.decode(errors="replace")}'
+        )
+    return result
+
+
+def run_lexer_conformance(args) -> TestResult:
+    """ Compares tokens of the hand-written lexer with antlr's. """
+    result = TestResult('lexer_conformance.py', 'fuzz')
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, LEXER_CONFORMANCE, '--count', str(args.lexer_fuzz),
+         '--seed', '0'],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    result.run_time = time.perf_counter() - start
+    if proc.returncode != 0:
+        result.fail('lexers differ', proc.stdout)
+    return result
+
+
+def write_junit(results: list, path: str):
+    suite = ET.Element(
+        'testsuite', name='latte', tests=str(len(results)),
+        failures=str(sum(r.status != 'passed' for r in results)),
+        time=f'{sum(r.compile_time + r.run_time for r in results):.3f}'
+    )
+    for r in results:
+        case = ET.SubElement(
+            suite, 'testcase', classname=f'latte.{r.config}', name=r.name,
+            time=f'{r.compile_time + r.run_time:.3f}'
+        )
+        if r.status != 'passed':
+            failure = ET.SubElement(case, 'failure', message=r.status)
+            failure.text = r.message
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latte compiler tests.')
+    parser.add_argument(
+        'tests', nargs='*',
+        help='Test programs to run (default: tests/*.lat).'
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count(),
+        help='Number of tests compiled / run at the same time.'
+    )
+    parser.add_argument(
+        '--machine', type=str, default=os.environ.get('MACHINE', 'qemu-i386'),
+        help='Emulator running compiled programs '
+             '(empty string when running elf 32 natively).'
+    )
+    parser.add_argument(
+        '--compiler', type=str, default=COMPILER,
+        help='Command running the compiler.'
+    )
+    parser.add_argument(
+        '--config', choices=list(CONFIGS), action='append',
+        help='Configuration of the compiler to test (can be repeated, '
+             'default: all of them).'
+    )
+    parser.add_argument(
+        '--timeout', type=float, default=60,
+        help='Time limit (in seconds) for a single program run.'
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='Recompile all programs, even if they are up to date.'
+    )
+    parser.add_argument(
+        '--lexer-fuzz', type=int, default=200, metavar='COUNT',
+        help='Number of fuzzed sources on which the hand-written lexer '
+             "is compared with antlr's (0 skips the comparison)."
+    )
+    parser.add_argument('--junit', type=str, help='Write JUnit xml report.')
+    parser.add_argument('--json', type=str, help='Write json report.')
+    args = parser.parse_args()
+
+    tests = args.tests or sorted(glob.glob(os.path.join(HERE, 'tests', '*.lat')))
+    tests = [os.path.abspath(test) for test in tests]
+    runs = [
+        (test, config)
+        for config in args.config or CONFIGS for test in tests
+    ]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        lexer = executor.submit(run_lexer_conformance, args) \
+            if args.lexer_fuzz else None
+        results = list(executor.map(lambda r: run_test(*r, args), runs))
+        if lexer:
+            results.append(lexer.result())
+    wall_time = time.perf_counter() - start
+
+    for r in results:
+        times = f'compile {r.compile_time:.2f}s, run {r.run_time:.2f}s'
+        name = f'{r.name} [{r.config}]'
+        if r.status == 'passed':
+            print(f'{GREEN}Test {name} passed!{RESET} ({times})')
+        else:
+            print(f'{RED}Test {name}: {r.status}!{RESET} ({times})')
+            print(r.message)
+    failed = sum(r.status != 'passed' for r in results)
+    print(f'{len(results) - failed}/{len(results)} passed in {wall_time:.2f}s')
+    if failed:
+        print(f'{RED}Some tests failed!{RESET}')
+    else:
+        print(f'{GREEN}All tests passed!{RESET}')
+
+    if args.junit:
+        write_junit(results, args.junit)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'wall_time': wall_time,
+                'tests': [r.to_dict() for r in results]
+            }, f, indent=2)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
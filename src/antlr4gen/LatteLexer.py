@@ -0,0 +1,253 @@
+# Generated from Latte.g4 by ANTLR 4.8
+from antlr4 import *
+from io import StringIO
+from typing.io import TextIO
+import sys
+
+
+
+def serializedATN():
+    with StringIO() as buf:
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2\63")
+        buf.write("\u015d\b\1\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7")
+        buf.write("\t\7\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r")
+        buf.write("\4\16\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23")
+        buf.write("\t\23\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30")
+        buf.write("\4\31\t\31\4\32\t\32\4\33\t\33\4\34\t\34\4\35\t\35\4\36")
+        buf.write("\t\36\4\37\t\37\4 \t \4!\t!\4\"\t\"\4#\t#\4$\t$\4%\t%")
+        buf.write("\4&\t&\4\'\t\'\4(\t(\4)\t)\4*\t*\4+\t+\4,\t,\4-\t-\4.")
+        buf.write("\t.\4/\t/\4\60\t\60\4\61\t\61\4\62\t\62\4\63\t\63\4\64")
+        buf.write("\t\64\4\65\t\65\4\66\t\66\4\67\t\67\48\t8\49\t9\3\2\3")
+        buf.write("\2\3\2\3\2\3\2\3\2\3\3\3\3\3\4\3\4\3\5\3\5\3\5\3\5\3\5")
+        buf.write("\3\5\3\5\3\5\3\6\3\6\3\7\3\7\3\b\3\b\3\t\3\t\3\n\3\n\3")
+        buf.write("\13\3\13\3\f\3\f\3\r\3\r\3\16\3\16\3\16\3\17\3\17\3\17")
+        buf.write("\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\21\3\21\3\21\3\22")
+        buf.write("\3\22\3\22\3\22\3\22\3\23\3\23\3\23\3\23\3\23\3\23\3\24")
+        buf.write("\3\24\3\24\3\24\3\25\3\25\3\26\3\26\3\26\3\26\3\27\3\27")
+        buf.write("\3\27\3\27\3\27\3\27\3\27\3\30\3\30\3\30\3\30\3\30\3\30")
+        buf.write("\3\30\3\30\3\31\3\31\3\31\3\31\3\31\3\32\3\32\3\32\3\33")
+        buf.write("\3\33\3\33\3\34\3\34\3\34\3\34\3\34\3\35\3\35\3\35\3\35")
+        buf.write("\3\35\3\35\3\36\3\36\3\36\3\36\3\37\3\37\3\37\3\37\3\37")
+        buf.write("\3 \3 \3 \3 \3 \3!\3!\3\"\3\"\3#\3#\3$\3$\3%\3%\3&\3&")
+        buf.write("\3\'\3\'\3(\3(\3(\3)\3)\3*\3*\3*\3+\3+\3+\3,\3,\3,\3-")
+        buf.write("\3-\7-\u010c\n-\f-\16-\u010f\13-\3-\3-\3-\3-\7-\u0115")
+        buf.write("\n-\f-\16-\u0118\13-\5-\u011a\n-\3-\3-\3.\3.\3.\3.\7.")
+        buf.write("\u0122\n.\f.\16.\u0125\13.\3.\3.\3.\3.\3.\3/\3/\5/\u012e")
+        buf.write("\n/\3\60\3\60\3\61\3\61\3\62\3\62\3\63\6\63\u0137\n\63")
+        buf.write("\r\63\16\63\u0138\3\64\3\64\5\64\u013d\n\64\3\65\3\65")
+        buf.write("\3\65\7\65\u0142\n\65\f\65\16\65\u0145\13\65\3\66\6\66")
+        buf.write("\u0148\n\66\r\66\16\66\u0149\3\66\3\66\3\67\3\67\5\67")
+        buf.write("\u0150\n\67\3\67\3\67\38\68\u0155\n8\r8\168\u0156\39\3")
+        buf.write("9\39\59\u015c\n9\3\u0123\2:\3\3\5\4\7\5\t\6\13\7\r\b\17")
+        buf.write("\t\21\n\23\13\25\f\27\r\31\16\33\17\35\20\37\21!\22#\23")
+        buf.write("%\24\'\25)\26+\27-\30/\31\61\32\63\33\65\34\67\359\36")
+        buf.write(";\37= ?!A\"C#E$G%I&K\'M(O)Q*S+U,W-Y.[/]\2_\2a\2c\2e\60")
+        buf.write("g\2i\61k\62m\63o\2q\2\3\2\t\4\2\f\f\17\17\5\2C\\\u00c2")
+        buf.write("\u00d8\u00da\u00e0\5\2c|\u00e1\u00f8\u00fa\u0101\3\2\62")
+        buf.write(";\5\2\13\f\17\17\"\"\4\2$$^^\7\2$$^^ppttvv\2\u0162\2\3")
+        buf.write("\3\2\2\2\2\5\3\2\2\2\2\7\3\2\2\2\2\t\3\2\2\2\2\13\3\2")
+        buf.write("\2\2\2\r\3\2\2\2\2\17\3\2\2\2\2\21\3\2\2\2\2\23\3\2\2")
+        buf.write("\2\2\25\3\2\2\2\2\27\3\2\2\2\2\31\3\2\2\2\2\33\3\2\2\2")
+        buf.write("\2\35\3\2\2\2\2\37\3\2\2\2\2!\3\2\2\2\2#\3\2\2\2\2%\3")
+        buf.write("\2\2\2\2\'\3\2\2\2\2)\3\2\2\2\2+\3\2\2\2\2-\3\2\2\2\2")
+        buf.write("/\3\2\2\2\2\61\3\2\2\2\2\63\3\2\2\2\2\65\3\2\2\2\2\67")
+        buf.write("\3\2\2\2\29\3\2\2\2\2;\3\2\2\2\2=\3\2\2\2\2?\3\2\2\2\2")
+        buf.write("A\3\2\2\2\2C\3\2\2\2\2E\3\2\2\2\2G\3\2\2\2\2I\3\2\2\2")
+        buf.write("\2K\3\2\2\2\2M\3\2\2\2\2O\3\2\2\2\2Q\3\2\2\2\2S\3\2\2")
+        buf.write("\2\2U\3\2\2\2\2W\3\2\2\2\2Y\3\2\2\2\2[\3\2\2\2\2e\3\2")
+        buf.write("\2\2\2i\3\2\2\2\2k\3\2\2\2\2m\3\2\2\2\3s\3\2\2\2\5y\3")
+        buf.write("\2\2\2\7{\3\2\2\2\t}\3\2\2\2\13\u0085\3\2\2\2\r\u0087")
+        buf.write("\3\2\2\2\17\u0089\3\2\2\2\21\u008b\3\2\2\2\23\u008d\3")
+        buf.write("\2\2\2\25\u008f\3\2\2\2\27\u0091\3\2\2\2\31\u0093\3\2")
+        buf.write("\2\2\33\u0095\3\2\2\2\35\u0098\3\2\2\2\37\u009b\3\2\2")
+        buf.write("\2!\u00a2\3\2\2\2#\u00a5\3\2\2\2%\u00aa\3\2\2\2\'\u00b0")
+        buf.write("\3\2\2\2)\u00b4\3\2\2\2+\u00b6\3\2\2\2-\u00ba\3\2\2\2")
+        buf.write("/\u00c1\3\2\2\2\61\u00c9\3\2\2\2\63\u00ce\3\2\2\2\65\u00d1")
+        buf.write("\3\2\2\2\67\u00d4\3\2\2\29\u00d9\3\2\2\2;\u00df\3\2\2")
+        buf.write("\2=\u00e3\3\2\2\2?\u00e8\3\2\2\2A\u00ed\3\2\2\2C\u00ef")
+        buf.write("\3\2\2\2E\u00f1\3\2\2\2G\u00f3\3\2\2\2I\u00f5\3\2\2\2")
+        buf.write("K\u00f7\3\2\2\2M\u00f9\3\2\2\2O\u00fb\3\2\2\2Q\u00fe\3")
+        buf.write("\2\2\2S\u0100\3\2\2\2U\u0103\3\2\2\2W\u0106\3\2\2\2Y\u0119")
+        buf.write("\3\2\2\2[\u011d\3\2\2\2]\u012d\3\2\2\2_\u012f\3\2\2\2")
+        buf.write("a\u0131\3\2\2\2c\u0133\3\2\2\2e\u0136\3\2\2\2g\u013c\3")
+        buf.write("\2\2\2i\u013e\3\2\2\2k\u0147\3\2\2\2m\u014d\3\2\2\2o\u0154")
+        buf.write("\3\2\2\2q\u015b\3\2\2\2st\7e\2\2tu\7n\2\2uv\7c\2\2vw\7")
+        buf.write("u\2\2wx\7u\2\2x\4\3\2\2\2yz\7}\2\2z\6\3\2\2\2{|\7\177")
+        buf.write("\2\2|\b\3\2\2\2}~\7g\2\2~\177\7z\2\2\177\u0080\7v\2\2")
+        buf.write("\u0080\u0081\7g\2\2\u0081\u0082\7p\2\2\u0082\u0083\7f")
+        buf.write("\2\2\u0083\u0084\7u\2\2\u0084\n\3\2\2\2\u0085\u0086\7")
+        buf.write(".\2\2\u0086\f\3\2\2\2\u0087\u0088\7=\2\2\u0088\16\3\2")
+        buf.write("\2\2\u0089\u008a\7*\2\2\u008a\20\3\2\2\2\u008b\u008c\7")
+        buf.write("+\2\2\u008c\22\3\2\2\2\u008d\u008e\7?\2\2\u008e\24\3\2")
+        buf.write("\2\2\u008f\u0090\7\60\2\2\u0090\26\3\2\2\2\u0091\u0092")
+        buf.write("\7]\2\2\u0092\30\3\2\2\2\u0093\u0094\7_\2\2\u0094\32\3")
+        buf.write("\2\2\2\u0095\u0096\7-\2\2\u0096\u0097\7-\2\2\u0097\34")
+        buf.write("\3\2\2\2\u0098\u0099\7/\2\2\u0099\u009a\7/\2\2\u009a\36")
+        buf.write("\3\2\2\2\u009b\u009c\7t\2\2\u009c\u009d\7g\2\2\u009d\u009e")
+        buf.write("\7v\2\2\u009e\u009f\7w\2\2\u009f\u00a0\7t\2\2\u00a0\u00a1")
+        buf.write("\7p\2\2\u00a1 \3\2\2\2\u00a2\u00a3\7k\2\2\u00a3\u00a4")
+        buf.write("\7h\2\2\u00a4\"\3\2\2\2\u00a5\u00a6\7g\2\2\u00a6\u00a7")
+        buf.write("\7n\2\2\u00a7\u00a8\7u\2\2\u00a8\u00a9\7g\2\2\u00a9$\3")
+        buf.write("\2\2\2\u00aa\u00ab\7y\2\2\u00ab\u00ac\7j\2\2\u00ac\u00ad")
+        buf.write("\7k\2\2\u00ad\u00ae\7n\2\2\u00ae\u00af\7g\2\2\u00af&\3")
+        buf.write("\2\2\2\u00b0\u00b1\7h\2\2\u00b1\u00b2\7q\2\2\u00b2\u00b3")
+        buf.write("\7t\2\2\u00b3(\3\2\2\2\u00b4\u00b5\7<\2\2\u00b5*\3\2\2")
+        buf.write("\2\u00b6\u00b7\7k\2\2\u00b7\u00b8\7p\2\2\u00b8\u00b9\7")
+        buf.write("v\2\2\u00b9,\3\2\2\2\u00ba\u00bb\7u\2\2\u00bb\u00bc\7")
+        buf.write("v\2\2\u00bc\u00bd\7t\2\2\u00bd\u00be\7k\2\2\u00be\u00bf")
+        buf.write("\7p\2\2\u00bf\u00c0\7i\2\2\u00c0.\3\2\2\2\u00c1\u00c2")
+        buf.write("\7d\2\2\u00c2\u00c3\7q\2\2\u00c3\u00c4\7q\2\2\u00c4\u00c5")
+        buf.write("\7n\2\2\u00c5\u00c6\7g\2\2\u00c6\u00c7\7c\2\2\u00c7\u00c8")
+        buf.write("\7p\2\2\u00c8\60\3\2\2\2\u00c9\u00ca\7x\2\2\u00ca\u00cb")
+        buf.write("\7q\2\2\u00cb\u00cc\7k\2\2\u00cc\u00cd\7f\2\2\u00cd\62")
+        buf.write("\3\2\2\2\u00ce\u00cf\7(\2\2\u00cf\u00d0\7(\2\2\u00d0\64")
+        buf.write("\3\2\2\2\u00d1\u00d2\7~\2\2\u00d2\u00d3\7~\2\2\u00d3\66")
+        buf.write("\3\2\2\2\u00d4\u00d5\7v\2\2\u00d5\u00d6\7t\2\2\u00d6\u00d7")
+        buf.write("\7w\2\2\u00d7\u00d8\7g\2\2\u00d88\3\2\2\2\u00d9\u00da")
+        buf.write("\7h\2\2\u00da\u00db\7c\2\2\u00db\u00dc\7n\2\2\u00dc\u00dd")
+        buf.write("\7u\2\2\u00dd\u00de\7g\2\2\u00de:\3\2\2\2\u00df\u00e0")
+        buf.write("\7p\2\2\u00e0\u00e1\7g\2\2\u00e1\u00e2\7y\2\2\u00e2<\3")
+        buf.write("\2\2\2\u00e3\u00e4\7p\2\2\u00e4\u00e5\7w\2\2\u00e5\u00e6")
+        buf.write("\7n\2\2\u00e6\u00e7\7n\2\2\u00e7>\3\2\2\2\u00e8\u00e9")
+        buf.write("\7u\2\2\u00e9\u00ea\7g\2\2\u00ea\u00eb\7n\2\2\u00eb\u00ec")
+        buf.write("\7h\2\2\u00ec@\3\2\2\2\u00ed\u00ee\7/\2\2\u00eeB\3\2\2")
+        buf.write("\2\u00ef\u00f0\7#\2\2\u00f0D\3\2\2\2\u00f1\u00f2\7-\2")
+        buf.write("\2\u00f2F\3\2\2\2\u00f3\u00f4\7,\2\2\u00f4H\3\2\2\2\u00f5")
+        buf.write("\u00f6\7\61\2\2\u00f6J\3\2\2\2\u00f7\u00f8\7\'\2\2\u00f8")
+        buf.write("L\3\2\2\2\u00f9\u00fa\7>\2\2\u00faN\3\2\2\2\u00fb\u00fc")
+        buf.write("\7>\2\2\u00fc\u00fd\7?\2\2\u00fdP\3\2\2\2\u00fe\u00ff")
+        buf.write("\7@\2\2\u00ffR\3\2\2\2\u0100\u0101\7@\2\2\u0101\u0102")
+        buf.write("\7?\2\2\u0102T\3\2\2\2\u0103\u0104\7?\2\2\u0104\u0105")
+        buf.write("\7?\2\2\u0105V\3\2\2\2\u0106\u0107\7#\2\2\u0107\u0108")
+        buf.write("\7?\2\2\u0108X\3\2\2\2\u0109\u010d\7%\2\2\u010a\u010c")
+        buf.write("\n\2\2\2\u010b\u010a\3\2\2\2\u010c\u010f\3\2\2\2\u010d")
+        buf.write("\u010b\3\2\2\2\u010d\u010e\3\2\2\2\u010e\u011a\3\2\2\2")
+        buf.write("\u010f\u010d\3\2\2\2\u0110\u0111\7\61\2\2\u0111\u0112")
+        buf.write("\7\61\2\2\u0112\u0116\3\2\2\2\u0113\u0115\n\2\2\2\u0114")
+        buf.write("\u0113\3\2\2\2\u0115\u0118\3\2\2\2\u0116\u0114\3\2\2\2")
+        buf.write("\u0116\u0117\3\2\2\2\u0117\u011a\3\2\2\2\u0118\u0116\3")
+        buf.write("\2\2\2\u0119\u0109\3\2\2\2\u0119\u0110\3\2\2\2\u011a\u011b")
+        buf.write("\3\2\2\2\u011b\u011c\b-\2\2\u011cZ\3\2\2\2\u011d\u011e")
+        buf.write("\7\61\2\2\u011e\u011f\7,\2\2\u011f\u0123\3\2\2\2\u0120")
+        buf.write("\u0122\13\2\2\2\u0121\u0120\3\2\2\2\u0122\u0125\3\2\2")
+        buf.write("\2\u0123\u0124\3\2\2\2\u0123\u0121\3\2\2\2\u0124\u0126")
+        buf.write("\3\2\2\2\u0125\u0123\3\2\2\2\u0126\u0127\7,\2\2\u0127")
+        buf.write("\u0128\7\61\2\2\u0128\u0129\3\2\2\2\u0129\u012a\b.\2\2")
+        buf.write("\u012a\\\3\2\2\2\u012b\u012e\5_\60\2\u012c\u012e\5a\61")
+        buf.write("\2\u012d\u012b\3\2\2\2\u012d\u012c\3\2\2\2\u012e^\3\2")
+        buf.write("\2\2\u012f\u0130\t\3\2\2\u0130`\3\2\2\2\u0131\u0132\t")
+        buf.write("\4\2\2\u0132b\3\2\2\2\u0133\u0134\t\5\2\2\u0134d\3\2\2")
+        buf.write("\2\u0135\u0137\5c\62\2\u0136\u0135\3\2\2\2\u0137\u0138")
+        buf.write("\3\2\2\2\u0138\u0136\3\2\2\2\u0138\u0139\3\2\2\2\u0139")
+        buf.write("f\3\2\2\2\u013a\u013d\5]/\2\u013b\u013d\7a\2\2\u013c\u013a")
+        buf.write("\3\2\2\2\u013c\u013b\3\2\2\2\u013dh\3\2\2\2\u013e\u0143")
+        buf.write("\5g\64\2\u013f\u0142\5g\64\2\u0140\u0142\5c\62\2\u0141")
+        buf.write("\u013f\3\2\2\2\u0141\u0140\3\2\2\2\u0142\u0145\3\2\2\2")
+        buf.write("\u0143\u0141\3\2\2\2\u0143\u0144\3\2\2\2\u0144j\3\2\2")
+        buf.write("\2\u0145\u0143\3\2\2\2\u0146\u0148\t\6\2\2\u0147\u0146")
+        buf.write("\3\2\2\2\u0148\u0149\3\2\2\2\u0149\u0147\3\2\2\2\u0149")
+        buf.write("\u014a\3\2\2\2\u014a\u014b\3\2\2\2\u014b\u014c\b\66\3")
+        buf.write("\2\u014cl\3\2\2\2\u014d\u014f\7$\2\2\u014e\u0150\5o8\2")
+        buf.write("\u014f\u014e\3\2\2\2\u014f\u0150\3\2\2\2\u0150\u0151\3")
+        buf.write("\2\2\2\u0151\u0152\7$\2\2\u0152n\3\2\2\2\u0153\u0155\5")
+        buf.write("q9\2\u0154\u0153\3\2\2\2\u0155\u0156\3\2\2\2\u0156\u0154")
+        buf.write("\3\2\2\2\u0156\u0157\3\2\2\2\u0157p\3\2\2\2\u0158\u015c")
+        buf.write("\n\7\2\2\u0159\u015a\7^\2\2\u015a\u015c\t\b\2\2\u015b")
+        buf.write("\u0158\3\2\2\2\u015b\u0159\3\2\2\2\u015cr\3\2\2\2\20\2")
+        buf.write("\u010d\u0116\u0119\u0123\u012d\u0138\u013c\u0141\u0143")
+        buf.write("\u0149\u014f\u0156\u015b\4\2\3\2\b\2\2")
+        return buf.getvalue()
+
+
+class LatteLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    T__1 = 2
+    T__2 = 3
+    T__3 = 4
+    T__4 = 5
+    T__5 = 6
+    T__6 = 7
+    T__7 = 8
+    T__8 = 9
+    T__9 = 10
+    T__10 = 11
+    T__11 = 12
+    T__12 = 13
+    T__13 = 14
+    T__14 = 15
+    T__15 = 16
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    T__22 = 23
+    T__23 = 24
+    T__24 = 25
+    T__25 = 26
+    T__26 = 27
+    T__27 = 28
+    T__28 = 29
+    T__29 = 30
+    T__30 = 31
+    T__31 = 32
+    T__32 = 33
+    T__33 = 34
+    T__34 = 35
+    T__35 = 36
+    T__36 = 37
+    T__37 = 38
+    T__38 = 39
+    T__39 = 40
+    T__40 = 41
+    T__41 = 42
+    T__42 = 43
+    COMMENT = 44
+    MULTICOMMENT = 45
+    INT = 46
+    ID = 47
+    WS = 48
+    STR = 49
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'class'", "'{'", "'}'", "'extends'", "','", "';'", "'('", "')'", 
+            "'='", "'.'", "'['", "']'", "'++'", "'--'", "'return'", "'if'", 
+            "'else'", "'while'", "'for'", "':'", "'int'", "'string'", "'boolean'", 
+            "'void'", "'&&'", "'||'", "'true'", "'false'", "'new'", "'null'", 
+            "'self'", "'-'", "'!'", "'+'", "'*'", "'/'", "'%'", "'<'", "'<='", 
+            "'>'", "'>='", "'=='", "'!='" ]
+
+    symbolicNames = [ "<INVALID>",
+            "COMMENT", "MULTICOMMENT", "INT", "ID", "WS", "STR" ]
+
+    ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
+                  "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
+                  "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
+                  "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
+                  "T__38", "T__39", "T__40", "T__41", "T__42", "COMMENT", 
+                  "MULTICOMMENT", "Letter", "Capital", "Small", "Digit", 
+                  "INT", "ID_First", "ID", "WS", "STR", "StringCharacters", 
+                  "StringCharacter" ]
+
+    grammarFileName = "Latte.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.8")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
@@ -0,0 +1,2808 @@
+# Generated from Latte.g4 by ANTLR 4.8
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+
+def serializedATN():
+    with StringIO() as buf:
+        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\3\63")
+        buf.write("\u014f\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t\7")
+        buf.write("\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r\4\16")
+        buf.write("\t\16\4\17\t\17\3\2\6\2 \n\2\r\2\16\2!\3\3\3\3\3\3\3\3")
+        buf.write("\3\3\7\3)\n\3\f\3\16\3,\13\3\3\3\7\3/\n\3\f\3\16\3\62")
+        buf.write("\13\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\7\3;\n\3\f\3\16\3>\13")
+        buf.write("\3\3\3\7\3A\n\3\f\3\16\3D\13\3\3\3\5\3G\n\3\3\4\3\4\3")
+        buf.write("\4\3\4\7\4M\n\4\f\4\16\4P\13\4\3\4\3\4\3\5\3\5\3\5\3\5")
+        buf.write("\5\5X\n\5\3\5\3\5\3\5\3\6\3\6\3\6\3\6\3\6\3\6\7\6c\n\6")
+        buf.write("\f\6\16\6f\13\6\3\7\3\7\7\7j\n\7\f\7\16\7m\13\7\3\7\3")
+        buf.write("\7\3\b\3\b\3\b\3\b\3\b\3\b\7\bw\n\b\f\b\16\bz\13\b\3\b")
+        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
+        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b")
+        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
+        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b")
+        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
+        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00ca\n\b\3")
+        buf.write("\t\3\t\3\t\3\t\3\t\3\t\5\t\u00d2\n\t\3\t\3\t\3\t\7\t\u00d7")
+        buf.write("\n\t\f\t\16\t\u00da\13\t\3\n\3\n\3\n\3\n\5\n\u00e0\n\n")
+        buf.write("\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13")
+        buf.write("\3\13\3\13\3\13\3\13\7\13\u00f1\n\13\f\13\16\13\u00f4")
+        buf.write("\13\13\5\13\u00f6\n\13\3\13\3\13\3\13\3\13\3\13\3\13\3")
+        buf.write("\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13")
+        buf.write("\3\13\5\13\u010a\n\13\3\13\3\13\3\13\3\13\3\13\3\13\3")
+        buf.write("\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13")
+        buf.write("\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\7\13\u0125\n")
+        buf.write("\13\f\13\16\13\u0128\13\13\5\13\u012a\n\13\3\13\3\13\3")
+        buf.write("\13\3\13\3\13\3\13\3\13\3\13\3\13\7\13\u0135\n\13\f\13")
+        buf.write("\16\13\u0138\13\13\3\f\3\f\5\f\u013c\n\f\3\r\3\r\5\r\u0140")
+        buf.write("\n\r\3\16\3\16\3\16\5\16\u0145\n\16\3\17\3\17\3\17\3\17")
+        buf.write("\3\17\3\17\5\17\u014d\n\17\3\17\2\4\20\24\20\2\4\6\b\n")
+        buf.write("\f\16\20\22\24\26\30\32\34\2\2\2\u0182\2\37\3\2\2\2\4")
+        buf.write("F\3\2\2\2\6H\3\2\2\2\bS\3\2\2\2\n\\\3\2\2\2\fg\3\2\2\2")
+        buf.write("\16\u00c9\3\2\2\2\20\u00d1\3\2\2\2\22\u00df\3\2\2\2\24")
+        buf.write("\u0109\3\2\2\2\26\u013b\3\2\2\2\30\u013f\3\2\2\2\32\u0144")
+        buf.write("\3\2\2\2\34\u014c\3\2\2\2\36 \5\4\3\2\37\36\3\2\2\2 !")
+        buf.write("\3\2\2\2!\37\3\2\2\2!\"\3\2\2\2\"\3\3\2\2\2#G\5\b\5\2")
+        buf.write("$%\7\3\2\2%&\7\61\2\2&*\7\4\2\2\')\5\6\4\2(\'\3\2\2\2")
+        buf.write("),\3\2\2\2*(\3\2\2\2*+\3\2\2\2+\60\3\2\2\2,*\3\2\2\2-")
+        buf.write("/\5\b\5\2.-\3\2\2\2/\62\3\2\2\2\60.\3\2\2\2\60\61\3\2")
+        buf.write("\2\2\61\63\3\2\2\2\62\60\3\2\2\2\63G\7\5\2\2\64\65\7\3")
+        buf.write("\2\2\65\66\7\61\2\2\66\67\7\6\2\2\678\7\61\2\28<\7\4\2")
+        buf.write("\29;\5\6\4\2:9\3\2\2\2;>\3\2\2\2<:\3\2\2\2<=\3\2\2\2=")
+        buf.write("B\3\2\2\2><\3\2\2\2?A\5\b\5\2@?\3\2\2\2AD\3\2\2\2B@\3")
+        buf.write("\2\2\2BC\3\2\2\2CE\3\2\2\2DB\3\2\2\2EG\7\5\2\2F#\3\2\2")
+        buf.write("\2F$\3\2\2\2F\64\3\2\2\2G\5\3\2\2\2HI\5\20\t\2IN\7\61")
+        buf.write("\2\2JK\7\7\2\2KM\7\61\2\2LJ\3\2\2\2MP\3\2\2\2NL\3\2\2")
+        buf.write("\2NO\3\2\2\2OQ\3\2\2\2PN\3\2\2\2QR\7\b\2\2R\7\3\2\2\2")
+        buf.write("ST\5\20\t\2TU\7\61\2\2UW\7\t\2\2VX\5\n\6\2WV\3\2\2\2W")
+        buf.write("X\3\2\2\2XY\3\2\2\2YZ\7\n\2\2Z[\5\f\7\2[\t\3\2\2\2\\]")
+        buf.write("\5\20\t\2]d\7\61\2\2^_\7\7\2\2_`\5\20\t\2`a\7\61\2\2a")
+        buf.write("c\3\2\2\2b^\3\2\2\2cf\3\2\2\2db\3\2\2\2de\3\2\2\2e\13")
+        buf.write("\3\2\2\2fd\3\2\2\2gk\7\4\2\2hj\5\16\b\2ih\3\2\2\2jm\3")
+        buf.write("\2\2\2ki\3\2\2\2kl\3\2\2\2ln\3\2\2\2mk\3\2\2\2no\7\5\2")
+        buf.write("\2o\r\3\2\2\2p\u00ca\7\b\2\2q\u00ca\5\f\7\2rs\5\20\t\2")
+        buf.write("sx\5\22\n\2tu\7\7\2\2uw\5\22\n\2vt\3\2\2\2wz\3\2\2\2x")
+        buf.write("v\3\2\2\2xy\3\2\2\2y{\3\2\2\2zx\3\2\2\2{|\7\b\2\2|\u00ca")
+        buf.write("\3\2\2\2}~\7\61\2\2~\177\7\13\2\2\177\u0080\5\24\13\2")
+        buf.write("\u0080\u0081\7\b\2\2\u0081\u00ca\3\2\2\2\u0082\u0083\5")
+        buf.write("\24\13\2\u0083\u0084\7\f\2\2\u0084\u0085\7\61\2\2\u0085")
+        buf.write("\u0086\7\13\2\2\u0086\u0087\5\24\13\2\u0087\u0088\7\b")
+        buf.write("\2\2\u0088\u00ca\3\2\2\2\u0089\u008a\5\24\13\2\u008a\u008b")
+        buf.write("\7\r\2\2\u008b\u008c\5\24\13\2\u008c\u008d\7\16\2\2\u008d")
+        buf.write("\u008e\7\13\2\2\u008e\u008f\5\24\13\2\u008f\u0090\7\b")
+        buf.write("\2\2\u0090\u00ca\3\2\2\2\u0091\u0092\7\61\2\2\u0092\u0093")
+        buf.write("\7\17\2\2\u0093\u00ca\7\b\2\2\u0094\u0095\7\61\2\2\u0095")
+        buf.write("\u0096\7\20\2\2\u0096\u00ca\7\b\2\2\u0097\u0098\5\24\13")
+        buf.write("\2\u0098\u0099\7\f\2\2\u0099\u009a\7\61\2\2\u009a\u009b")
+        buf.write("\7\17\2\2\u009b\u009c\7\b\2\2\u009c\u00ca\3\2\2\2\u009d")
+        buf.write("\u009e\5\24\13\2\u009e\u009f\7\f\2\2\u009f\u00a0\7\61")
+        buf.write("\2\2\u00a0\u00a1\7\20\2\2\u00a1\u00a2\7\b\2\2\u00a2\u00ca")
+        buf.write("\3\2\2\2\u00a3\u00a4\7\21\2\2\u00a4\u00a5\5\24\13\2\u00a5")
+        buf.write("\u00a6\7\b\2\2\u00a6\u00ca\3\2\2\2\u00a7\u00a8\7\21\2")
+        buf.write("\2\u00a8\u00ca\7\b\2\2\u00a9\u00aa\7\22\2\2\u00aa\u00ab")
+        buf.write("\7\t\2\2\u00ab\u00ac\5\24\13\2\u00ac\u00ad\7\n\2\2\u00ad")
+        buf.write("\u00ae\5\16\b\2\u00ae\u00ca\3\2\2\2\u00af\u00b0\7\22\2")
+        buf.write("\2\u00b0\u00b1\7\t\2\2\u00b1\u00b2\5\24\13\2\u00b2\u00b3")
+        buf.write("\7\n\2\2\u00b3\u00b4\5\16\b\2\u00b4\u00b5\7\23\2\2\u00b5")
+        buf.write("\u00b6\5\16\b\2\u00b6\u00ca\3\2\2\2\u00b7\u00b8\7\24\2")
+        buf.write("\2\u00b8\u00b9\7\t\2\2\u00b9\u00ba\5\24\13\2\u00ba\u00bb")
+        buf.write("\7\n\2\2\u00bb\u00bc\5\16\b\2\u00bc\u00ca\3\2\2\2\u00bd")
+        buf.write("\u00be\7\25\2\2\u00be\u00bf\7\t\2\2\u00bf\u00c0\5\20\t")
+        buf.write("\2\u00c0\u00c1\7\61\2\2\u00c1\u00c2\7\26\2\2\u00c2\u00c3")
+        buf.write("\5\24\13\2\u00c3\u00c4\7\n\2\2\u00c4\u00c5\5\16\b\2\u00c5")
+        buf.write("\u00ca\3\2\2\2\u00c6\u00c7\5\24\13\2\u00c7\u00c8\7\b\2")
+        buf.write("\2\u00c8\u00ca\3\2\2\2\u00c9p\3\2\2\2\u00c9q\3\2\2\2\u00c9")
+        buf.write("r\3\2\2\2\u00c9}\3\2\2\2\u00c9\u0082\3\2\2\2\u00c9\u0089")
+        buf.write("\3\2\2\2\u00c9\u0091\3\2\2\2\u00c9\u0094\3\2\2\2\u00c9")
+        buf.write("\u0097\3\2\2\2\u00c9\u009d\3\2\2\2\u00c9\u00a3\3\2\2\2")
+        buf.write("\u00c9\u00a7\3\2\2\2\u00c9\u00a9\3\2\2\2\u00c9\u00af\3")
+        buf.write("\2\2\2\u00c9\u00b7\3\2\2\2\u00c9\u00bd\3\2\2\2\u00c9\u00c6")
+        buf.write("\3\2\2\2\u00ca\17\3\2\2\2\u00cb\u00cc\b\t\1\2\u00cc\u00d2")
+        buf.write("\7\27\2\2\u00cd\u00d2\7\30\2\2\u00ce\u00d2\7\31\2\2\u00cf")
+        buf.write("\u00d2\7\32\2\2\u00d0\u00d2\7\61\2\2\u00d1\u00cb\3\2\2")
+        buf.write("\2\u00d1\u00cd\3\2\2\2\u00d1\u00ce\3\2\2\2\u00d1\u00cf")
+        buf.write("\3\2\2\2\u00d1\u00d0\3\2\2\2\u00d2\u00d8\3\2\2\2\u00d3")
+        buf.write("\u00d4\f\3\2\2\u00d4\u00d5\7\r\2\2\u00d5\u00d7\7\16\2")
+        buf.write("\2\u00d6\u00d3\3\2\2\2\u00d7\u00da\3\2\2\2\u00d8\u00d6")
+        buf.write("\3\2\2\2\u00d8\u00d9\3\2\2\2\u00d9\21\3\2\2\2\u00da\u00d8")
+        buf.write("\3\2\2\2\u00db\u00e0\7\61\2\2\u00dc\u00dd\7\61\2\2\u00dd")
+        buf.write("\u00de\7\13\2\2\u00de\u00e0\5\24\13\2\u00df\u00db\3\2")
+        buf.write("\2\2\u00df\u00dc\3\2\2\2\u00e0\23\3\2\2\2\u00e1\u00e2")
+        buf.write("\b\13\1\2\u00e2\u00e3\5\26\f\2\u00e3\u00e4\5\24\13\24")
+        buf.write("\u00e4\u010a\3\2\2\2\u00e5\u010a\7\61\2\2\u00e6\u010a")
+        buf.write("\7\60\2\2\u00e7\u010a\7\35\2\2\u00e8\u010a\7\36\2\2\u00e9")
+        buf.write("\u00ea\7\37\2\2\u00ea\u010a\5\20\t\2\u00eb\u00ec\7\61")
+        buf.write("\2\2\u00ec\u00f5\7\t\2\2\u00ed\u00f2\5\24\13\2\u00ee\u00ef")
+        buf.write("\7\7\2\2\u00ef\u00f1\5\24\13\2\u00f0\u00ee\3\2\2\2\u00f1")
+        buf.write("\u00f4\3\2\2\2\u00f2\u00f0\3\2\2\2\u00f2\u00f3\3\2\2\2")
+        buf.write("\u00f3\u00f6\3\2\2\2\u00f4\u00f2\3\2\2\2\u00f5\u00ed\3")
+        buf.write("\2\2\2\u00f5\u00f6\3\2\2\2\u00f6\u00f7\3\2\2\2\u00f7\u010a")
+        buf.write("\7\n\2\2\u00f8\u010a\7\63\2\2\u00f9\u00fa\7\t\2\2\u00fa")
+        buf.write("\u00fb\5\20\t\2\u00fb\u00fc\7\n\2\2\u00fc\u00fd\7 \2\2")
+        buf.write("\u00fd\u010a\3\2\2\2\u00fe\u00ff\7\t\2\2\u00ff\u0100\5")
+        buf.write("\24\13\2\u0100\u0101\7\n\2\2\u0101\u010a\3\2\2\2\u0102")
+        buf.write("\u0103\7\37\2\2\u0103\u0104\5\20\t\2\u0104\u0105\7\r\2")
+        buf.write("\2\u0105\u0106\5\24\13\2\u0106\u0107\7\16\2\2\u0107\u010a")
+        buf.write("\3\2\2\2\u0108\u010a\7!\2\2\u0109\u00e1\3\2\2\2\u0109")
+        buf.write("\u00e5\3\2\2\2\u0109\u00e6\3\2\2\2\u0109\u00e7\3\2\2\2")
+        buf.write("\u0109\u00e8\3\2\2\2\u0109\u00e9\3\2\2\2\u0109\u00eb\3")
+        buf.write("\2\2\2\u0109\u00f8\3\2\2\2\u0109\u00f9\3\2\2\2\u0109\u00fe")
+        buf.write("\3\2\2\2\u0109\u0102\3\2\2\2\u0109\u0108\3\2\2\2\u010a")
+        buf.write("\u0136\3\2\2\2\u010b\u010c\f\23\2\2\u010c\u010d\5\32\16")
+        buf.write("\2\u010d\u010e\5\24\13\24\u010e\u0135\3\2\2\2\u010f\u0110")
+        buf.write("\f\22\2\2\u0110\u0111\5\30\r\2\u0111\u0112\5\24\13\23")
+        buf.write("\u0112\u0135\3\2\2\2\u0113\u0114\f\21\2\2\u0114\u0115")
+        buf.write("\5\34\17\2\u0115\u0116\5\24\13\22\u0116\u0135\3\2\2\2")
+        buf.write("\u0117\u0118\f\20\2\2\u0118\u0119\7\33\2\2\u0119\u0135")
+        buf.write("\5\24\13\20\u011a\u011b\f\17\2\2\u011b\u011c\7\34\2\2")
+        buf.write("\u011c\u0135\5\24\13\17\u011d\u011e\f\26\2\2\u011e\u011f")
+        buf.write("\7\f\2\2\u011f\u0120\7\61\2\2\u0120\u0129\7\t\2\2\u0121")
+        buf.write("\u0126\5\24\13\2\u0122\u0123\7\7\2\2\u0123\u0125\5\24")
+        buf.write("\13\2\u0124\u0122\3\2\2\2\u0125\u0128\3\2\2\2\u0126\u0124")
+        buf.write("\3\2\2\2\u0126\u0127\3\2\2\2\u0127\u012a\3\2\2\2\u0128")
+        buf.write("\u0126\3\2\2\2\u0129\u0121\3\2\2\2\u0129\u012a\3\2\2\2")
+        buf.write("\u012a\u012b\3\2\2\2\u012b\u0135\7\n\2\2\u012c\u012d\f")
+        buf.write("\25\2\2\u012d\u012e\7\f\2\2\u012e\u0135\7\61\2\2\u012f")
+        buf.write("\u0130\f\5\2\2\u0130\u0131\7\r\2\2\u0131\u0132\5\24\13")
+        buf.write("\2\u0132\u0133\7\16\2\2\u0133\u0135\3\2\2\2\u0134\u010b")
+        buf.write("\3\2\2\2\u0134\u010f\3\2\2\2\u0134\u0113\3\2\2\2\u0134")
+        buf.write("\u0117\3\2\2\2\u0134\u011a\3\2\2\2\u0134\u011d\3\2\2\2")
+        buf.write("\u0134\u012c\3\2\2\2\u0134\u012f\3\2\2\2\u0135\u0138\3")
+        buf.write("\2\2\2\u0136\u0134\3\2\2\2\u0136\u0137\3\2\2\2\u0137\25")
+        buf.write("\3\2\2\2\u0138\u0136\3\2\2\2\u0139\u013c\7\"\2\2\u013a")
+        buf.write("\u013c\7#\2\2\u013b\u0139\3\2\2\2\u013b\u013a\3\2\2\2")
+        buf.write("\u013c\27\3\2\2\2\u013d\u0140\7$\2\2\u013e\u0140\7\"\2")
+        buf.write("\2\u013f\u013d\3\2\2\2\u013f\u013e\3\2\2\2\u0140\31\3")
+        buf.write("\2\2\2\u0141\u0145\7%\2\2\u0142\u0145\7&\2\2\u0143\u0145")
+        buf.write("\7\'\2\2\u0144\u0141\3\2\2\2\u0144\u0142\3\2\2\2\u0144")
+        buf.write("\u0143\3\2\2\2\u0145\33\3\2\2\2\u0146\u014d\7(\2\2\u0147")
+        buf.write("\u014d\7)\2\2\u0148\u014d\7*\2\2\u0149\u014d\7+\2\2\u014a")
+        buf.write("\u014d\7,\2\2\u014b\u014d\7-\2\2\u014c\u0146\3\2\2\2\u014c")
+        buf.write("\u0147\3\2\2\2\u014c\u0148\3\2\2\2\u014c\u0149\3\2\2\2")
+        buf.write("\u014c\u014a\3\2\2\2\u014c\u014b\3\2\2\2\u014d\35\3\2")
+        buf.write("\2\2\34!*\60<BFNWdkx\u00c9\u00d1\u00d8\u00df\u00f2\u00f5")
+        buf.write("\u0109\u0126\u0129\u0134\u0136\u013b\u013f\u0144\u014c")
+        return buf.getvalue()
+
+
+class LatteParser ( Parser ):
+
+    grammarFileName = "Latte.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'class'", "'{'", "'}'", "'extends'", 
+                     "','", "';'", "'('", "')'", "'='", "'.'", "'['", "']'", 
+                     "'++'", "'--'", "'return'", "'if'", "'else'", "'while'", 
+                     "'for'", "':'", "'int'", "'string'", "'boolean'", "'void'", 
+                     "'&&'", "'||'", "'true'", "'false'", "'new'", "'null'", 
+                     "'self'", "'-'", "'!'", "'+'", "'*'", "'/'", "'%'", 
+                     "'<'", "'<='", "'>'", "'>='", "'=='", "'!='" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "COMMENT", "MULTICOMMENT", "INT", "ID", "WS", "STR" ]
+
+    RULE_program = 0
+    RULE_topDef = 1
+    RULE_fieldDef = 2
+    RULE_funDef = 3
+    RULE_arg = 4
+    RULE_block = 5
+    RULE_stmt = 6
+    RULE_type_ = 7
+    RULE_item = 8
+    RULE_expr = 9
+    RULE_unOp = 10
+    RULE_addOp = 11
+    RULE_mulOp = 12
+    RULE_relOp = 13
+
+    ruleNames =  [ "program", "topDef", "fieldDef", "funDef", "arg", "block", 
+                   "stmt", "type_", "item", "expr", "unOp", "addOp", "mulOp", 
+                   "relOp" ]
+
+    EOF = Token.EOF
+    T__0=1
+    T__1=2
+    T__2=3
+    T__3=4
+    T__4=5
+    T__5=6
+    T__6=7
+    T__7=8
+    T__8=9
+    T__9=10
+    T__10=11
+    T__11=12
+    T__12=13
+    T__13=14
+    T__14=15
+    T__15=16
+    T__16=17
+    T__17=18
+    T__18=19
+    T__19=20
+    T__20=21
+    T__21=22
+    T__22=23
+    T__23=24
+    T__24=25
+    T__25=26
+    T__26=27
+    T__27=28
+    T__28=29
+    T__29=30
+    T__30=31
+    T__31=32
+    T__32=33
+    T__33=34
+    T__34=35
+    T__35=36
+    T__36=37
+    T__37=38
+    T__38=39
+    T__39=40
+    T__40=41
+    T__41=42
+    T__42=43
+    COMMENT=44
+    MULTICOMMENT=45
+    INT=46
+    ID=47
+    WS=48
+    STR=49
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.8")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def topDef(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.TopDefContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.TopDefContext,i)
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = LatteParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 29 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 28
+                self.topDef()
+                self.state = 31 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__0) | (1 << LatteParser.T__20) | (1 << LatteParser.T__21) | (1 << LatteParser.T__22) | (1 << LatteParser.T__23) | (1 << LatteParser.ID))) != 0)):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TopDefContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_topDef
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class TopFunDefContext(TopDefContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.TopDefContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def funDef(self):
+            return self.getTypedRuleContext(LatteParser.FunDefContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTopFunDef" ):
+                return visitor.visitTopFunDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ExtClassDefContext(TopDefContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.TopDefContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(LatteParser.ID)
+            else:
+                return self.getToken(LatteParser.ID, i)
+        def fieldDef(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.FieldDefContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.FieldDefContext,i)
+
+        def funDef(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.FunDefContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.FunDefContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExtClassDef" ):
+                return visitor.visitExtClassDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BaseClassDefContext(TopDefContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.TopDefContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+        def fieldDef(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.FieldDefContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.FieldDefContext,i)
+
+        def funDef(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.FunDefContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.FunDefContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBaseClassDef" ):
+                return visitor.visitBaseClassDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def topDef(self):
+
+        localctx = LatteParser.TopDefContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_topDef)
+        self._la = 0 # Token type
+        try:
+            self.state = 68
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                localctx = LatteParser.TopFunDefContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 33
+                self.funDef()
+                pass
+
+            elif la_ == 2:
+                localctx = LatteParser.BaseClassDefContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 34
+                self.match(LatteParser.T__0)
+                self.state = 35
+                self.match(LatteParser.ID)
+                self.state = 36
+                self.match(LatteParser.T__1)
+                self.state = 40
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt==1:
+                        self.state = 37
+                        self.fieldDef() 
+                    self.state = 42
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,1,self._ctx)
+
+                self.state = 46
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__20) | (1 << LatteParser.T__21) | (1 << LatteParser.T__22) | (1 << LatteParser.T__23) | (1 << LatteParser.ID))) != 0):
+                    self.state = 43
+                    self.funDef()
+                    self.state = 48
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 49
+                self.match(LatteParser.T__2)
+                pass
+
+            elif la_ == 3:
+                localctx = LatteParser.ExtClassDefContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 50
+                self.match(LatteParser.T__0)
+                self.state = 51
+                self.match(LatteParser.ID)
+                self.state = 52
+                self.match(LatteParser.T__3)
+                self.state = 53
+                self.match(LatteParser.ID)
+                self.state = 54
+                self.match(LatteParser.T__1)
+                self.state = 58
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,3,self._ctx)
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt==1:
+                        self.state = 55
+                        self.fieldDef() 
+                    self.state = 60
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,3,self._ctx)
+
+                self.state = 64
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__20) | (1 << LatteParser.T__21) | (1 << LatteParser.T__22) | (1 << LatteParser.T__23) | (1 << LatteParser.ID))) != 0):
+                    self.state = 61
+                    self.funDef()
+                    self.state = 66
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 67
+                self.match(LatteParser.T__2)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FieldDefContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(LatteParser.ID)
+            else:
+                return self.getToken(LatteParser.ID, i)
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_fieldDef
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFieldDef" ):
+                return visitor.visitFieldDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fieldDef(self):
+
+        localctx = LatteParser.FieldDefContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_fieldDef)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 70
+            self.type_(0)
+            self.state = 71
+            self.match(LatteParser.ID)
+            self.state = 76
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==LatteParser.T__4:
+                self.state = 72
+                self.match(LatteParser.T__4)
+                self.state = 73
+                self.match(LatteParser.ID)
+                self.state = 78
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 79
+            self.match(LatteParser.T__5)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FunDefContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(LatteParser.BlockContext,0)
+
+
+        def arg(self):
+            return self.getTypedRuleContext(LatteParser.ArgContext,0)
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_funDef
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunDef" ):
+                return visitor.visitFunDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def funDef(self):
+
+        localctx = LatteParser.FunDefContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_funDef)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 81
+            self.type_(0)
+            self.state = 82
+            self.match(LatteParser.ID)
+            self.state = 83
+            self.match(LatteParser.T__6)
+            self.state = 85
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__20) | (1 << LatteParser.T__21) | (1 << LatteParser.T__22) | (1 << LatteParser.T__23) | (1 << LatteParser.ID))) != 0):
+                self.state = 84
+                self.arg()
+
+
+            self.state = 87
+            self.match(LatteParser.T__7)
+            self.state = 88
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.Type_Context)
+            else:
+                return self.getTypedRuleContext(LatteParser.Type_Context,i)
+
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(LatteParser.ID)
+            else:
+                return self.getToken(LatteParser.ID, i)
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_arg
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArg" ):
+                return visitor.visitArg(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arg(self):
+
+        localctx = LatteParser.ArgContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_arg)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 90
+            self.type_(0)
+            self.state = 91
+            self.match(LatteParser.ID)
+            self.state = 98
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==LatteParser.T__4:
+                self.state = 92
+                self.match(LatteParser.T__4)
+                self.state = 93
+                self.type_(0)
+                self.state = 94
+                self.match(LatteParser.ID)
+                self.state = 100
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = LatteParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 101
+            self.match(LatteParser.T__1)
+            self.state = 105
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__1) | (1 << LatteParser.T__5) | (1 << LatteParser.T__6) | (1 << LatteParser.T__14) | (1 << LatteParser.T__15) | (1 << LatteParser.T__17) | (1 << LatteParser.T__18) | (1 << LatteParser.T__20) | (1 << LatteParser.T__21) | (1 << LatteParser.T__22) | (1 << LatteParser.T__23) | (1 << LatteParser.T__26) | (1 << LatteParser.T__27) | (1 << LatteParser.T__28) | (1 << LatteParser.T__30) | (1 << LatteParser.T__31) | (1 << LatteParser.T__32) | (1 << LatteParser.INT) | (1 << LatteParser.ID) | (1 << LatteParser.STR))) != 0):
+                self.state = 102
+                self.stmt()
+                self.state = 107
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 108
+            self.match(LatteParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_stmt
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class AssContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAss" ):
+                return visitor.visitAss(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RetContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRet" ):
+                return visitor.visitRet(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ArrayAssContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArrayAss" ):
+                return visitor.visitArrayAss(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class CondContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(LatteParser.StmtContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCond" ):
+                return visitor.visitCond(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class CondElseContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.StmtContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCondElse" ):
+                return visitor.visitCondElse(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class VRetContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVRet" ):
+                return visitor.visitVRet(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BlockStmtContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def block(self):
+            return self.getTypedRuleContext(LatteParser.BlockContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockStmt" ):
+                return visitor.visitBlockStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DeclContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+        def item(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ItemContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ItemContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecl" ):
+                return visitor.visitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class WhileContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(LatteParser.StmtContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhile" ):
+                return visitor.visitWhile(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class SExpContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSExp" ):
+                return visitor.visitSExp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AttrAssContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttrAss" ):
+                return visitor.visitAttrAss(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ForEachContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(LatteParser.StmtContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForEach" ):
+                return visitor.visitForEach(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DecrContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecr" ):
+                return visitor.visitDecr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EmptyContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEmpty" ):
+                return visitor.visitEmpty(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IncrContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIncr" ):
+                return visitor.visitIncr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AttrDecrContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttrDecr" ):
+                return visitor.visitAttrDecr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AttrIncrContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttrIncr" ):
+                return visitor.visitAttrIncr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def stmt(self):
+
+        localctx = LatteParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_stmt)
+        self._la = 0 # Token type
+        try:
+            self.state = 199
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
+            if la_ == 1:
+                localctx = LatteParser.EmptyContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 110
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 2:
+                localctx = LatteParser.BlockStmtContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 111
+                self.block()
+                pass
+
+            elif la_ == 3:
+                localctx = LatteParser.DeclContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 112
+                self.type_(0)
+                self.state = 113
+                self.item()
+                self.state = 118
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==LatteParser.T__4:
+                    self.state = 114
+                    self.match(LatteParser.T__4)
+                    self.state = 115
+                    self.item()
+                    self.state = 120
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 121
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 4:
+                localctx = LatteParser.AssContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 123
+                self.match(LatteParser.ID)
+                self.state = 124
+                self.match(LatteParser.T__8)
+                self.state = 125
+                self.expr(0)
+                self.state = 126
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 5:
+                localctx = LatteParser.AttrAssContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 128
+                self.expr(0)
+                self.state = 129
+                self.match(LatteParser.T__9)
+                self.state = 130
+                self.match(LatteParser.ID)
+                self.state = 131
+                self.match(LatteParser.T__8)
+                self.state = 132
+                self.expr(0)
+                self.state = 133
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 6:
+                localctx = LatteParser.ArrayAssContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 135
+                self.expr(0)
+                self.state = 136
+                self.match(LatteParser.T__10)
+                self.state = 137
+                self.expr(0)
+                self.state = 138
+                self.match(LatteParser.T__11)
+                self.state = 139
+                self.match(LatteParser.T__8)
+                self.state = 140
+                self.expr(0)
+                self.state = 141
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 7:
+                localctx = LatteParser.IncrContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
+                self.state = 143
+                self.match(LatteParser.ID)
+                self.state = 144
+                self.match(LatteParser.T__12)
+                self.state = 145
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 8:
+                localctx = LatteParser.DecrContext(self, localctx)
+                self.enterOuterAlt(localctx, 8)
+                self.state = 146
+                self.match(LatteParser.ID)
+                self.state = 147
+                self.match(LatteParser.T__13)
+                self.state = 148
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 9:
+                localctx = LatteParser.AttrIncrContext(self, localctx)
+                self.enterOuterAlt(localctx, 9)
+                self.state = 149
+                self.expr(0)
+                self.state = 150
+                self.match(LatteParser.T__9)
+                self.state = 151
+                self.match(LatteParser.ID)
+                self.state = 152
+                self.match(LatteParser.T__12)
+                self.state = 153
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 10:
+                localctx = LatteParser.AttrDecrContext(self, localctx)
+                self.enterOuterAlt(localctx, 10)
+                self.state = 155
+                self.expr(0)
+                self.state = 156
+                self.match(LatteParser.T__9)
+                self.state = 157
+                self.match(LatteParser.ID)
+                self.state = 158
+                self.match(LatteParser.T__13)
+                self.state = 159
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 11:
+                localctx = LatteParser.RetContext(self, localctx)
+                self.enterOuterAlt(localctx, 11)
+                self.state = 161
+                self.match(LatteParser.T__14)
+                self.state = 162
+                self.expr(0)
+                self.state = 163
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 12:
+                localctx = LatteParser.VRetContext(self, localctx)
+                self.enterOuterAlt(localctx, 12)
+                self.state = 165
+                self.match(LatteParser.T__14)
+                self.state = 166
+                self.match(LatteParser.T__5)
+                pass
+
+            elif la_ == 13:
+                localctx = LatteParser.CondContext(self, localctx)
+                self.enterOuterAlt(localctx, 13)
+                self.state = 167
+                self.match(LatteParser.T__15)
+                self.state = 168
+                self.match(LatteParser.T__6)
+                self.state = 169
+                self.expr(0)
+                self.state = 170
+                self.match(LatteParser.T__7)
+                self.state = 171
+                self.stmt()
+                pass
+
+            elif la_ == 14:
+                localctx = LatteParser.CondElseContext(self, localctx)
+                self.enterOuterAlt(localctx, 14)
+                self.state = 173
+                self.match(LatteParser.T__15)
+                self.state = 174
+                self.match(LatteParser.T__6)
+                self.state = 175
+                self.expr(0)
+                self.state = 176
+                self.match(LatteParser.T__7)
+                self.state = 177
+                self.stmt()
+                self.state = 178
+                self.match(LatteParser.T__16)
+                self.state = 179
+                self.stmt()
+                pass
+
+            elif la_ == 15:
+                localctx = LatteParser.WhileContext(self, localctx)
+                self.enterOuterAlt(localctx, 15)
+                self.state = 181
+                self.match(LatteParser.T__17)
+                self.state = 182
+                self.match(LatteParser.T__6)
+                self.state = 183
+                self.expr(0)
+                self.state = 184
+                self.match(LatteParser.T__7)
+                self.state = 185
+                self.stmt()
+                pass
+
+            elif la_ == 16:
+                localctx = LatteParser.ForEachContext(self, localctx)
+                self.enterOuterAlt(localctx, 16)
+                self.state = 187
+                self.match(LatteParser.T__18)
+                self.state = 188
+                self.match(LatteParser.T__6)
+                self.state = 189
+                self.type_(0)
+                self.state = 190
+                self.match(LatteParser.ID)
+                self.state = 191
+                self.match(LatteParser.T__19)
+                self.state = 192
+                self.expr(0)
+                self.state = 193
+                self.match(LatteParser.T__7)
+                self.state = 194
+                self.stmt()
+                pass
+
+            elif la_ == 17:
+                localctx = LatteParser.SExpContext(self, localctx)
+                self.enterOuterAlt(localctx, 17)
+                self.state = 196
+                self.expr(0)
+                self.state = 197
+                self.match(LatteParser.T__5)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Type_Context(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_type_
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class StrContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStr" ):
+                return visitor.visitStr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ArrayContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArray" ):
+                return visitor.visitArray(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BoolContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBool" ):
+                return visitor.visitBool(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ClassContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass" ):
+                return visitor.visitClass(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class VoidContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVoid" ):
+                return visitor.visitVoid(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IntContext(Type_Context):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.Type_Context
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInt" ):
+                return visitor.visitInt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def type_(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = LatteParser.Type_Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 14
+        self.enterRecursionRule(localctx, 14, self.RULE_type_, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 207
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [LatteParser.T__20]:
+                localctx = LatteParser.IntContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 202
+                self.match(LatteParser.T__20)
+                pass
+            elif token in [LatteParser.T__21]:
+                localctx = LatteParser.StrContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 203
+                self.match(LatteParser.T__21)
+                pass
+            elif token in [LatteParser.T__22]:
+                localctx = LatteParser.BoolContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 204
+                self.match(LatteParser.T__22)
+                pass
+            elif token in [LatteParser.T__23]:
+                localctx = LatteParser.VoidContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 205
+                self.match(LatteParser.T__23)
+                pass
+            elif token in [LatteParser.ID]:
+                localctx = LatteParser.ClassContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 206
+                self.match(LatteParser.ID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 214
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,13,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = LatteParser.ArrayContext(self, LatteParser.Type_Context(self, _parentctx, _parentState))
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_type_)
+                    self.state = 209
+                    if not self.precpred(self._ctx, 1):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                    self.state = 210
+                    self.match(LatteParser.T__10)
+                    self.state = 211
+                    self.match(LatteParser.T__11) 
+                self.state = 216
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,13,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class ItemContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_item
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class DefContext(ItemContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ItemContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDef" ):
+                return visitor.visitDef(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class DefAssContext(ItemContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ItemContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefAss" ):
+                return visitor.visitDefAss(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def item(self):
+
+        localctx = LatteParser.ItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_item)
+        try:
+            self.state = 221
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                localctx = LatteParser.DefContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 217
+                self.match(LatteParser.ID)
+                pass
+
+            elif la_ == 2:
+                localctx = LatteParser.DefAssContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 218
+                self.match(LatteParser.ID)
+                self.state = 219
+                self.match(LatteParser.T__8)
+                self.state = 220
+                self.expr(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class EIdContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEId" ):
+                return visitor.visitEId(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EFunCallContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEFunCall" ):
+                return visitor.visitEFunCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ESelfContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitESelf" ):
+                return visitor.visitESelf(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ERelOpContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+        def relOp(self):
+            return self.getTypedRuleContext(LatteParser.RelOpContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitERelOp" ):
+                return visitor.visitERelOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ETrueContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitETrue" ):
+                return visitor.visitETrue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ENewArrContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitENewArr" ):
+                return visitor.visitENewArr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ECastNullContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitECastNull" ):
+                return visitor.visitECastNull(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EOrContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEOr" ):
+                return visitor.visitEOr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EIntContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def INT(self):
+            return self.getToken(LatteParser.INT, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEInt" ):
+                return visitor.visitEInt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EUnOpContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def unOp(self):
+            return self.getTypedRuleContext(LatteParser.UnOpContext,0)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEUnOp" ):
+                return visitor.visitEUnOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EStrContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def STR(self):
+            return self.getToken(LatteParser.STR, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEStr" ):
+                return visitor.visitEStr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EArrAccContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEArrAcc" ):
+                return visitor.visitEArrAcc(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ENewObjContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def type_(self):
+            return self.getTypedRuleContext(LatteParser.Type_Context,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitENewObj" ):
+                return visitor.visitENewObj(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EMulOpContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+        def mulOp(self):
+            return self.getTypedRuleContext(LatteParser.MulOpContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEMulOp" ):
+                return visitor.visitEMulOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EAndContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEAnd" ):
+                return visitor.visitEAnd(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EParenContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEParen" ):
+                return visitor.visitEParen(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EFalseContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEFalse" ):
+                return visitor.visitEFalse(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EAddOpContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+        def addOp(self):
+            return self.getTypedRuleContext(LatteParser.AddOpContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEAddOp" ):
+                return visitor.visitEAddOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EAttrContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(LatteParser.ExprContext,0)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEAttr" ):
+                return visitor.visitEAttr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EMthdCallContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LatteParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LatteParser.ExprContext,i)
+
+        def ID(self):
+            return self.getToken(LatteParser.ID, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEMthdCall" ):
+                return visitor.visitEMthdCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = LatteParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 18
+        self.enterRecursionRule(localctx, 18, self.RULE_expr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 263
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+            if la_ == 1:
+                localctx = LatteParser.EUnOpContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 224
+                self.unOp()
+                self.state = 225
+                self.expr(18)
+                pass
+
+            elif la_ == 2:
+                localctx = LatteParser.EIdContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 227
+                self.match(LatteParser.ID)
+                pass
+
+            elif la_ == 3:
+                localctx = LatteParser.EIntContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 228
+                self.match(LatteParser.INT)
+                pass
+
+            elif la_ == 4:
+                localctx = LatteParser.ETrueContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 229
+                self.match(LatteParser.T__26)
+                pass
+
+            elif la_ == 5:
+                localctx = LatteParser.EFalseContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 230
+                self.match(LatteParser.T__27)
+                pass
+
+            elif la_ == 6:
+                localctx = LatteParser.ENewObjContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 231
+                self.match(LatteParser.T__28)
+                self.state = 232
+                self.type_(0)
+                pass
+
+            elif la_ == 7:
+                localctx = LatteParser.EFunCallContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 233
+                self.match(LatteParser.ID)
+                self.state = 234
+                self.match(LatteParser.T__6)
+                self.state = 243
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__6) | (1 << LatteParser.T__26) | (1 << LatteParser.T__27) | (1 << LatteParser.T__28) | (1 << LatteParser.T__30) | (1 << LatteParser.T__31) | (1 << LatteParser.T__32) | (1 << LatteParser.INT) | (1 << LatteParser.ID) | (1 << LatteParser.STR))) != 0):
+                    self.state = 235
+                    self.expr(0)
+                    self.state = 240
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==LatteParser.T__4:
+                        self.state = 236
+                        self.match(LatteParser.T__4)
+                        self.state = 237
+                        self.expr(0)
+                        self.state = 242
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+
+
+                self.state = 245
+                self.match(LatteParser.T__7)
+                pass
+
+            elif la_ == 8:
+                localctx = LatteParser.EStrContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 246
+                self.match(LatteParser.STR)
+                pass
+
+            elif la_ == 9:
+                localctx = LatteParser.ECastNullContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 247
+                self.match(LatteParser.T__6)
+                self.state = 248
+                self.type_(0)
+                self.state = 249
+                self.match(LatteParser.T__7)
+                self.state = 250
+                self.match(LatteParser.T__29)
+                pass
+
+            elif la_ == 10:
+                localctx = LatteParser.EParenContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 252
+                self.match(LatteParser.T__6)
+                self.state = 253
+                self.expr(0)
+                self.state = 254
+                self.match(LatteParser.T__7)
+                pass
+
+            elif la_ == 11:
+                localctx = LatteParser.ENewArrContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 256
+                self.match(LatteParser.T__28)
+                self.state = 257
+                self.type_(0)
+                self.state = 258
+                self.match(LatteParser.T__10)
+                self.state = 259
+                self.expr(0)
+                self.state = 260
+                self.match(LatteParser.T__11)
+                pass
+
+            elif la_ == 12:
+                localctx = LatteParser.ESelfContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 262
+                self.match(LatteParser.T__30)
+                pass
+
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 308
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 306
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+                    if la_ == 1:
+                        localctx = LatteParser.EMulOpContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 265
+                        if not self.precpred(self._ctx, 17):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 17)")
+                        self.state = 266
+                        self.mulOp()
+                        self.state = 267
+                        self.expr(18)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = LatteParser.EAddOpContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 269
+                        if not self.precpred(self._ctx, 16):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 16)")
+                        self.state = 270
+                        self.addOp()
+                        self.state = 271
+                        self.expr(17)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = LatteParser.ERelOpContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 273
+                        if not self.precpred(self._ctx, 15):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 15)")
+                        self.state = 274
+                        self.relOp()
+                        self.state = 275
+                        self.expr(16)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = LatteParser.EAndContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 277
+                        if not self.precpred(self._ctx, 14):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 14)")
+                        self.state = 278
+                        self.match(LatteParser.T__24)
+                        self.state = 279
+                        self.expr(14)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = LatteParser.EOrContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 280
+                        if not self.precpred(self._ctx, 13):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 13)")
+                        self.state = 281
+                        self.match(LatteParser.T__25)
+                        self.state = 282
+                        self.expr(13)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = LatteParser.EMthdCallContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 283
+                        if not self.precpred(self._ctx, 20):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 20)")
+                        self.state = 284
+                        self.match(LatteParser.T__9)
+                        self.state = 285
+                        self.match(LatteParser.ID)
+                        self.state = 286
+                        self.match(LatteParser.T__6)
+                        self.state = 295
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << LatteParser.T__6) | (1 << LatteParser.T__26) | (1 << LatteParser.T__27) | (1 << LatteParser.T__28) | (1 << LatteParser.T__30) | (1 << LatteParser.T__31) | (1 << LatteParser.T__32) | (1 << LatteParser.INT) | (1 << LatteParser.ID) | (1 << LatteParser.STR))) != 0):
+                            self.state = 287
+                            self.expr(0)
+                            self.state = 292
+                            self._errHandler.sync(self)
+                            _la = self._input.LA(1)
+                            while _la==LatteParser.T__4:
+                                self.state = 288
+                                self.match(LatteParser.T__4)
+                                self.state = 289
+                                self.expr(0)
+                                self.state = 294
+                                self._errHandler.sync(self)
+                                _la = self._input.LA(1)
+
+
+
+                        self.state = 297
+                        self.match(LatteParser.T__7)
+                        pass
+
+                    elif la_ == 7:
+                        localctx = LatteParser.EAttrContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 298
+                        if not self.precpred(self._ctx, 19):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 19)")
+                        self.state = 299
+                        self.match(LatteParser.T__9)
+                        self.state = 300
+                        self.match(LatteParser.ID)
+                        pass
+
+                    elif la_ == 8:
+                        localctx = LatteParser.EArrAccContext(self, LatteParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 301
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 302
+                        self.match(LatteParser.T__10)
+                        self.state = 303
+                        self.expr(0)
+                        self.state = 304
+                        self.match(LatteParser.T__11)
+                        pass
+
+             
+                self.state = 310
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class UnOpContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_unOp
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class NegContext(UnOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.UnOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNeg" ):
+                return visitor.visitNeg(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MinusContext(UnOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.UnOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMinus" ):
+                return visitor.visitMinus(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def unOp(self):
+
+        localctx = LatteParser.UnOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_unOp)
+        try:
+            self.state = 313
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [LatteParser.T__31]:
+                localctx = LatteParser.MinusContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 311
+                self.match(LatteParser.T__31)
+                pass
+            elif token in [LatteParser.T__32]:
+                localctx = LatteParser.NegContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 312
+                self.match(LatteParser.T__32)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AddOpContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_addOp
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class AddContext(AddOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.AddOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdd" ):
+                return visitor.visitAdd(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class SubContext(AddOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.AddOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSub" ):
+                return visitor.visitSub(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def addOp(self):
+
+        localctx = LatteParser.AddOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_addOp)
+        try:
+            self.state = 317
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [LatteParser.T__33]:
+                localctx = LatteParser.AddContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 315
+                self.match(LatteParser.T__33)
+                pass
+            elif token in [LatteParser.T__31]:
+                localctx = LatteParser.SubContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 316
+                self.match(LatteParser.T__31)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MulOpContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_mulOp
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class DivContext(MulOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.MulOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDiv" ):
+                return visitor.visitDiv(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ModContext(MulOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.MulOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMod" ):
+                return visitor.visitMod(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MulContext(MulOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.MulOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMul" ):
+                return visitor.visitMul(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def mulOp(self):
+
+        localctx = LatteParser.MulOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_mulOp)
+        try:
+            self.state = 322
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [LatteParser.T__34]:
+                localctx = LatteParser.MulContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 319
+                self.match(LatteParser.T__34)
+                pass
+            elif token in [LatteParser.T__35]:
+                localctx = LatteParser.DivContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 320
+                self.match(LatteParser.T__35)
+                pass
+            elif token in [LatteParser.T__36]:
+                localctx = LatteParser.ModContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 321
+                self.match(LatteParser.T__36)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelOpContext(ParserRuleContext):
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LatteParser.RULE_relOp
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class LtContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLt" ):
+                return visitor.visitLt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LeContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLe" ):
+                return visitor.visitLe(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NeqContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNeq" ):
+                return visitor.visitNeq(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EqContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEq" ):
+                return visitor.visitEq(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class GtContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGt" ):
+                return visitor.visitGt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class GeContext(RelOpContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LatteParser.RelOpContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitGe" ):
+                return visitor.visitGe(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def relOp(self):
+
+        localctx = LatteParser.RelOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_relOp)
+        try:
+            self.state = 330
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [LatteParser.T__37]:
+                localctx = LatteParser.LtContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 324
+                self.match(LatteParser.T__37)
+                pass
+            elif token in [LatteParser.T__38]:
+                localctx = LatteParser.LeContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 325
+                self.match(LatteParser.T__38)
+                pass
+            elif token in [LatteParser.T__39]:
+                localctx = LatteParser.GtContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 326
+                self.match(LatteParser.T__39)
+                pass
+            elif token in [LatteParser.T__40]:
+                localctx = LatteParser.GeContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 327
+                self.match(LatteParser.T__40)
+                pass
+            elif token in [LatteParser.T__41]:
+                localctx = LatteParser.EqContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 328
+                self.match(LatteParser.T__41)
+                pass
+            elif token in [LatteParser.T__42]:
+                localctx = LatteParser.NeqContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 329
+                self.match(LatteParser.T__42)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[7] = self.type__sempred
+        self._predicates[9] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def type__sempred(self, localctx:Type_Context, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 1)
+         
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 1:
+                return self.precpred(self._ctx, 17)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 16)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 15)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 14)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 13)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 20)
+         
+
+            if predIndex == 7:
+                return self.precpred(self._ctx, 19)
+         
+
+            if predIndex == 8:
+                return self.precpred(self._ctx, 3)
+         
+
+
+
+
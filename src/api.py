@@ -0,0 +1,153 @@
+"""
+In-process compilation of Latte sources, for embedding the compiler.
+
+    from api import CompileOptions, compile_source
+    result = compile_source('int main() { return 0; }', CompileOptions())
+    if result.ok:
+        print(result.assembly)
+    for diagnostic in result.diagnostics:
+        print(diagnostic.line, diagnostic.column, diagnostic.message)
+
+Nothing is printed and no exception escapes. Parsers and antlr's DFAs
+are kept by the process, so later compilations reuse them.
+"""
+from antlr4 import InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from errors import CompilationError
+from latc import run_passes
+from pass_manager import DEFAULT_LEVEL, optimizations
+from pass_stats import PassStats
+
+
+class CompileOptions:
+    """
+    Options of a compilation, defaults match the command line compiler.
+    Optimizations are chosen by `opt_level` (0-3), `const_expr`,
+    `peephole`, `regalloc` and `gvn` switch the tree and peephole
+    optimizers, the register allocator and value numbering regardless
+    of it.
+    A `module` is compiled separately, using declarations of modules
+    from `interfaces` (paths of their .lti files).
+    `backend` 'ir' generates code through the IR (in SSA form with `ssa`).
+    With `stats`, time (and with `trace_memory` peak memory) of each pass
+    is measured.
+    """
+    def __init__(
+            self, opt_level: int = DEFAULT_LEVEL, const_expr: bool = None,
+            peephole: bool = None, sll: bool = True, fast_lexer: bool = True,
+            module: bool = False, interfaces: list = (), stats: bool = False,
+            trace_memory: bool = False, backend: str = 'ast',
+            ssa: bool = False, regalloc: bool = None, gvn: bool = None
+    ):
+        self.opt_level = opt_level
+        self.const_expr = const_expr
+        self.peephole = peephole
+        self.regalloc = regalloc
+        self.gvn = gvn
+        self.sll = sll
+        self.fast_lexer = fast_lexer
+        self.module = module
+        self.interfaces = list(interfaces)
+        self.stats = stats
+        self.trace_memory = trace_memory
+        self.backend = backend
+        self.ssa = ssa
+
+
+class Diagnostic:
+    """
+    An error found in the source. `kind` names it (as in its message),
+    `line` and `column` (1-based and 0-based) are None when unknown.
+    `message` is what the command line compiler prints.
+    """
+    def __init__(
+            self, kind: str, message: str, line: int = None,
+            column: int = None
+    ):
+        self.kind = kind
+        self.message = message
+        self.line = line
+        self.column = column
+
+    @classmethod
+    def from_exception(cls, e: Exception):
+        line, column = getattr(e, 'line', None), getattr(e, 'column', None)
+        if isinstance(e, CompilationError):
+            return cls(e.name, str(e), e.node.line)
+        if isinstance(e, SyntaxError):
+            return cls('Syntax Error', str(e), line, column)
+        return cls(type(e).__name__, str(e), line, column)
+
+    def __repr__(self):
+        return f'Diagnostic({self.kind!r}, line={self.line}, ' \
+               f'column={self.column})'
+
+
+class CompileResult:
+    """
+    Outcome of a compilation: `assembly` (None if it failed), diagnostics,
+    stats of passes (a dict, see PassStats.to_dict, or None) and for
+    modules their `interface` (a ModuleInterface).
+    """
+    def __init__(
+            self, assembly: str = None, diagnostics: list = None,
+            stats: dict = None, interface=None
+    ):
+        self.assembly = assembly
+        self.diagnostics = diagnostics or []
+        self.stats = stats
+        self.interface = interface
+
+    @property
+    def ok(self) -> bool:
+        return self.assembly is not None
+
+
+class DiagnosticCollector(ErrorListener):
+    """ Turns token recognition errors of the lexer into diagnostics. """
+    def __init__(self, diagnostics: list):
+        self.diagnostics = diagnostics
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.diagnostics.append(Diagnostic(
+            'Token Recognition Error', f'line {line}:{column} {msg}',
+            line, column
+        ))
+
+
+def compile_source(source, options: CompileOptions = None) -> CompileResult:
+    """
+    Compiles Latte `source` (str, or bytes in utf-8) into assembly.
+    Safe to call repeatedly in one process.
+    """
+    options = options or CompileOptions()
+    if isinstance(source, bytes):
+        source = source.decode('utf-8')
+    result = CompileResult()
+    stats = PassStats(
+        enabled=options.stats, trace_memory=options.trace_memory
+    )
+    module = None
+    try:
+        if options.module:
+            from interface import Module
+            module = Module(options.interfaces)
+        result.assembly = run_passes(
+            InputStream(source),
+            optimizations(
+                options.opt_level, options.const_expr, options.peephole,
+                options.regalloc, options.gvn
+            ),
+            stats, module=module, sll=options.sll,
+            fast_lexer=options.fast_lexer,
+            lexer_listener=DiagnosticCollector(result.diagnostics),
+            backend=options.backend, ssa=options.ssa
+        )
+    except Exception as e:
+        result.diagnostics.append(Diagnostic.from_exception(e))
+    if options.stats:
+        result.stats = stats.to_dict()
+    if module and result.ok:
+        result.interface = module.exports
+    return result
@@ -1,21 +1,25 @@
-import copy
+import hashlib
 
 from runtime import *
 from latte_state import WithLatteState
 from assembly_writer import AssemblyWriter
 from variable_allocator import VariableAllocator
 
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
+from latte_ast import * # noqa
 
 
-class AssemblyGenerator(LatteVisitor, WithLatteState):
+class AssemblyGenerator(NodeVisitor, WithLatteState):
     """
     Main backend class - generates x68 assembly code.
+    Code of a `module` (compiled separately) exports its symbols
+    and uses symbols of modules it imports.
+    Visits of nodes with subexpressions or statements yield them
+    (see NodeVisitor), so nesting depth is not limited by the stack.
     """
-    def __init__(self, strings: list, writer: AssemblyWriter):
+    def __init__(self, strings: list, writer: AssemblyWriter, module=None):
         super().__init__()
         self.strings = strings
+        self.module = module
         self.labels = {}
         self.writer = writer
 
@@ -36,12 +40,44 @@ class AssemblyGenerator(LatteVisitor, WithLatteState):
         self.writer.putl(label)
 
     def prepare_data_section(self):
+        # a string used more than once has a single label
+        self.strings = list(dict.fromkeys(self.strings))
         for cls in self.classes:
             self.labels[cls] = self.newl()
         for string in self.strings:
             self.labels[string] = self.newl()
         self.empty_string_label = self.newl()
 
+    def prepare_stable_labels(self):
+        """
+        Labels of data which do not depend on the order of generation,
+        so that each function can be generated separately.
+        """
+        for cls in self.classes:
+            self.labels[cls] = f'{cls}.vtable'
+        strings, self.strings = self.strings, []
+        self.add_strings(strings)
+        self.empty_string_label = 'str.empty'
+
+    def add_strings(self, strings: list):
+        """ Adds stable labels of `strings` which have none yet. """
+        for string in strings:
+            if string not in self.labels:
+                digest = hashlib.sha1(string.encode()).hexdigest()
+                self.labels[string] = f'str.{digest[:16]}'
+                self.strings.append(string)
+
+    def generate_function(self, fun: FunDef, obj: str = None):
+        """
+        Generates code of `fun` (a method of class `obj`, if given)
+        by a writer of its own, which is returned. Needs stable labels.
+        """
+        name = f'{obj}__{fun.name}' if obj else fun.name
+        self.writer = AssemblyWriter(namespace=name)
+        self.current_object = obj
+        self.visit(fun)
+        return self.writer
+
     def init_function(self, name, locals_count):
         self.putl(name)
         signature = self.methods[self.current_object][self.current_fun]
@@ -66,56 +102,73 @@ class AssemblyGenerator(LatteVisitor, WithLatteState):
                 f'copy arg {name}'
             )
 
-    def visitProgram(self, ctx: LatteParser.ProgramContext):
-        self.prepare_data_section()
-        self.visitChildren(ctx)
-        self.writer.gen_text_intro()
-        self.writer.gen_data_section(
-            self.strings, self.classes, self.labels, self.vtables,
-            self.empty_string_used, self.empty_string_label
+    def visitProgram(self, node: Program):
+        if self.module:
+            # vtables of imported classes are referred to by name
+            self.strings = list(dict.fromkeys(self.strings))
+            self.prepare_stable_labels()
+        else:
+            self.prepare_data_section()
+        yield from self.visitChildren(node)
+        self.gen_sections(self.writer, self.empty_string_used)
+
+    def gen_sections(self, writer: AssemblyWriter, empty_string_used: bool):
+        """ Adds text section intro and data section to `writer`. """
+        self.gen_text_intro(writer)
+        self.gen_data_section(writer, empty_string_used)
+
+    def gen_text_intro(self, writer: AssemblyWriter):
+        if self.module:
+            writer.gen_text_intro(
+                self.module.exports.symbols(),
+                [s for i in self.module.imports for s in i.symbols()]
+            )
+        else:
+            writer.gen_text_intro()
+
+    def gen_data_section(
+            self, writer: AssemblyWriter, empty_string_used: bool
+    ):
+        classes = self.module.exports.classes if self.module else self.classes
+        writer.gen_data_section(
+            self.strings, classes, self.labels, self.vtables,
+            empty_string_used, self.empty_string_label
         )
 
-    def visitTopFunDef(self, ctx: LatteParser.TopFunDefContext):
+    def visitClassDef(self, node: ClassDef):
+        self.current_object = node.name
+        yield from self.visitChildren(node)
         self.current_object = None
-        return super().visitTopFunDef(ctx)
-
-    def visitBaseClassDef(self, ctx: LatteParser.BaseClassDefContext):
-        self.current_object = ctx.ID().getText()
-        return super().visitBaseClassDef(ctx)
-
-    def visitExtClassDef(self, ctx: LatteParser.ExtClassDefContext):
-        self.current_object = ctx.ID(0).getText()
-        return super().visitExtClassDef(ctx)
 
-    def visitFunDef(self, ctx: LatteParser.FunDefContext):
-        name = ctx.ID().getText()
+    def visitFunDef(self, node: FunDef):
+        name = node.name
         self.current_fun = name
         name = f'{self.current_object}__{name}' if self.current_object else name
         self.ret_label = self.newl()
-        self.init_function(name, ctx.locals_count)
-        self.visitChildren(ctx)
+        self.init_function(name, node.locals_count)
+        yield from self.visitChildren(node)
         self.putl(self.ret_label)
         self.add('leave')
         self.add('ret')
         self.current_fun = None
 
-    def visitBlock(self, ctx: LatteParser.BlockContext):
-        old_locals = copy.deepcopy(self.locals)
-        self.visitChildren(ctx)
-        self.locals = old_locals
+    def visitBlock(self, node: Block):
+        self.locals.push_scope()
+        yield from self.visitChildren(node)
+        self.locals.pop_scope()
 
-    def visitDecl(self, ctx: LatteParser.DeclContext):
-        self.current_type = ctx.type_().getText()
-        return super().visitDecl(ctx)
+    def visitDecl(self, node: Decl):
+        self.current_type = node.type
+        yield from self.visitChildren(node)
 
-    def visitDef(self, ctx: LatteParser.DefContext):
-        name = ctx.ID().getText()
+    def visitDef(self, node: Def):
+        name = node.name
         self.locals.new(name)
         self.init_var(name, 'default')
 
-    def visitDefAss(self, ctx: LatteParser.DefAssContext):
-        self.visit(ctx.expr())
-        name = ctx.ID().getText()
+    def visitDefAss(self, node: DefAss):
+        yield node.expr
+        name = node.name
         self.locals.new(name)
         self.init_var(name, 'EAX')
 
@@ -136,44 +189,39 @@ class AssemblyGenerator(LatteVisitor, WithLatteState):
             f'init {name} to expr in eax'
         )
 
-    def visitAss(self, ctx: LatteParser.AssContext):
-        self.visit(ctx.expr())
-        name = ctx.ID().getText()
+    def visitAss(self, node: Ass):
+        yield node.expr
+        name = node.name
         if name in self.locals:
             self.add(
                 f'mov dword [EBP + {self.locals[name]}], EAX',
-                f'line {ctx.start.line}: {name}='
+                f'line {node.line}: {name}='
             )
         else:
             # the only possibility is that we are in a method
             # and we are writing to an attribute
-            self.add('mov ECX, EAX', f'line {ctx.start.line}: self.{name}=')
+            self.add('mov ECX, EAX', f'line {node.line}: self.{name}=')
             self.add('mov EAX, [EBP + -4]', 'as above')
-            attrs = list(self.attrs[self.current_object].keys())
-            index = attrs.index(ctx.ID().getText())
-            self.add(f'mov [EAX + {4 + 4 * index}], ECX', 'as above')
+            offset = self.layouts[self.current_object].offsets[name]
+            self.add(f'mov [EAX + {offset}], ECX', 'as above')
 
-    def visitAttrAss(self, ctx: LatteParser.AttrAssContext):
-        self.visit(ctx.expr(0))
+    def visitAttrAss(self, node: AttrAss):
+        yield node.obj
         var = self.locals.new()
         self.add(
             f'mov [EBP + {var}], EAX',
-            f'at line {ctx.start.line} ({ctx.start.line}=...): '
+            f'at line {node.line} ({node.line}=...): '
             f'proceed to calculate expression'
         )
-        self.visit(ctx.expr(1))
+        yield node.expr
         self.add(
             'mov ECX, EAX',
-            f'at line {ctx.start.line} ({ctx.ID().getText()}=): copy result'
+            f'at line {node.line} ({node.name}=): copy result'
         )
         self.add(f'mov EAX, [EBP + {var}]', 'then get object ptr')
         self.locals.free(var)
-        attrs = list(self.attrs[ctx.expr(0).expr_type].keys())
-        index = attrs.index(ctx.ID().getText())
-        self.add(f'mov [EAX + {4 + 4 * index}], ECX', 'and save with offset')
-
-    def visitArrayAss(self, ctx: LatteParser.ArrayAssContext):
-        return super().visitArrayAss(ctx)
+        offset = self.layouts[node.obj.expr_type].offsets[node.name]
+        self.add(f'mov [EAX + {offset}], ECX', 'and save with offset')
 
     def visit_inc_dec(self, op, name, cls):
         if name in self.locals:
@@ -182,151 +230,145 @@ class AssemblyGenerator(LatteVisitor, WithLatteState):
                 f'{name}{op}'
             )
         else:
-            attrs = list(self.attrs[cls].keys())
-            index = attrs.index(name)
+            offset = self.layouts[cls].offsets[name]
             self.add(
-                f'{op} dword [EAX + {4 + 4 * index}]',
+                f'{op} dword [EAX + {offset}]',
                 f'self.{name}{op}'
             )
 
-    def visitIncr(self, ctx: LatteParser.IncrContext):
-        self.visit_inc_dec('inc', ctx.ID().getText(), self.current_object)
+    def visitIncr(self, node: Incr):
+        self.visit_inc_dec('inc', node.name, self.current_object)
 
-    def visitDecr(self, ctx: LatteParser.DecrContext):
-        self.visit_inc_dec('dec', ctx.ID().getText(), self.current_object)
+    def visitDecr(self, node: Decr):
+        self.visit_inc_dec('dec', node.name, self.current_object)
 
-    def visitAttrIncr(self, ctx: LatteParser.AttrIncrContext):
-        self.visit(ctx.expr())
-        self.visit_inc_dec('inc', ctx.ID().getText(), ctx.expr().expr_type)
+    def visitAttrIncr(self, node: AttrIncr):
+        yield node.obj
+        self.visit_inc_dec('inc', node.name, node.obj.expr_type)
 
-    def visitAttrDecr(self, ctx: LatteParser.AttrDecrContext):
-        self.visit(ctx.expr())
-        self.visit_inc_dec('dec', ctx.ID().getText(), ctx.expr().expr_type)
+    def visitAttrDecr(self, node: AttrDecr):
+        yield node.obj
+        self.visit_inc_dec('dec', node.name, node.obj.expr_type)
 
-    def visitRet(self, ctx: LatteParser.RetContext):
-        self.visit(ctx.expr())
+    def visitRet(self, node: Ret):
+        yield node.expr
         self.add(
             f'jmp {self.ret_label}',
-            f'goto return at line {ctx.start.line}'
+            f'goto return at line {node.line}'
         )
 
-    def visitVRet(self, ctx: LatteParser.VRetContext):
+    def visitVRet(self, node: VRet):
         self.add(
             f'jmp {self.ret_label}',
-            f'goto return at line {ctx.start.line}'
+            f'goto return at line {node.line}'
         )
 
-    def visitCond(self, ctx: LatteParser.CondContext):
-        self.visit(ctx.expr())
+    def visitCond(self, node: Cond):
+        yield node.cond
         finish_label = self.newl()
-        self.add('cmp EAX, 1', f'if at line {ctx.start.line}')
+        self.add('cmp EAX, 1', f'if at line {node.line}')
         self.add(f'jne {finish_label}', 'if ne omit if\'s body')
-        self.visit(ctx.stmt())
+        yield node.stmt
         self.putl(finish_label)
 
-    def visitCondElse(self, ctx: LatteParser.CondElseContext):
-        self.visit(ctx.expr())
+    def visitCondElse(self, node: CondElse):
+        yield node.cond
         finish_label = self.newl()
         if_label = self.newl()
-        self.add('cmp EAX, 0', f'if else at line {ctx.start.line}')
+        self.add('cmp EAX, 0', f'if else at line {node.line}')
         self.add(f'jne {if_label}', f'if ne goto if part')
-        self.visit(ctx.stmt(1))
+        yield node.else_stmt
         self.add(
             f'jmp {finish_label}',
-            f'finish "if" from line {ctx.start.line}'
+            f'finish "if" from line {node.line}'
         )
         self.putl(if_label)
-        self.visit(ctx.stmt(0))
+        yield node.stmt
         self.putl(finish_label)
 
-    def visitWhile(self, ctx: LatteParser.WhileContext):
+    def visitWhile(self, node: While):
         checkl, bodyl, finishl = self.newl(), self.newl(), self.newl()
         self.putl(checkl)
-        self.visit(ctx.expr())
-        self.add('cmp EAX, 0', f'while from line {ctx.start.line}')
+        yield node.cond
+        self.add('cmp EAX, 0', f'while from line {node.line}')
         self.add(f'jne {bodyl}', 'if ne jump to while\' body')
         self.add(f'jmp {finishl}', 'else jump to finish label')
         self.putl(bodyl)
-        self.visit(ctx.stmt())
+        yield node.stmt
         self.add(
             f'jmp {checkl}',
-            f'return to condition in while from line {ctx.start.line}'
+            f'return to condition in while from line {node.line}'
         )
         self.putl(finishl)
 
-    def visitForEach(self, ctx: LatteParser.ForEachContext):
-        return super().visitForEach(ctx)
-
-    def visitEId(self, ctx: LatteParser.EIdContext):
-        name = ctx.ID().getText()
+    def visitEId(self, node: EId):
+        name = node.name
         if name in self.locals:
             self.add(
                 f'mov EAX, [EBP + {self.locals[name]}]',
-                f'get value of var "{name}" at line {ctx.start.line}'
+                f'get value of var "{name}" at line {node.line}'
             )
         else:
-            attrs = list(self.attrs[self.current_object].keys())
-            index = attrs.index(ctx.ID().getText())
+            offset = self.layouts[self.current_object].offsets[name]
             self.add(
                 'mov EAX, [EBP + -4]',
-                f'<- get self from self.{name}= in line {ctx.start.line}'
+                f'<- get self from self.{name}= in line {node.line}'
             )
-            self.add(f'mov EAX, [EAX + {4 + 4 * index}]', 'get attr')
+            self.add(f'mov EAX, [EAX + {offset}]', 'get attr')
 
-    def visit_vcall(self, name, args, methods):
+    def visit_vcall(self, name, args, layout):
         self.add('mov dword EAX, [EBP + -4]', 'vcall: get self')
         self.add('push dword EAX', 'vcall: put self on stack (as first arg)')
         self.add(f'mov dword EAX, [EAX]', 'vcall: get vtable of self')
-        offset = 4 * methods.index(name)
+        offset = layout.slots[name]
         self.add(f'mov dword EAX, [EAX + {offset}]', 'vcall: get method')
         self.add('call EAX', 'vcall: make call')
-        self.add(f'add ESP, {4 * 4 * len(args)}', 'vcall: clean stack')
+        self.add(f'add ESP, {4 * len(args) + 4}', 'vcall: clean stack')
 
-    def visitEFunCall(self, ctx: LatteParser.EFunCallContext):
-        name = ctx.ID().getText()
-        args = [expr for expr in ctx.expr()]
+    def visitEFunCall(self, node: EFunCall):
+        name = node.name
+        args = node.args
         for arg in args[::-1]:
-            self.visit(arg)
+            yield arg
             self.add(
                 "push dword EAX",
-                f'push arg from call "{name}" at line {ctx.start.line}'
+                f'push arg from call "{name}" at line {node.line}'
             )
         if self.current_object:
-            methods = [mthd[1] for mthd in self.vtables[self.current_object]]
-            if name in methods:
-                self.visit_vcall(name, args, methods)
+            layout = self.layouts[self.current_object]
+            if name in layout.slots:
+                self.visit_vcall(name, args, layout)
                 return
-        self.add(f'call {name}', f'call "{name}", line {ctx.start.line}')
+        self.add(f'call {name}', f'call "{name}", line {node.line}')
         self.add(f'add ESP, {4 * len(args)}', 'and clean stack')
 
-    def visitEMthdCall(self, ctx: LatteParser.EMthdCallContext):
-        exprs = list(ctx.expr())
-        name = ctx.ID().getText()
+    def visitEMthdCall(self, node: EMthdCall):
+        exprs = [node.obj] + node.args
+        name = node.name
         for expr in exprs[::-1]:
-            self.visit(expr)
+            yield expr
             self.add(
                 'push EAX',
-                f'push arg from call "{name}" at line {ctx.start.line}'
+                f'push arg from call "{name}" at line {node.line}'
             )
         self.add(
             'mov dword EAX, [EAX]',
-            f'vcall {name} at line {ctx.start.line}: load vtable'
+            f'vcall {name} at line {node.line}: load vtable'
         )
-        methods = [p[1] for p in self.vtables[exprs[0].expr_type]]
-        offset = 4 * methods.index(ctx.ID().getText())
+        offset = self.layouts[exprs[0].expr_type].slots[name]
         self.add(f'mov dword EAX, [EAX + {offset}]', 'vcall: load method')
         self.add('call EAX', 'vcall: make call')
         self.add(f'add dword ESP, {4 * len(exprs)}', 'clean stack')
 
-    def visitERelOp(self, ctx: LatteParser.ERelOpContext):
-        self.visit(ctx.expr(0))
-        op = ctx.relOp().getText()
+    def visitERelOp(self, node: ERelOp):
+        yield node.left
+        op = node.op.value
         var = self.locals.new()
-        self.add(f'mov [EBP + {var}], EAX', f'{op} op at line {ctx.start.line}')
-        self.visit(ctx.expr(1))
-        self.add(f'mov ECX, [EBP + {var}]', f'{op} op at line {ctx.start.line}')
+        self.add(f'mov [EBP + {var}], EAX', f'{op} op at line {node.line}')
+        yield node.right
+        self.add(f'mov ECX, [EBP + {var}]', f'{op} op at line {node.line}')
         self.locals.free(var)
-        self.add('cmp ECX, EAX', f'{op} op at line {ctx.start.line}')
+        self.add('cmp ECX, EAX', f'{op} op at line {node.line}')
         inst = {
             '<': 'setl',
             '<=': 'setle',
@@ -335,178 +377,122 @@ class AssemblyGenerator(LatteVisitor, WithLatteState):
             '==': 'sete',
             '!=': 'setne'
         }[op]
-        self.add(f'{inst} AL', f'{op} op at line {ctx.start.line}')
-        self.add(f'and dword EAX, 1', f'{op} op at line {ctx.start.line}')
+        self.add(f'{inst} AL', f'{op} op at line {node.line}')
+        self.add(f'and dword EAX, 1', f'{op} op at line {node.line}')
 
-    def visitETrue(self, ctx: LatteParser.ETrueContext):
-        self.add('mov dword EAX, 1', f'true at line {ctx.start.line}')
+    def visitETrue(self, node: ETrue):
+        self.add('mov dword EAX, 1', f'true at line {node.line}')
 
-    def visitEFalse(self, ctx: LatteParser.EFalseContext):
-        self.add('xor EAX, EAX', f'false at line {ctx.start.line}')
+    def visitEFalse(self, node: EFalse):
+        self.add('xor EAX, EAX', f'false at line {node.line}')
 
-    def visitEInt(self, ctx: LatteParser.EIntContext):
+    def visitEInt(self, node: EInt):
         self.add(
-            f'mov dword EAX, {ctx.getText()}',
-            f'const. {ctx.getText()} at line {ctx.start.line}'
+            f'mov dword EAX, {node.value}',
+            f'const. {node.value} at line {node.line}'
         )
 
-    def visitEStr(self, ctx: LatteParser.EStrContext):
+    def visitEStr(self, node: EStr):
         self.add(
-            f'mov dword EAX, {self.labels[ctx.getText()]}',
-            f'line {ctx.start.line}, const. str: {ctx.getText()}'
+            f'mov dword EAX, {self.labels[node.text]}',
+            f'line {node.line}, const. str: {node.text}'
         )
 
-    def visitECastNull(self, ctx: LatteParser.ECastNullContext):
-        self.add('mov dword EAX, 0', f'cast null at line {ctx.start.line}')
+    def visitECastNull(self, node: ECastNull):
+        self.add('mov dword EAX, 0', f'cast null at line {node.line}')
 
-    def visitENewArr(self, ctx: LatteParser.ENewArrContext):
-        return super().visitENewArr(ctx)
-
-    def visit_and_or(self, ctx, op):
+    def visit_and_or(self, node, op):
         finishl = self.newl()
-        self.visit(ctx.expr(0))
+        yield node.left
         self.add('cmp EAX, 0', f'boolean op')
         self.add(f'{op} {finishl}', f'with lazy evaluation')
-        self.visit(ctx.expr(1))
+        yield node.right
         self.putl(finishl)
 
-    def visitEOr(self, ctx: LatteParser.EOrContext):
-        self.visit_and_or(ctx, 'jne')
+    def visitEOr(self, node: EOr):
+        yield from self.visit_and_or(node, 'jne')
 
-    def visitEAnd(self, ctx: LatteParser.EAndContext):
-        self.visit_and_or(ctx, 'je')
+    def visitEAnd(self, node: EAnd):
+        yield from self.visit_and_or(node, 'je')
 
-    def visitEUnOp(self, ctx: LatteParser.EUnOpContext):
-        self.visit(ctx.expr())
-        if isinstance(ctx.unOp(), LatteParser.MinusContext):
-            self.add('neg dword EAX', f'- at line {ctx.start.line}')
+    def visitEUnOp(self, node: EUnOp):
+        yield node.expr
+        if node.op is UnOp.NEG:
+            self.add('neg dword EAX', f'- at line {node.line}')
         else:
-            self.add('xor dword EAX, 1', f'! at line {ctx.start.line}')
-
-    def visitEArrAcc(self, ctx: LatteParser.EArrAccContext):
-        return super().visitEArrAcc(ctx)
+            self.add('xor dword EAX, 1', f'! at line {node.line}')
 
-    def visitENewObj(self, ctx: LatteParser.ENewObjContext):
-        cls = ctx.type_().getText()
+    def visitENewObj(self, node: ENewObj):
+        cls = node.type
         if cls not in self.classes:
             # well, new int? that's cheating
             return
-        num_fields = len(list(self.attrs[cls].keys()))
         self.add(
-            f'push dword {4 * (1 + num_fields)}',
-            f'new {cls} at line {ctx.start.line} - push obj size'
+            f'push dword {self.layouts[cls].size}',
+            f'new {cls} at line {node.line} - push obj size'
         )
         self.add(f'call _malloc', 'and allocate memory')
         self.add(f'add ESP, 4', 'clean after call')
-        if self.vtables[cls]:
+        if self.layouts[cls].slots:
             # if it is a struct, there is no vtable
             self.add(
                 f'mov dword [EAX], {self.labels[cls]}',
                 f'and set first addres to {cls}\'s vtable'
             )
 
-    def visitEMulOp(self, ctx: LatteParser.EMulOpContext):
-        self.visit(ctx.expr(0))
+    def visitEMulOp(self, node: EMulOp):
+        yield node.left
         var = self.locals.new()
         self.add(
             f'mov [EBP + {var}], EAX',
-            f'left subexpression of mulOp from line {ctx.start.line}'
+            f'left subexpression of mulOp from line {node.line}'
         )
-        self.visit(ctx.expr(1))
-        self.add('mov ECX, EAX', f'prepare mulOp, line {ctx.start.line}')
+        yield node.right
+        self.add('mov ECX, EAX', f'prepare mulOp, line {node.line}')
         self.add(f'mov EAX, [EBP + {var}]', f'as above')
         self.locals.free(var)
         code = {
             '*': 'mul ECX',
-            '/': 'cdq;div ECX',
-            '%': 'cdq;div ECX;mov EAX, ECX'
-        }[self.visit(ctx.mulOp())]
+            '/': 'cdq;idiv ECX',
+            '%': 'cdq;idiv ECX;mov EAX, EDX'
+        }[node.op.value]
 
         for instr in code.split(';'):
-            self.add(instr, f'do mulOp from line {ctx.start.line}')
+            self.add(instr, f'do mulOp from line {node.line}')
 
-    def visitEAddOp(self, ctx: LatteParser.EAddOpContext):
-        self.visit(ctx.expr(0))
+    def visitEAddOp(self, node: EAddOp):
+        yield node.left
         var = self.locals.new()
         self.add(
             f'mov [EBP + {var}], EAX',
-            f'left subexpression of addOp from line {ctx.start.line}'
+            f'left subexpression of addOp from line {node.line}'
         )
-        self.visit(ctx.expr(1))
+        yield node.right
         self.add(
             f'mov ECX, [EBP + {var}]',
-            f'prepare addOp, line {ctx.start.line}'
+            f'prepare addOp, line {node.line}'
         )
         self.locals.free(var)
-        op = self.visit(ctx.addOp())
-        if op == '+':
-            if ctx.expr_type == STRING:
-                self.add('push EAX', f'concat strings in line {ctx.start.line}')
+        if node.op is Op.ADD:
+            if node.expr_type == STRING:
+                self.add('push EAX', f'concat strings in line {node.line}')
                 self.add('push ECX', f'as above')
                 self.add('call _concat', f'as above')
                 self.add('add dword ESP, 8', 'as above')
             else:
-                self.add('add EAX, ECX', f'add, line {ctx.start.line}')
+                self.add('add EAX, ECX', f'add, line {node.line}')
         else:
-            self.add('sub ECX, EAX', f'sub, line {ctx.start.line}')
+            self.add('sub ECX, EAX', f'sub, line {node.line}')
             self.add('mov EAX, ECX', 'as above')
 
-    def visitEParen(self, ctx: LatteParser.EParenContext):
-        self.visitChildren(ctx)
-
-    def visitEAttr(self, ctx: LatteParser.EAttrContext):
-        self.visit(ctx.expr())
-        attrs = list(self.attrs[ctx.expr().expr_type].keys())
-        name = ctx.ID().getText()
+    def visitEAttr(self, node: EAttr):
+        yield node.obj
+        name = node.name
+        offset = self.layouts[node.obj.expr_type].offsets[name]
         self.add(
-            f'mov EAX, [EAX + {4 * attrs.index(name) + 4}]',
-            f'getattr with name {name} in line {ctx.start.line}'
+            f'mov EAX, [EAX + {offset}]',
+            f'getattr with name {name} in line {node.line}'
         )
 
-    def visitESelf(self, ctx: LatteParser.ESelfContext):
+    def visitESelf(self, node: ESelf):
         self.add('mov EAX, [EBP + -4]', 'load self')
-
-    def visitArray(self, ctx: LatteParser.ArrayContext):
-        return super().visitArray(ctx)
-
-    # region Operators
-
-    def visitMinus(self, ctx: LatteParser.MinusContext):
-        return '-'
-
-    def visitNeg(self, ctx: LatteParser.NegContext):
-        return '!'
-
-    def visitAdd(self, ctx: LatteParser.AddContext):
-        return '+'
-
-    def visitSub(self, ctx: LatteParser.SubContext):
-        return '-'
-
-    def visitMul(self, ctx: LatteParser.MulContext):
-        return '*'
-
-    def visitDiv(self, ctx: LatteParser.DivContext):
-        return '/'
-
-    def visitMod(self, ctx: LatteParser.ModContext):
-        return '%'
-
-    def visitLt(self, ctx: LatteParser.LtContext):
-        return '<'
-
-    def visitLe(self, ctx: LatteParser.LeContext):
-        return '<='
-
-    def visitGt(self, ctx: LatteParser.GtContext):
-        return '>'
-
-    def visitGe(self, ctx: LatteParser.GeContext):
-        return '>='
-
-    def visitEq(self, ctx: LatteParser.EqContext):
-        return '=='
-
-    def visitNeq(self, ctx: LatteParser.NeqContext):
-        return '!='
-    # endregion
@@ -4,14 +4,19 @@ class AssemblyWriter:
     """ 
     Formatting of assembly and comments.
     Builds constant/static sections and remembers labels.
+    Labels of a writer with a `namespace` (name of the generated function)
+    do not clash with labels of other functions.
     """
-    def __init__(self):
+    def __init__(self, namespace: str = None):
         self._i = 0
+        self.namespace = namespace
         self.instructions = []
         self.comments = []
 
     def newl(self):
         self._i += 1
+        if self.namespace:
+            return f'{self.namespace}.l{self._i}'
         return f'l{self._i}'
 
     def add(self, inst: str, comment: str = ''):
@@ -44,10 +49,10 @@ class AssemblyWriter:
         self.instructions = sec + self.instructions
         self.comments = len(sec) * [''] + self.comments
 
-    def gen_text_intro(self):
-        sec = [
-            'segment .text',
-            '  global main',
+    def gen_text_intro(self, exports=('main',), imports=()):
+        sec = ['segment .text']
+        sec += [f'  global {symbol}' for symbol in exports]
+        sec += [
             '  extern printInt',
             '  extern printString',
             '  extern readInt',
@@ -57,8 +62,9 @@ class AssemblyWriter:
             '  extern _str_equal',
             '  extern _malloc'
         ]
+        sec += [f'  extern {symbol}' for symbol in imports]
         self.instructions = sec + self.instructions
-        self.comments = [''] * 10 + self.comments
+        self.comments = [''] * len(sec) + self.comments
 
     def remove(self, to_remove):
         to_remove.sort(key=lambda x: -x)
@@ -68,7 +74,15 @@ class AssemblyWriter:
 
     def get_code(self):
         idx = self.instructions.index('segment .text')
-        m = max(map(len, self.instructions[idx:])) + 4
+        return self.format(max(map(len, self.instructions[idx:])) + 4)
+
+    def format(self, m: int = None) -> str:
+        """
+        Code with comments aligned at column `m`
+        (by default, past the longest instruction).
+        """
+        if m is None:
+            m = max(map(len, self.instructions), default=0) + 4
         res = []
         for ins, cmt in zip(self.instructions, self.comments):
             length = max(m - len(ins), 4)
@@ -0,0 +1,171 @@
+"""
+Persistent cache of antlr's deserialized ATNs and of the DFAs
+which antlr learns while parsing (they are normally rebuilt
+from scratch by every compiler process).
+
+The cache is written only by `warm_up` (latc --warm-atn-cache), from DFAs
+learned on a given corpus, so that it stays small and compilations never
+modify it.
+
+The generated recognizers deserialize their ATN while being imported,
+so `import_recognizers` has to be the first place which imports them.
+"""
+import functools
+import hashlib
+import io
+import os
+import pickle
+import sys
+import time
+
+from antlr4.PredictionContext import PredictionContext
+from antlr4.dfa.DFA import DFA
+from antlr4.atn import LexerAction
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.SemanticContext import SemanticContext
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(HERE, 'antlr4gen', 'atn.cache')
+
+# larger caches are read slower than the DFAs they hold save
+MAX_CACHE_SIZE = 1024 * 1024
+
+# ATN / DFA graphs are deep, pickle walks them recursively
+PICKLE_RECURSION_LIMIT = 50000
+
+# antlr compares these with `is`, so they must not be copied by pickle
+SINGLETONS = {
+    'SemanticContext.NONE': SemanticContext.NONE,
+    'PredictionContext.EMPTY': PredictionContext.EMPTY,
+    'ATNSimulator.ERROR': ATNSimulator.ERROR,
+    'LexerATNSimulator.ERROR': LexerATNSimulator.ERROR,
+    'LexerSkipAction': LexerAction.LexerSkipAction.INSTANCE,
+    'LexerPopModeAction': LexerAction.LexerPopModeAction.INSTANCE,
+    'LexerMoreAction': LexerAction.LexerMoreAction.INSTANCE,
+}
+SINGLETON_IDS = {id(obj): name for name, obj in SINGLETONS.items()}
+
+# filled by `import_recognizers`, reported by --startup-stats
+STARTUP = {}
+
+
+class _Pickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        return SINGLETON_IDS.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return SINGLETONS[pid]
+
+
+def _digest(serialized_atn: str) -> str:
+    return hashlib.sha256(
+        serialized_atn.encode('utf-8', 'surrogatepass')
+    ).hexdigest()
+
+
+def _dfa_size(recognizers) -> int:
+    return sum(
+        len(dfa.states) for r in recognizers for dfa in r.decisionsToDFA
+    )
+
+
+class _RecursionLimit:
+    def __enter__(self):
+        self.old = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(self.old, PICKLE_RECURSION_LIMIT))
+
+    def __exit__(self, *exc):
+        sys.setrecursionlimit(self.old)
+
+
+def _read_cache(path: str) -> dict:
+    """ Maps ATN digest -> (ATN, DFAs), empty if there is no cache. """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'rb') as f, _RecursionLimit():
+            return _Unpickler(f).load()
+    except Exception:
+        # stale or broken cache (e.g. other antlr version) - just rebuild
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def import_recognizers(path: str = CACHE_PATH):
+    """
+    Imports LatteLexer and LatteParser, taking their ATNs and DFAs
+    from the cache when they match generated code.
+    Later calls return the already imported recognizers.
+    """
+    start = time.perf_counter()
+    cached = _read_cache(path)
+    STARTUP['atn_cache_load'] = time.perf_counter() - start
+
+    deserialize = ATNDeserializer.deserialize
+
+    def cached_deserialize(self, data):
+        if _digest(data) in cached:
+            return cached[_digest(data)][0]
+        return deserialize(self, data)
+
+    ATNDeserializer.deserialize = cached_deserialize
+    try:
+        from antlr4gen.LatteLexer import LatteLexer
+        from antlr4gen.LatteParser import LatteParser
+    finally:
+        ATNDeserializer.deserialize = deserialize
+
+    hits = 0
+    for recognizer in (LatteLexer, LatteParser):
+        for atn, dfas in cached.values():
+            if recognizer.atn is atn:
+                recognizer.decisionsToDFA = dfas
+                hits += 1
+    STARTUP['atn_cache'] = 'hit' if hits == 2 else 'miss'
+    STARTUP['import_recognizers'] = time.perf_counter() - start
+    STARTUP['dfa_states'] = _dfa_size((LatteLexer, LatteParser))
+    return LatteLexer, LatteParser
+
+
+def warm_up(sources, path: str = CACHE_PATH) -> int:
+    """
+    Parses `sources` starting from empty DFAs and persists ATNs and DFAs
+    learned. Returns the size of the cache written, or 0 when it would
+    be larger than MAX_CACHE_SIZE (the old cache is kept then).
+    """
+    from antlr4 import FileStream
+    from parsing import LatteLexer, LatteParser, parse
+
+    recognizers = (LatteLexer, LatteParser)
+    for cls in recognizers:
+        cls.decisionsToDFA = [
+            DFA(state, i) for i, state in enumerate(cls.atn.decisionToState)
+        ]
+    for source in sources:
+        try:
+            parse(FileStream(source))
+        except SyntaxError:
+            # states learned before the error are still worth keeping
+            pass
+    data = {
+        _digest(sys.modules[cls.__module__].serializedATN()):
+            (cls.atn, cls.decisionsToDFA)
+        for cls in recognizers
+    }
+    buffer = io.BytesIO()
+    with _RecursionLimit():
+        _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+    if buffer.tell() > MAX_CACHE_SIZE:
+        return 0
+    # write and rename, so that concurrent compilers never read partial file
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(buffer.getvalue())
+    os.replace(tmp, path)
+    STARTUP['dfa_states'] = _dfa_size(recognizers)
+    return buffer.tell()
@@ -0,0 +1,72 @@
+"""
+Per-class index tables, computed once the state is loaded.
+"""
+from types import MappingProxyType
+
+
+class ClassLayout:
+    """
+    Read-only layout of a class: byte offsets of fields in objects,
+    byte offsets of methods in the vtable and classes implementing them.
+    Classes are numbered in preorder of the inheritance forest;
+    subclasses of a class are exactly those with numbers in its interval.
+    """
+    __slots__ = (
+        'name', 'parent', 'fields', 'offsets', 'size', 'slots',
+        'implementations', 'first', 'last'
+    )
+
+    def __init__(
+            self, name: str, parent, fields: dict, vtable: list,
+            first: int, last: int
+    ):
+        self.name = name
+        self.parent = parent
+        # field -> type (inherited fields first)
+        self.fields = MappingProxyType(dict(fields))
+        # the first word of an object points to the vtable
+        self.offsets = MappingProxyType(
+            {field: 4 + 4 * i for i, field in enumerate(fields)}
+        )
+        self.size = 4 * (1 + len(fields))
+        self.slots = MappingProxyType(
+            {method: 4 * i for i, (_, method) in enumerate(vtable)}
+        )
+        self.implementations = MappingProxyType(
+            {method: cls for cls, method in vtable}
+        )
+        self.first = first
+        self.last = last
+
+    def is_subclass_of(self, other) -> bool:
+        return other.first <= self.first and self.last <= other.last
+
+
+def build_layouts(classes: dict, attrs: dict, vtables: dict) -> dict:
+    """ Layouts of all `classes` (class -> parent). """
+    children = {cls: [] for cls in classes}
+    roots = []
+    for cls, parent in classes.items():
+        if parent in children:
+            children[parent].append(cls)
+        else:
+            roots.append(cls)
+
+    intervals, counter = {}, 0
+    stack = [(cls, False) for cls in reversed(roots)]
+    while stack:
+        cls, done = stack.pop()
+        if done:
+            intervals[cls] = (intervals[cls], counter - 1)
+            continue
+        intervals[cls] = counter
+        counter += 1
+        stack.append((cls, True))
+        stack += [(child, False) for child in reversed(children[cls])]
+
+    return {
+        cls: ClassLayout(
+            cls, classes[cls], attrs[cls], vtables[cls], *intervals[cls]
+        )
+        for cls in classes
+    }
@@ -0,0 +1,169 @@
+"""
+On-disk cache of compilation artifacts (.asm, .o, .out).
+"""
+import fcntl
+import filecmp
+import glob
+import hashlib
+import json
+import os
+import shutil
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RUNTIME_PATH = os.path.join(HERE, '../lib/runtime.o')
+ARTIFACTS = ['.asm', '.o', '.out', '.lti']
+
+DEFAULT_ROOT = os.path.join(os.path.expanduser('~'), '.cache', 'latc')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def compiler_version() -> str:
+    """ Digest of compiler's own sources - changes with every edit. """
+    digest = hashlib.sha256()
+    sources = glob.glob(os.path.join(HERE, '*.py'))
+    sources += glob.glob(os.path.join(HERE, 'antlr4gen', '*.py'))
+    for source in sorted(sources):
+        digest.update(os.path.basename(source).encode())
+        digest.update(file_digest(source).encode())
+    return digest.hexdigest()
+
+
+class CompilationCache:
+    """
+    Content addressed cache: key is a hash of the source, compiler version,
+    optimization flags and runtime object. Entries are evicted in LRU order
+    (by modification time, refreshed on every hit) once the cache
+    grows over `max_bytes`.
+    """
+    def __init__(self, root: str = None, max_bytes: int = None):
+        self.root = root or os.environ.get('LATC_CACHE_DIR', DEFAULT_ROOT)
+        self.max_bytes = max_bytes or int(
+            os.environ.get('LATC_CACHE_SIZE', DEFAULT_MAX_BYTES)
+        )
+        os.makedirs(self.root, exist_ok=True)
+        self._version = None
+
+    def key(self, source_path: str, flags: dict) -> str:
+        if self._version is None:
+            self._version = compiler_version()
+        digest = hashlib.sha256()
+        digest.update(file_digest(source_path).encode())
+        digest.update(self._version.encode())
+        digest.update(json.dumps(flags, sort_keys=True).encode())
+        digest.update(file_digest(RUNTIME_PATH).encode())
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def fetch(self, key: str, base_file: str, product: str = '.out') -> bool:
+        """
+        Copies cached artifacts next to `base_file`, True on a hit
+        (if the final `product` - executable or module object - is cached).
+        Interface files are not touched if they did not change, so that
+        modules depending on them are not rebuilt.
+        """
+        entry = self._entry(key)
+        if not os.path.exists(entry + product):
+            self._count('misses')
+            return False
+        for ext in ARTIFACTS:
+            if os.path.exists(entry + ext):
+                target = base_file + ext
+                if ext != '.lti' or not os.path.exists(target) or \
+                        not filecmp.cmp(entry + ext, target, shallow=False):
+                    shutil.copy(entry + ext, target)
+                os.utime(entry + ext)
+        self._count('hits')
+        return True
+
+    def store(self, key: str, base_file: str):
+        entry = self._entry(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        for ext in ARTIFACTS:
+            if os.path.exists(base_file + ext):
+                # copy and rename, so that readers never see partial files
+                tmp = f'{entry}.{os.getpid()}.tmp'
+                shutil.copy(base_file + ext, tmp)
+                os.replace(tmp, entry + ext)
+        self.evict()
+
+    def fetch_fragment(self, key: str):
+        """ Returns cached code of a single function (or None). """
+        path = self._entry(key) + '.fun'
+        try:
+            with open(path) as f:
+                fragment = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(path)
+        return fragment
+
+    def store_fragment(self, key: str, fragment: dict):
+        path = self._entry(key) + '.fun'
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(fragment, f)
+        os.replace(tmp, path)
+
+    def count_fragments(self, hits: int, misses: int):
+        self._count('fragment_hits', hits)
+        self._count('fragment_misses', misses)
+
+    def _entries(self):
+        """ Lists (mtime, size, path) of all cached files. """
+        entries = []
+        for path in glob.glob(os.path.join(self.root, '??', '*')):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def _count(self, counter: str, n: int = 1):
+        path = os.path.join(self.root, 'stats.json')
+        with open(path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            stats = json.loads(f.read() or '{}')
+            stats[counter] = stats.get(counter, 0) + n
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(stats))
+
+    def stats(self) -> dict:
+        path = os.path.join(self.root, 'stats.json')
+        stats = {
+            'hits': 0, 'misses': 0, 'fragment_hits': 0, 'fragment_misses': 0
+        }
+        if os.path.exists(path):
+            with open(path) as f:
+                stats.update(json.loads(f.read() or '{}'))
+        entries = self._entries()
+        stats['entries'] = len({p.rsplit('.', 1)[0] for _, _, p in entries})
+        stats['bytes'] = sum(size for _, size, _ in entries)
+        stats['max_bytes'] = self.max_bytes
+        return stats
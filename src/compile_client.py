@@ -0,0 +1,103 @@
+"""
+Thin client of the compile server (see compile_server.py).
+Imports neither antlr nor compiler passes, so it starts instantly.
+Options the server does not handle are left to latc.py, which is run
+in place of the client then.
+"""
+import argparse
+import json
+import os
+import socket
+
+from options import str2bool
+from toolchain import assemble_and_link
+
+LATC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'latc.py')
+
+
+def request_compilation(sock_file, path, opt_level, const_expr, peephole):
+    request = {'path': path}
+    # the server decides what is not given
+    for name, value in (
+            ('opt_level', opt_level), ('const_expr', const_expr),
+            ('peephole', peephole)
+    ):
+        if value is not None:
+            request[name] = value
+    sock_file.write(json.dumps(request).encode() + b'\n')
+    sock_file.flush()
+    return json.loads(sock_file.readline())
+
+
+def run_latc(argv: list):
+    """ Replaces the client by latc.py run with `argv` (without --socket). """
+    args, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == '--socket':
+            skip = True
+        elif not arg.startswith('--socket='):
+            args.append(arg)
+    os.execv(os.sys.executable, [os.sys.executable, LATC, *args])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Latte compiler (compile server client).",
+        fromfile_prefix_chars='@'
+    )
+    parser.add_argument(
+        '--socket', type=str, default=os.environ.get('LATC_SOCKET'),
+        help='Unix socket of the compile server (default: $LATC_SOCKET).'
+    )
+    parser.add_argument(
+        '-O', type=int, choices=range(4), default=None, dest='opt_level',
+        help='Optimization level (as in latc).'
+    )
+    parser.add_argument(
+        '--peephole', type=str2bool, default=None,
+        help='[T/F] if peephole optimization should be performed '
+             '(overrides the level).'
+    )
+    parser.add_argument(
+        '--const_expr', type=str2bool, default=None,
+        help='[T/F] if constant expression optimization should be performed '
+             '(overrides the level).'
+    )
+    parser.add_argument(
+        'filepath', nargs='*', type=str, help='Paths of the files to compile.'
+    )
+    args, unknown = parser.parse_known_args()
+    if unknown or not args.filepath:
+        run_latc(os.sys.argv[1:])
+    if not args.socket:
+        parser.error('no compile server socket given')
+
+    cwd = os.path.abspath(os.getcwd())
+    status = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(args.socket)
+        sock_file = sock.makefile('rwb')
+        for path in args.filepath:
+            path = os.path.join(cwd, path)
+            response = request_compilation(
+                sock_file, path, args.opt_level, args.const_expr,
+                args.peephole
+            )
+            if not response['ok']:
+                print('ERROR', file=os.sys.stderr)
+                print(response['error'])
+                status = 1
+                continue
+            print('OK', file=os.sys.stderr)
+            base_file = os.path.splitext(path)[0]
+            with open(base_file + '.asm', 'w') as f:
+                f.write(response['code'])
+            status = assemble_and_link(base_file) or status
+    if status:
+        raise SystemExit(status)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Long-running compile server.
+Keeps parser and passes loaded (and antlr's DFA caches warm)
+between compilations requested through a unix socket.
+
+Protocol: each request is a single line of json
+    {"path": ..., "source": ..., "opt_level": int,
+     "peephole": bool, "const_expr": bool}
+(either "path" or "source" should be given, the rest is optional),
+answered by a single line
+    {"ok": bool, "code": str, "error": str}.
+"""
+import json
+import os
+import signal
+import socketserver
+
+from antlr4 import FileStream, InputStream
+
+from pass_manager import DEFAULT_LEVEL, optimizations
+
+
+class CompileRequestHandler(socketserver.StreamRequestHandler):
+    """ Serves compilation requests until the client disconnects. """
+    def handle(self):
+        for line in self.rfile:
+            response = self.server.compile_request(json.loads(line))
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+class CompileServer(socketserver.UnixStreamServer):
+    """
+    Serves requests one at a time, so that every compilation
+    benefits from the caches built by the previous ones.
+    """
+    def __init__(self, socket_path: str, run_passes):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, CompileRequestHandler)
+        self.run_passes = run_passes
+
+    def compile_request(self, request: dict) -> dict:
+        try:
+            if 'source' in request:
+                stream = InputStream(request['source'])
+            else:
+                stream = FileStream(request['path'])
+            code = self.run_passes(stream, optimizations(
+                request.get('opt_level', DEFAULT_LEVEL),
+                request.get('const_expr'),
+                request.get('peephole')
+            ))
+        except Exception as e:
+            return {'ok': False, 'code': '', 'error': str(e)}
+        return {'ok': True, 'code': code, 'error': ''}
+
+
+def _terminate(signum, frame):
+    raise SystemExit(0)
+
+
+def serve(socket_path: str, run_passes):
+    signal.signal(signal.SIGTERM, _terminate)
+    with CompileServer(socket_path, run_passes) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
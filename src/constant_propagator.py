@@ -0,0 +1,298 @@
+"""
+Propagation of constants through local variables, for the tree optimizer.
+
+Values of variables are followed statement by statement: `if`s only
+visit branches their condition leaves alive and join values of the
+branches which fall through, loops start from values of variables they
+do not assign. Expressions computed from known values get their
+`expr_value`, so that TreeOptimizer folds them and drops dead branches.
+"""
+from runtime import * # noqa
+from expression_evaluator import arithmetic, negation, relation
+from scoped_table import ScopedTable
+from latte_ast import * # noqa
+
+# values of variables declared without one (strings are compared by
+# address, so their values are not followed)
+DEFAULTS = {INT: 0, BOOL: False}
+
+
+def same(a, b) -> bool:
+    """ If values `a` and `b` are equal (0 is not false). """
+    return a == b and type(a) is type(b)
+
+
+class Variable:
+    """ A local variable, `value` is None when not known. """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class LoopAssignments(NodeVisitor):
+    """
+    Names of variables assigned in each loop of a function (the result
+    of visiting a statement is the set of names assigned in it).
+    """
+    def __init__(self):
+        # loop -> names
+        self.loops = {}
+
+    def visitAss(self, node: Ass):
+        return {node.name}
+
+    visitIncr = visitDecr = visitAss
+
+    def visitBlock(self, node: Block):
+        names = set()
+        for stmt in node.stmts:
+            assigned = yield stmt
+            if assigned:
+                names = self.union(names, assigned)
+        return names
+
+    def visitCond(self, node: Cond):
+        return (yield node.stmt)
+
+    def visitCondElse(self, node: CondElse):
+        names = yield node.stmt
+        assigned = yield node.else_stmt
+        return self.union(names or set(), assigned or set())
+
+    def visitWhile(self, node: While):
+        names = yield node.stmt
+        self.loops[node] = frozenset(names or ())
+        return names
+
+    @staticmethod
+    def union(a: set, b: set) -> set:
+        """ Union of `a` and `b`, made from the larger one. """
+        if len(a) < len(b):
+            a, b = b, a
+        a |= b
+        return a
+
+
+class ConstantPropagator(NodeVisitor):
+    """
+    Gives expressions of functions values computed from values of
+    variables. Expressions valued already by ExpressionEvaluator keep
+    their value (the return checker relied on it).
+    """
+    def __init__(self):
+        # name -> Variable
+        self.variables = ScopedTable()
+        # (variable, its value before an assignment)
+        self.trail = []
+        self.loops = {}
+        # if the statement visited can be reached
+        self.live = True
+        self.current_type = None
+        # expressions valued thanks to variables
+        self.propagated = 0
+
+    def assign(self, name: str, value):
+        variable = self.variables.get(name)
+        if variable is None:
+            # an attribute of self
+            return
+        self.trail.append((variable, variable.value))
+        variable.value = value
+
+    def branch(self, stmt: Node):
+        """
+        Visits `stmt`, then undoes its assignments. The result is the
+        values it left in variables, or None when it does not fall through.
+        """
+        mark = len(self.trail)
+        self.live = True
+        yield stmt
+        values = {} if self.live else None
+        while len(self.trail) > mark:
+            variable, value = self.trail.pop()
+            if values is not None:
+                values.setdefault(variable, variable.value)
+            variable.value = value
+        self.live = True
+        return values
+
+    def join(self, *branches):
+        """ Continues after `branches` (values they left, see `branch`). """
+        branches = [values for values in branches if values is not None]
+        if not branches:
+            self.live = False
+            return
+        changed = dict.fromkeys(v for values in branches for v in values)
+        for variable in changed:
+            value = branches[0].get(variable, variable.value)
+            if any(
+                    not same(values.get(variable, variable.value), value)
+                    for values in branches[1:]
+            ):
+                value = None
+            if not same(value, variable.value):
+                self.trail.append((variable, variable.value))
+                variable.value = value
+
+    # region Definitions
+
+    def visitFunDef(self, node: FunDef):
+        assignments = LoopAssignments()
+        assignments.visit(node.body)
+        self.loops = assignments.loops
+        self.variables.push()
+        for name, _ in node.args:
+            self.variables.declare(name, Variable(None))
+        self.live = True
+        yield node.body
+        self.variables.pop()
+        self.trail.clear()
+
+    # endregion
+
+    # region Statements
+
+    def visitBlock(self, node: Block):
+        self.variables.push()
+        for stmt in node.stmts:
+            if not self.live:
+                break
+            yield stmt
+        self.variables.pop()
+
+    def visitDecl(self, node: Decl):
+        self.current_type = node.type
+        yield from self.visitChildren(node)
+
+    def visitDef(self, node: Def):
+        value = DEFAULTS.get(self.current_type)
+        self.variables.declare(node.name, Variable(value))
+
+    def visitDefAss(self, node: DefAss):
+        value = yield node.expr
+        self.variables.declare(node.name, Variable(value))
+
+    def visitAss(self, node: Ass):
+        value = yield node.expr
+        self.assign(node.name, value)
+
+    def visitIncr(self, node: Incr):
+        variable = self.variables.get(node.name)
+        if variable is not None and variable.value is not None:
+            step = 1 if type(node) is Incr else -1
+            self.assign(node.name, arithmetic(Op.ADD, variable.value, step))
+        else:
+            self.assign(node.name, None)
+
+    visitDecr = visitIncr
+
+    def visitRet(self, node: Ret):
+        yield node.expr
+        self.live = False
+
+    def visitVRet(self, node: VRet):
+        self.live = False
+
+    def visitCond(self, node: Cond):
+        cond = yield node.cond
+        if cond is False:
+            return
+        values = yield from self.branch(node.stmt)
+        if cond is True:
+            self.join(values)
+        else:
+            self.join(values, {})
+
+    def visitCondElse(self, node: CondElse):
+        cond = yield node.cond
+        if cond is not False:
+            values = yield from self.branch(node.stmt)
+        if cond is True:
+            self.join(values)
+            return
+        else_values = yield from self.branch(node.else_stmt)
+        if cond is False:
+            self.join(else_values)
+        else:
+            self.join(values, else_values)
+
+    def visitWhile(self, node: While):
+        # values known at every check of the condition
+        for name in self.loops[node]:
+            self.assign(name, None)
+        cond = yield node.cond
+        if cond is not False:
+            yield from self.branch(node.stmt)
+        self.live = cond is not True
+
+    # endregion
+
+    # region Expressions
+
+    def value(self, node: Expr, value):
+        """ `value` given to `node`, unless ExpressionEvaluator gave one. """
+        if node.expr_value is not None:
+            return node.expr_value
+        if value is not None:
+            node.expr_value = value
+            self.propagated += 1
+        return value
+
+    def visitEId(self, node: EId):
+        variable = self.variables.get(node.name)
+        return self.value(node, variable and variable.value)
+
+    def visitEInt(self, node: EInt):
+        return node.expr_value
+
+    visitETrue = visitEFalse = visitEInt
+
+    def visitEStr(self, node: EStr):
+        return None
+
+    def visitEUnOp(self, node: EUnOp):
+        if node.expr_value is not None:
+            return node.expr_value
+        v = yield node.expr
+        return self.value(node, None if v is None else negation(node.op, v))
+
+    def visitEMulOp(self, node: EMulOp):
+        if node.expr_value is not None:
+            return node.expr_value
+        a1 = yield node.left
+        a2 = yield node.right
+        if a1 is None or a2 is None:
+            return None
+        return self.value(node, arithmetic(node.op, a1, a2))
+
+    visitEAddOp = visitEMulOp
+
+    def visitERelOp(self, node: ERelOp):
+        if node.expr_value is not None:
+            return node.expr_value
+        a1 = yield node.left
+        a2 = yield node.right
+        if a1 is None or a2 is None:
+            return None
+        return self.value(node, relation(node.op, a1, a2))
+
+    def visitEAnd(self, node: EAnd):
+        if node.expr_value is not None:
+            return node.expr_value
+        a1 = yield node.left
+        a2 = yield node.right
+        if a1 is None:
+            return None
+        return self.value(node, a2 if a1 else False)
+
+    def visitEOr(self, node: EOr):
+        if node.expr_value is not None:
+            return node.expr_value
+        a1 = yield node.left
+        a2 = yield node.right
+        if a1 is None:
+            return None
+        return self.value(node, True if a1 else a2)
+
+    # endregion
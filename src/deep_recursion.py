@@ -0,0 +1,56 @@
+"""
+Running recursive code - antlr's parser and visitors of its parse tree -
+on deeply nested programs.
+"""
+import sys
+import threading
+
+
+# stack of the thread running recursive code
+STACK_SIZE = 512 * 1024 * 1024
+
+# the recursion limit is raised in chunks, up to what the stack can hold
+FIRST_LIMIT = 10000
+MAX_LIMIT = 2560000
+
+
+def run_deep(function, *args):
+    """
+    Returns `function(*args)`, run in a thread with a large stack.
+    Whenever the recursion limit is hit, the limit is doubled and
+    `function` is run again (so it must be repeatable), until MAX_LIMIT.
+    """
+    outcome = {}
+
+    def target():
+        old_limit = sys.getrecursionlimit()
+        limit = max(old_limit, FIRST_LIMIT)
+        try:
+            while True:
+                sys.setrecursionlimit(limit)
+                try:
+                    outcome['result'] = function(*args)
+                    return
+                except RecursionError:
+                    if limit >= MAX_LIMIT:
+                        outcome['error'] = RecursionError(
+                            'Program is nested too deeply to be compiled.'
+                        )
+                        return
+                    limit = min(2 * limit, MAX_LIMIT)
+                except BaseException as e:
+                    outcome['error'] = e
+                    return
+        finally:
+            sys.setrecursionlimit(old_limit)
+
+    old_size = threading.stack_size(STACK_SIZE)
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(old_size)
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
@@ -8,12 +8,12 @@ class CompilationError(Exception):
     name = 'Compilation Error'
     msg = ''
 
-    def __init__(self, ctx, msg=''):
-        self.ctx = ctx
+    def __init__(self, node, msg=''):
+        self.node = node
         self.msg = msg
 
     def __str__(self):
-        return f'{self.name} at line {self.ctx.start.line}!\n'\
+        return f'{self.name} at line {self.node.line}!\n'\
                f'{self.msg}'
 
 
@@ -56,17 +56,17 @@ class UnsupportedOperandError(CompilationError):
 class FunctionRedeclarationError(CompilationError):
     name = 'Function Redeclaration Error'
 
-    # def __init__(self, ctx):
-    #     super().__init__(ctx)
-    #     self.msg = f'A function with name {ctx.ID().getText()} is declared.'
+    # def __init__(self, node):
+    #     super().__init__(node)
+    #     self.msg = f'A function with name {node.name} is declared.'
 
 
 class ClassRedeclarationError(CompilationError):
     name = 'Class Redeclaration Error'
 
-    # def __init__(self, ctx):
-    #     super().__init__(ctx)
-    #     self.msg = f'A class with name {ctx.ID().getText()} is declared.'
+    # def __init__(self, node):
+    #     super().__init__(node)
+    #     self.msg = f'A class with name {node.name} is declared.'
 
 
 class VariableRedeclarationError(CompilationError):
@@ -111,3 +111,7 @@ class BadOverrideError(CompilationError):
 
 class ArraysNotImplemented(CompilationError):
     name = "Arrays Not Implemented"
+
+
+class DivisionByZeroError(CompilationError):
+    name = "Division By Zero Error"
@@ -1,7 +1,48 @@
 from functools import wraps
 
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
+from errors import DivisionByZeroError
+from fusion import Analysis
+from latte_ast import * # noqa
+
+
+def wrap(value: int) -> int:
+    """ `value` as a signed 32-bit integer, as the machine computes it. """
+    return (value + 2 ** 31) % 2 ** 32 - 2 ** 31
+
+
+def arithmetic(op: Op, a1, a2):
+    """
+    Value of `a1 op a2`. Division truncates
+    toward zero and the remainder has the sign of the dividend, like
+    x86's idiv. Dividing by 0 gives None.
+    """
+    if op in (Op.DIV, Op.MOD):
+        if a2 == 0:
+            return None
+        quotient = abs(a1) // abs(a2)
+        if (a1 < 0) != (a2 < 0):
+            quotient = -quotient
+        return wrap(quotient if op is Op.DIV else a1 - a2 * quotient)
+    return wrap({
+        Op.ADD: a1 + a2,
+        Op.SUB: a1 - a2,
+        Op.MUL: a1 * a2
+    }[op])
+
+
+def relation(op: Op, a1, a2) -> bool:
+    return {
+        Op.LT: a1 < a2,
+        Op.LE: a1 <= a2,
+        Op.GT: a1 > a2,
+        Op.GE: a1 >= a2,
+        Op.EQ: a1 == a2,
+        Op.NE: a1 != a2
+    }[op]
+
+
+def negation(op: UnOp, value):
+    return wrap(-value) if op is UnOp.NEG else not value
 
 
 def is_variable(*args):
@@ -18,168 +59,106 @@ def register_value(method):
     Used when evaluating constant expressions/
     """
     @wraps(method)
-    def new_method(obj, ctx):
-        val = method(obj, ctx)
-        ctx.expr_value = val
+    def new_method(obj, node):
+        val = method(obj, node)
+        node.expr_value = val
         return val
     return new_method
 
 
-class ExpressionEvaluator(LatteVisitor):
+class ExpressionEvaluator(Analysis):
     """
     A frontend class which eliminates constant expressions.
+    Values are computed from values of subexpressions,
+    once the expression is type-checked.
     """
+    requires = ('ErrorChecker',)
     @register_value
-    def visitEId(self, ctx: LatteParser.EIdContext):
+    def exitEId(self, node: EId):
         return None
 
     @register_value
-    def visitEFunCall(self, ctx: LatteParser.EFunCallContext):
-        self.visitChildren(ctx)
+    def exitEFunCall(self, node: EFunCall):
         return None
 
     @register_value
-    def visitERelOp(self, ctx: LatteParser.ERelOpContext):
-        a1, a2 = self.visit(ctx.expr(0)), self.visit(ctx.expr(1))
-        if is_variable(a1, a2):
+    def exitERelOp(self, node: ERelOp):
+        a1, a2 = node.left.expr_value, node.right.expr_value
+        # strings are compared by address
+        if is_variable(a1, a2) or isinstance(a1, str):
             return None
-        return {
-            '<': a1 < a2,
-            '<=': a1 <= a2,
-            '>': a1 > a2,
-            '>=': a1 >= a2,
-            '==': a1 == a2,
-            '!=': a1 != a2
-        }[self.visit(ctx.relOp())]
+        return relation(node.op, a1, a2)
 
     @register_value
-    def visitETrue(self, ctx: LatteParser.ETrueContext):
+    def exitETrue(self, node: ETrue):
         return True
 
     @register_value
-    def visitECastNull(self, ctx: LatteParser.ECastNullContext):
+    def exitECastNull(self, node: ECastNull):
         return None
 
-    def visitENewArr(self, ctx: LatteParser.ENewArrContext):
-        return super().visitENewArr(ctx)
-
     @register_value
-    def visitEOr(self, ctx: LatteParser.EOrContext):
-        a1, a2 = self.visit(ctx.expr(0)), self.visit(ctx.expr(1))
+    def exitEOr(self, node: EOr):
+        a1, a2 = node.left.expr_value, node.right.expr_value
         return a1 or a2
 
     @register_value
-    def visitEAnd(self, ctx: LatteParser.EAndContext):
-        a1, a2 = self.visit(ctx.expr(0)), self.visit(ctx.expr(1))
+    def exitEAnd(self, node: EAnd):
+        a1, a2 = node.left.expr_value, node.right.expr_value
         return a1 and a2
 
     @register_value
-    def visitEInt(self, ctx: LatteParser.EIntContext):
-        return int(ctx.INT().getText())
+    def exitEInt(self, node: EInt):
+        return node.value
 
     @register_value
-    def visitEUnOp(self, ctx: LatteParser.EUnOpContext):
-        v = self.visit(ctx.expr())
+    def exitEUnOp(self, node: EUnOp):
+        v = node.expr.expr_value
         if is_variable(v):
             return None
-        return {
-            '-': -v,
-            '!': not v
-        }[ctx.unOp().getText()]
+        return negation(node.op, v)
 
     @register_value
-    def visitEStr(self, ctx: LatteParser.EStrContext):
-        return ctx.STR().getText().strip('"')
+    def exitEStr(self, node: EStr):
+        return node.text.strip('"')
 
     @register_value
-    def visitEArrAcc(self, ctx: LatteParser.EArrAccContext):
+    def exitEArrAcc(self, node: EArrAcc):
         return None
 
     @register_value
-    def visitENewObj(self, ctx: LatteParser.ENewObjContext):
+    def exitENewObj(self, node: ENewObj):
         return None
 
     @register_value
-    def visitEMulOp(self, ctx: LatteParser.EMulOpContext):
-        a1, a2 = self.visit(ctx.expr(0)), self.visit(ctx.expr(1))
+    def exitEMulOp(self, node: EMulOp):
+        a1, a2 = node.left.expr_value, node.right.expr_value
         if is_variable(a1, a2):
             return None
-        op = ctx.mulOp().getText()
-        if op == '*':
-            return a1 * a2
-        if a2 == 0:
-            raise ZeroDivisionError(ctx)
-        return {
-            '/': a1 / a2,
-            '%': a1 % a2
-        }[op]
+        if node.op is not Op.MUL and a2 == 0:
+            raise DivisionByZeroError(node, 'Division by a constant 0.')
+        return arithmetic(node.op, a1, a2)
 
     @register_value
-    def visitEAddOp(self, ctx: LatteParser.EAddOpContext):
-        a1, a2 = self.visit(ctx.expr(0)), self.visit(ctx.expr(1))
-        if is_variable(a2, a1):
+    def exitEAddOp(self, node: EAddOp):
+        a1, a2 = node.left.expr_value, node.right.expr_value
+        # a concatenation makes a new string
+        if is_variable(a2, a1) or isinstance(a1, str):
             return None
-        if ctx.addOp().getText() == '+':
-            return a1 + a2
-        else:
-            return a1 - a2
+        return arithmetic(node.op, a1, a2)
 
     @register_value
-    def visitEParen(self, ctx: LatteParser.EParenContext):
-        return self.visit(ctx.expr())
-
-    @register_value
-    def visitEFalse(self, ctx: LatteParser.EFalseContext):
+    def exitEFalse(self, node: EFalse):
         return False
 
     @register_value
-    def visitEMthdCall(self, ctx: LatteParser.EMthdCallContext):
-        self.visitChildren(ctx)
+    def exitEMthdCall(self, node: EMthdCall):
         return None
 
     @register_value
-    def visitESelf(self, ctx: LatteParser.ESelfContext):
+    def exitESelf(self, node: ESelf):
         return None
 
     @register_value
-    def visitEAttr(self, ctx: LatteParser.EAttrContext):
+    def exitEAttr(self, node: EAttr):
         return None
-
-    def visitMinus(self, ctx: LatteParser.MinusContext):
-        return '-'
-
-    def visitNeg(self, ctx: LatteParser.NegContext):
-        return '!'
-
-    def visitAdd(self, ctx: LatteParser.AddContext):
-        return '+'
-
-    def visitSub(self, ctx: LatteParser.SubContext):
-        return '-'
-
-    def visitMul(self, ctx: LatteParser.MulContext):
-        return '*'
-
-    def visitDiv(self, ctx: LatteParser.DivContext):
-        return '/'
-
-    def visitMod(self, ctx: LatteParser.ModContext):
-        return '%'
-
-    def visitLt(self, ctx: LatteParser.LtContext):
-        return '<'
-
-    def visitLe(self, ctx: LatteParser.LeContext):
-        return '<='
-
-    def visitGt(self, ctx: LatteParser.GtContext):
-        return '>'
-
-    def visitGe(self, ctx: LatteParser.GeContext):
-        return '>='
-
-    def visitEq(self, ctx: LatteParser.EqContext):
-        return '=='
-
-    def visitNeq(self, ctx: LatteParser.NeqContext):
-        return '!='
@@ -0,0 +1,145 @@
+"""
+Hand-written lexer of Latte, an alternative to antlr's generated one.
+
+It follows the lexer rules of Latte.g4 and produces the same tokens
+(types, channels, positions), so they can be parsed by LatteParser.
+`benchmarks/lexer_conformance.py` compares both lexers on fuzzed sources.
+"""
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import CommonToken, Token
+
+from atn_cache import import_recognizers
+
+
+LatteLexer, _ = import_recognizers()
+
+# keywords and operators by their text (antlr's implicit tokens)
+LITERALS = {
+    name[1:-1]: token_type
+    for token_type, name in enumerate(LatteLexer.literalNames)
+    if name.startswith("'")
+}
+
+_LETTER = 'A-Za-z_\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u00FF'
+_OPERATORS = sorted(
+    (text for text in LITERALS if not text[0].isalpha()),
+    key=len, reverse=True
+)
+
+# alternatives are tried in order, so longer operators come first
+TOKEN = re.compile('|'.join([
+    r'(?P<ws>[ \r\t\n]+)',
+    r'(?P<comment>(?:#|//)[^\r\n]*)',
+    r'(?P<multicomment>/\*.*?\*/)',
+    rf'(?P<id>[{_LETTER}][{_LETTER}0-9]*)',
+    r'(?P<int>[0-9]+)',
+    r'(?P<str>"(?:[^"\\]|\\[tnr"\\])*")',
+    '(?P<op>' + '|'.join(map(re.escape, _OPERATORS)) + ')',
+]), re.DOTALL)
+STR_PREFIX = re.compile(r'"(?:[^"\\]|\\[tnr"\\])*')
+
+HIDDEN = Token.HIDDEN_CHANNEL
+
+
+class FastLexer(Recognizer):
+    """
+    Token source for CommonTokenStream. Recognition errors are reported
+    to the error listeners exactly as antlr's lexer does: the longest
+    prefix that cannot start a token is reported and skipped, up to and
+    including the character which failed to match.
+    """
+    def __init__(self, input_stream):
+        super().__init__()
+        self._input = input_stream
+        self._factory = CommonTokenFactory.DEFAULT
+        self.text = input_stream.strdata
+        self.pos = 0
+        self.line = 1
+        self.column = 0
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    def getInputStream(self):
+        return self._input
+
+    def getSourceName(self) -> str:
+        return self._input.getSourceName()
+
+    def _advance(self, start: int, end: int):
+        """ Moves past text[start:end], which may contain newlines. """
+        lines = self.text.count('\n', start, end)
+        if lines:
+            self.line += lines
+            self.column = end - self.text.rfind('\n', start, end) - 1
+        else:
+            self.column += end - start
+        self.pos = end
+
+    def _token(self, token_type: int, channel: int, start: int, end: int):
+        token = CommonToken(
+            (self, self._input), token_type, channel, start, end - 1
+        )
+        token.text = self.text[start:end]
+        return token
+
+    def nextToken(self) -> Token:
+        text, match = self.text, TOKEN.match
+        while self.pos < len(text):
+            start = self.pos
+            m = match(text, start)
+            if m is None:
+                self._recognition_error(start)
+                continue
+            kind, end = m.lastgroup, m.end()
+            if kind == 'ws':
+                self._advance(start, end)
+                continue
+            if kind == 'id':
+                token_type = LITERALS.get(m.group(), LatteLexer.ID)
+                token = self._token(token_type, 0, start, end)
+            elif kind == 'op':
+                token = self._token(LITERALS[m.group()], 0, start, end)
+            elif kind == 'int':
+                token = self._token(LatteLexer.INT, 0, start, end)
+            elif kind == 'str':
+                token = self._token(LatteLexer.STR, 0, start, end)
+            elif kind == 'comment':
+                token = self._token(LatteLexer.COMMENT, HIDDEN, start, end)
+            else:
+                token = self._token(
+                    LatteLexer.MULTICOMMENT, HIDDEN, start, end
+                )
+            self._advance(start, end)
+            return token
+
+        token = self._token(Token.EOF, 0, self.pos, self.pos)
+        token.text = '<EOF>'
+        return token
+
+    def _recognition_error(self, start: int):
+        """ Reports and skips the erroneous text at `start`. """
+        text = self.text
+        if text[start] == '"':
+            # a string with a bad escape sequence or unterminated
+            failed = STR_PREFIX.match(text, start).end()
+            if failed < len(text) and text[failed] == '\\':
+                failed += 1
+        elif text[start] in '&|':
+            # only && and || are tokens
+            failed = start + 1
+        else:
+            failed = start
+        end = min(failed + 1, len(text))
+
+        display = text[start:end].replace('\n', '\\n') \
+            .replace('\t', '\\t').replace('\r', '\\r')
+        self.getErrorListenerDispatch().syntaxError(
+            self, None, self.line, self.column,
+            f"token recognition error at: '{display}'", None
+        )
+        self._advance(start, end)
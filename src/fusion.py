@@ -0,0 +1,92 @@
+"""
+Fusion of analyses - passes which only look at the AST (and annotate it)
+are run together, in a single traversal.
+"""
+from latte_ast import NODES, Node
+
+
+class Analysis:
+    """
+    A pass made of hooks: `enter<Node>` is called before children
+    of the node are visited, `exit<Node>` after them.
+    `requires` names analyses whose hooks must run earlier on each node.
+    """
+    requires = ()
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    def visit(self, node: Node):
+        """ Runs the analysis alone on the subtree of `node`. """
+        FusedTraversal([self]).run(node)
+
+
+def order_analyses(analyses: list) -> list:
+    """
+    Orders analyses so that each comes after the ones it requires
+    (and otherwise keeps the given order).
+    """
+    names = {a.name for a in analyses}
+    ordered, done = [], set()
+    pending = list(analyses)
+    while pending:
+        for analysis in pending:
+            missing = [
+                r for r in analysis.requires if r in names and r not in done
+            ]
+            if not missing:
+                break
+        else:
+            raise ValueError(
+                'Cyclic requirements between analyses: '
+                + ', '.join(a.name for a in pending)
+            )
+        pending.remove(analysis)
+        ordered.append(analysis)
+        done.add(analysis.name)
+    return ordered
+
+
+class FusedTraversal:
+    """
+    Visits the AST once, calling hooks of all analyses on every node.
+    Hooks are looked up once per node type, not once per node.
+    """
+    def __init__(self, analyses: list):
+        self.analyses = order_analyses(analyses)
+        self.enter, self.exit = {}, {}
+        for node_type in NODES:
+            name = node_type.__name__
+            self.enter[node_type] = self._hooks(f'enter{name}')
+            self.exit[node_type] = self._hooks(f'exit{name}')
+
+    @property
+    def name(self) -> str:
+        return '+'.join(a.name for a in self.analyses)
+
+    def _hooks(self, method: str) -> tuple:
+        return tuple(
+            getattr(a, method) for a in self.analyses if hasattr(a, method)
+        )
+
+    def run(self, node: Node):
+        self.walk(node)
+
+    def walk(self, node: Node):
+        """ Depth-first traversal with an explicit stack (of iterators). """
+        enter, exit = self.enter, self.exit
+        for hook in enter[type(node)]:
+            hook(node)
+        stack = [(node, node.children())]
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                for hook in exit[type(parent)]:
+                    hook(parent)
+                continue
+            for hook in enter[type(child)]:
+                hook(child)
+            stack.append((child, child.children()))
@@ -0,0 +1,133 @@
+"""
+Incremental compilation - generated code of every function is cached
+separately, so that after an edit only the changed functions are
+checked and generated again.
+"""
+import hashlib
+import json
+
+from assembly_writer import AssemblyWriter
+from compilation_cache import CompilationCache, compiler_version
+from peephole_optimizer import PeepholeOptimizer
+from string_finder import StringFinder
+from latte_ast import ClassDef, FunDef, Program
+
+from antlr4gen.LatteParser import LatteParser
+
+
+def find_functions(program: Program):
+    """ Yields (function, class or None, list holding it) in source order. """
+    for top_def in program.defs:
+        if isinstance(top_def, FunDef):
+            yield top_def, None, program.defs
+        elif isinstance(top_def, ClassDef):
+            for fun in top_def.methods:
+                yield fun, top_def.name, top_def.methods
+
+
+def function_tokens(program: Program, fun: FunDef) -> list:
+    """ Tokens of the function, without comments. """
+    start, stop = fun.token_span
+    return [t for t in program.tokens[start:stop + 1] if t.channel == 0]
+
+
+class IncrementalBuild:
+    """
+    Reuses cached code of functions which did not change.
+    The key of a function combines its tokens with everything
+    it depends on: layouts and vtables of all classes
+    and headers of global functions it may call.
+    """
+    def __init__(
+            self, cache: CompilationCache, program: Program,
+            state: tuple, flags: dict
+    ):
+        self.cache = cache
+        self.program = program
+        self.functions = list(find_functions(program))
+        classes, methods, attrs, vtables = state
+        self.global_functions = methods[None]
+        self.common = json.dumps([
+            compiler_version(),
+            flags,
+            [
+                [cls, classes[cls], methods[cls], list(attrs[cls].items()),
+                 vtables[cls]]
+                for cls in classes
+            ]
+        ])
+        self.keys = [self.key(fun, obj) for fun, obj, _ in self.functions]
+        self.fragments = {}
+        self.writers = {}
+        self.fresh = []
+
+    def key(self, fun: FunDef, obj: str) -> str:
+        tokens = function_tokens(self.program, fun)
+        called = sorted({
+            t.text for t in tokens if t.type == LatteParser.ID
+        })
+        digest = hashlib.sha256()
+        digest.update(self.common.encode())
+        digest.update(json.dumps([
+            obj,
+            [t.text for t in tokens],
+            [self.global_functions.get(name) for name in called]
+        ]).encode())
+        return digest.hexdigest()
+
+    def prune(self):
+        """
+        Removes functions with cached code from the program,
+        so that next passes see only the changed ones.
+        """
+        for key, (fun, obj, siblings) in zip(self.keys, self.functions):
+            fragment = self.cache.fetch_fragment(key)
+            if fragment is None:
+                self.fresh.append((key, fun, obj))
+                continue
+            self.fragments[key] = fragment
+            siblings.remove(fun)
+        self.cache.count_fragments(len(self.fragments), len(self.fresh))
+
+    def strings(self, fresh_strings: list) -> list:
+        """ Strings of the whole program (each once). """
+        strings = list(fresh_strings)
+        for fragment in self.fragments.values():
+            strings += fragment['strings']
+        return list(dict.fromkeys(strings))
+
+    def generate(self, code_gen):
+        """ Generates code of changed functions, each by its own writer. """
+        code_gen.prepare_stable_labels()
+        for key, fun, obj in self.fresh:
+            self.writers[key] = code_gen.generate_function(fun, obj)
+
+    def optimize(self):
+        for writer in self.writers.values():
+            PeepholeOptimizer(writer).optimize()
+
+    def instructions(self) -> int:
+        return sum(len(w.instructions) for w in self.writers.values())
+
+    def stitch(self, code_gen) -> AssemblyWriter:
+        """
+        Stores fresh functions in the cache and joins code of all functions
+        (with data section for the whole program).
+        """
+        for key, fun, _ in self.fresh:
+            writer = self.writers[key]
+            string_finder = StringFinder()
+            string_finder.visit(fun)
+            self.fragments[key] = {
+                'code': list(zip(writer.instructions, writer.comments)),
+                'strings': list(dict.fromkeys(string_finder.get_strings()))
+            }
+            self.cache.store_fragment(key, self.fragments[key])
+        writer = AssemblyWriter()
+        for key in self.keys:
+            for instruction, comment in self.fragments[key]['code']:
+                writer.instructions.append(instruction)
+                writer.comments.append(comment)
+        # cached functions may use the empty string
+        code_gen.gen_sections(writer, True)
+        return writer
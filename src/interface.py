@@ -0,0 +1,141 @@
+"""
+Interface files (.lti) of separately compiled modules.
+"""
+import json
+import os
+
+from runtime import RUNTIME_FUNCTIONS
+
+
+class ModuleInterface:
+    """
+    Declarations a module exports: class hierarchy, field layouts,
+    signatures of functions and methods and vtables.
+    Dependent modules load it instead of the module's source.
+    """
+    def __init__(
+            self, classes: dict = None, functions: dict = None,
+            methods: dict = None, attrs: dict = None, vtables: dict = None
+    ):
+        self.classes = classes or {}
+        self.functions = functions or {}
+        self.methods = methods or {}
+        self.attrs = attrs or {}
+        self.vtables = vtables or {}
+
+    @classmethod
+    def from_state(cls, state: tuple, imports: list):
+        """ Part of the (loaded) state declared by the module itself. """
+        classes, methods, attrs, vtables = state
+        imported_classes, imported_functions = set(), set(RUNTIME_FUNCTIONS)
+        for interface in imports:
+            imported_classes.update(interface.classes)
+            imported_functions.update(interface.functions)
+        own = [c for c in classes if c not in imported_classes]
+        return cls(
+            {c: classes[c] for c in own},
+            {
+                name: header for name, header in methods[None].items()
+                if name not in imported_functions
+            },
+            {c: methods[c] for c in own},
+            {c: attrs[c] for c in own},
+            {c: vtables[c] for c in own}
+        )
+
+    def symbols(self) -> list:
+        """ Assembly symbols defined by the module. """
+        symbols = list(self.functions)
+        for cls in self.classes:
+            symbols += [f'{cls}__{method}' for method in self.methods[cls]]
+            if self.vtables[cls]:
+                symbols.append(f'{cls}.vtable')
+        return symbols
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'classes': self.classes,
+            'functions': self.functions,
+            'methods': self.methods,
+            'attrs': {c: list(a.items()) for c, a in self.attrs.items()},
+            'vtables': self.vtables
+        })
+
+    @classmethod
+    def from_json(cls, text: str):
+        data = json.loads(text)
+
+        def header(ret_type, args):
+            return ret_type, [tuple(arg) for arg in args]
+
+        return cls(
+            data['classes'],
+            {f: header(*h) for f, h in data['functions'].items()},
+            {
+                c: {m: header(*h) for m, h in methods.items()}
+                for c, methods in data['methods'].items()
+            },
+            {c: dict(attrs) for c, attrs in data['attrs'].items()},
+            {
+                c: [tuple(entry) for entry in vtable]
+                for c, vtable in data['vtables'].items()
+            }
+        )
+
+    def save(self, path: str):
+        """
+        Writes the interface, unless it did not change - keeping its mtime,
+        so that dependent modules are not rebuilt after changes
+        which did not touch any declaration.
+        """
+        text = self.to_json()
+        if os.path.exists(path):
+            with open(path) as f:
+                if f.read() == text:
+                    return
+        with open(path, 'w') as f:
+            f.write(text)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path) as f:
+            return cls.from_json(f.read())
+
+
+def load_interfaces(paths: list) -> list:
+    """ Reads interfaces of used modules, checking they are consistent. """
+    interfaces = [ModuleInterface.load(path) for path in paths]
+    classes, functions = {}, {}
+    for path, interface in zip(paths, interfaces):
+        for name in interface.classes:
+            if name in classes:
+                raise ValueError(
+                    f'Class "{name}" is declared by both {classes[name]} '
+                    f'and {path}.'
+                )
+            classes[name] = path
+        for name in interface.functions:
+            if name in functions:
+                raise ValueError(
+                    f'Function "{name}" is declared by both {functions[name]} '
+                    f'and {path}.'
+                )
+            functions[name] = path
+    for interface in interfaces:
+        for name, parent in interface.classes.items():
+            if parent is not None and parent not in classes:
+                raise ValueError(
+                    f'Class "{name}" extends "{parent}", '
+                    f'whose interface was not given.'
+                )
+    return interfaces
+
+
+class Module:
+    """
+    A separately compiled module - interfaces of modules it uses
+    and (once its declarations are loaded) its own interface.
+    """
+    def __init__(self, interface_paths: list = ()):
+        self.imports = load_interfaces(list(interface_paths))
+        self.exports = None
@@ -0,0 +1,319 @@
+"""
+Three-address intermediate representation, between the AST and assembly.
+
+A function is a control-flow graph of basic blocks, each a list of
+instructions ending with a terminator (Jump, Branch or Return).
+Instructions compute at most one value, into a temporary (a virtual
+register), from operands: temporaries, integer constants, addresses of
+string literals and vtables. Variables of the source are temporaries
+assigned more than once, until the function is put in SSA form
+(see ssa.py), where every temporary is assigned once and values meet
+in phi instructions.
+"""
+from latte_ast import Op, UnOp
+
+
+class Temp:
+    """ A virtual register, `name` is the variable it holds (if any). """
+    __slots__ = ('id', 'name')
+
+    def __init__(self, id: int, name: str = None):
+        self.id = id
+        self.name = name
+
+    def __repr__(self):
+        if self.name:
+            return f'%{self.name}.{self.id}'
+        return f'%t{self.id}'
+
+
+class Str:
+    """
+    Address of a string literal, `text` as in the source (with quotes).
+    The empty string given to uninitialized variables has no text.
+    """
+    __slots__ = ('text',)
+
+    def __init__(self, text: str = None):
+        self.text = text
+
+    def __eq__(self, other):
+        return isinstance(other, Str) and other.text == self.text
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __repr__(self):
+        return '""' if self.text is None else self.text
+
+
+class VTable:
+    """ Address of the vtable of class `cls`. """
+    __slots__ = ('cls',)
+
+    def __init__(self, cls: str):
+        self.cls = cls
+
+    def __eq__(self, other):
+        return isinstance(other, VTable) and other.cls == self.cls
+
+    def __hash__(self):
+        return hash(self.cls)
+
+    def __repr__(self):
+        return f'vtable({self.cls})'
+
+
+# region Instructions
+
+class Instr:
+    """
+    An instruction computing `dest` (a Temp or None) from operands `args`.
+    """
+    __slots__ = ('dest', 'args')
+
+    def __init__(self, dest: Temp, args: list):
+        self.dest = dest
+        self.args = args
+
+    def temps(self) -> list:
+        """ Temporaries read by the instruction. """
+        return [a for a in self.args if type(a) is Temp]
+
+    def _text(self) -> str:
+        raise NotImplementedError
+
+    def __repr__(self):
+        text = self._text()
+        return f'{self.dest!r} = {text}' if self.dest else text
+
+
+class Copy(Instr):
+    __slots__ = ()
+
+    def __init__(self, dest: Temp, src):
+        super().__init__(dest, [src])
+
+    def _text(self):
+        return f'copy {self.args[0]!r}'
+
+
+class Binary(Instr):
+    """ Arithmetic (wrapping at 32 bits) or comparison (giving 0 or 1). """
+    __slots__ = ('op',)
+
+    def __init__(self, dest: Temp, op: Op, left, right):
+        super().__init__(dest, [left, right])
+        self.op = op
+
+    def _text(self):
+        return f'{self.op.name.lower()} {self.args[0]!r}, {self.args[1]!r}'
+
+
+class Unary(Instr):
+    __slots__ = ('op',)
+
+    def __init__(self, dest: Temp, op: UnOp, src):
+        super().__init__(dest, [src])
+        self.op = op
+
+    def _text(self):
+        return f'{self.op.name.lower()} {self.args[0]!r}'
+
+
+class Load(Instr):
+    """ Reads the word at `offset` bytes past the address `base`. """
+    __slots__ = ('offset',)
+
+    def __init__(self, dest: Temp, base, offset: int):
+        super().__init__(dest, [base])
+        self.offset = offset
+
+    def _text(self):
+        return f'load [{self.args[0]!r} + {self.offset}]'
+
+
+class Store(Instr):
+    """ Writes `value` at `offset` bytes past the address `base`. """
+    __slots__ = ('offset',)
+
+    def __init__(self, base, offset: int, value):
+        super().__init__(None, [base, value])
+        self.offset = offset
+
+    def _text(self):
+        base, value = self.args
+        return f'store [{base!r} + {self.offset}], {value!r}'
+
+
+class Call(Instr):
+    """
+    Call of `function` (a symbol) or, when it is None, of the address
+    given as the first of `args`; arguments follow.
+    """
+    __slots__ = ('function',)
+
+    def __init__(self, dest: Temp, function: str, args: list):
+        super().__init__(dest, args)
+        self.function = function
+
+    @property
+    def arguments(self) -> list:
+        return self.args if self.function else self.args[1:]
+
+    def _text(self):
+        function = self.function or f'*{self.args[0]!r}'
+        arguments = ', '.join(map(repr, self.arguments))
+        return f'call {function}({arguments})'
+
+
+class Phi(Instr):
+    """ The value which came from the predecessor block that was left. """
+    __slots__ = ('blocks',)
+
+    def __init__(self, dest: Temp, blocks: list, args: list):
+        super().__init__(dest, args)
+        self.blocks = blocks
+
+    def _text(self):
+        incoming = ', '.join(
+            f'[{block.label}: {value!r}]'
+            for block, value in zip(self.blocks, self.args)
+        )
+        return f'phi {incoming}'
+
+
+class Jump(Instr):
+    __slots__ = ('target',)
+
+    def __init__(self, target):
+        super().__init__(None, [])
+        self.target = target
+
+    def successors(self) -> list:
+        return [self.target]
+
+    def _text(self):
+        return f'jump {self.target.label}'
+
+
+class Branch(Instr):
+    """ Jumps to `if_true` when `cond` is not 0, to `if_false` otherwise. """
+    __slots__ = ('if_true', 'if_false')
+
+    def __init__(self, cond, if_true, if_false):
+        super().__init__(None, [cond])
+        self.if_true = if_true
+        self.if_false = if_false
+
+    def successors(self) -> list:
+        return [self.if_true, self.if_false]
+
+    def _text(self):
+        return f'branch {self.args[0]!r}, {self.if_true.label}, ' \
+               f'{self.if_false.label}'
+
+
+class Return(Instr):
+    __slots__ = ()
+
+    def __init__(self, value=None):
+        super().__init__(None, [] if value is None else [value])
+
+    def successors(self) -> list:
+        return []
+
+    def _text(self):
+        return f'return {self.args[0]!r}' if self.args else 'return'
+
+
+TERMINATORS = (Jump, Branch, Return)
+
+# endregion
+
+
+class Block:
+    """ A basic block, `instrs` end with a terminator once it is built. """
+    __slots__ = ('index', 'instrs')
+
+    def __init__(self, index: int):
+        self.index = index
+        self.instrs = []
+
+    @property
+    def label(self) -> str:
+        return f'b{self.index}'
+
+    @property
+    def terminated(self) -> bool:
+        return bool(self.instrs) and isinstance(self.instrs[-1], TERMINATORS)
+
+    def successors(self) -> list:
+        return self.instrs[-1].successors()
+
+    def phis(self) -> list:
+        phis = []
+        for instr in self.instrs:
+            if type(instr) is not Phi:
+                break
+            phis.append(instr)
+        return phis
+
+    def __repr__(self):
+        return self.label
+
+
+class Function:
+    """
+    A function (or method, with `self` as the first of `params`) named
+    by its assembly symbol. The first of `blocks` is the entry, blocks
+    are emitted in their order.
+    """
+    def __init__(self, name: str, params: list = ()):
+        self.name = name
+        self.params = list(params)
+        self.blocks = []
+        # temporary -> register holding it (see register_allocator.py),
+        # others live on the stack
+        self.registers = {}
+        self._temps = 0
+        self._blocks = 0
+
+    def new_temp(self, name: str = None) -> Temp:
+        self._temps += 1
+        return Temp(self._temps, name)
+
+    def new_block(self) -> Block:
+        """ A block, which is not part of the function until placed. """
+        self._blocks += 1
+        return Block(self._blocks - 1)
+
+    def predecessors(self) -> dict:
+        """ Block -> list of its predecessors (each once, in order). """
+        preds = {block: [] for block in self.blocks}
+        for block in self.blocks:
+            for succ in dict.fromkeys(block.successors()):
+                preds[succ].append(block)
+        return preds
+
+    def remove_unreachable(self):
+        reachable, stack = {self.blocks[0]}, [self.blocks[0]]
+        while stack:
+            for succ in stack.pop().successors():
+                if succ not in reachable:
+                    reachable.add(succ)
+                    stack.append(succ)
+        self.blocks = [b for b in self.blocks if b in reachable]
+
+    def format(self) -> str:
+        params = ', '.join(map(repr, self.params))
+        lines = [f'function {self.name}({params})']
+        for block in self.blocks:
+            lines.append(f'{block.label}:')
+            lines += [f'    {instr!r}' for instr in block.instrs]
+        return '\n'.join(lines)
+
+
+def format_functions(functions: list) -> str:
+    """ Text of the IR (see --emit-ir). """
+    return '\n\n'.join(fun.format() for fun in functions) + '\n'
@@ -0,0 +1,301 @@
+"""
+Emission of x86 assembly from IR functions (see ir.py), which must not
+hold phis (see ssa.destruct). Temporaries live in registers given to them
+by the register allocator (see register_allocator.py), the rest in stack
+slots of the function's frame - parameters in slots of the caller's
+pushes. EAX is the scratch register.
+"""
+from assembly_generator import AssemblyGenerator
+from assembly_writer import AssemblyWriter
+from ir import (
+    Binary, Branch, Call, Copy, Function, Jump, Load, Phi, Return, Store, Str,
+    Temp, Unary, VTable
+)
+from latte_ast import Op, UnOp
+from register_allocator import CALLEE_SAVED
+
+# condition codes of relations, and of their negations
+CONDITIONS = {
+    Op.LT: ('l', 'ge'),
+    Op.LE: ('le', 'g'),
+    Op.GT: ('g', 'le'),
+    Op.GE: ('ge', 'l'),
+    Op.EQ: ('e', 'ne'),
+    Op.NE: ('ne', 'e'),
+}
+ARITHMETIC = {Op.ADD: 'add', Op.SUB: 'sub', Op.MUL: 'imul'}
+
+
+class IREmitter:
+    """
+    Generates code of IR `functions`, using labels of data of `code_gen`
+    (which needs stable labels), each function by a writer of its own.
+    """
+    def __init__(self, code_gen: AssemblyGenerator):
+        self.code_gen = code_gen
+        self.writer = None
+        # temporary -> register or stack slot holding it
+        self.locations = {}
+        # callee-saved registers used by the function -> their slots
+        self.saved = {}
+        self.next_block = None
+        # compare of the branch ending the current block, if fused into it
+        self.fused = None
+
+    def emit(self, functions: list) -> AssemblyWriter:
+        """ Code of the whole program, with text and data sections. """
+        writer = AssemblyWriter()
+        for fun in functions:
+            code = self.emit_function(fun)
+            writer.instructions += code.instructions
+            writer.comments += code.comments
+        self.code_gen.gen_sections(writer, self.code_gen.empty_string_used)
+        return writer
+
+    def add(self, inst: str, cmt: str = ''):
+        self.writer.add(inst, cmt)
+
+    def label(self, block) -> str:
+        return f'{self.writer.namespace}.{block.label}'
+
+    def operand(self, value) -> str:
+        """ Operand of an instruction holding `value`. """
+        if type(value) is Temp:
+            return self.locations[value]
+        if type(value) is Str:
+            if value.text is None:
+                self.code_gen.empty_string_used = True
+                return self.code_gen.empty_string_label
+            return self.code_gen.labels[value.text]
+        if type(value) is VTable:
+            return self.code_gen.labels[value.cls]
+        return str(value)
+
+    def in_register(self, value) -> bool:
+        return type(value) is Temp and self.locations[value][0] != '['
+
+    def in_memory(self, value) -> bool:
+        return type(value) is Temp and self.locations[value][0] == '['
+
+    def move(self, target: str, value):
+        """ Copies `value` to `target` (a register or a stack slot). """
+        source = self.operand(value)
+        if source == target:
+            return
+        if target[0] == '[' and self.in_memory(value):
+            self.add(f'mov dword EAX, {source}')
+            source = 'EAX'
+        self.add(f'mov dword {target}, {source}')
+
+    def load(self, register: str, value):
+        self.move(register, value)
+
+    def store(self, temp: Temp, register: str = 'EAX'):
+        if self.operand(temp) != register:
+            self.add(f'mov dword {self.operand(temp)}, {register}')
+
+    def register_of(self, value) -> str:
+        """ Register holding `value`, loaded into EAX if need be. """
+        if self.in_register(value):
+            return self.operand(value)
+        self.load('EAX', value)
+        return 'EAX'
+
+    # region Functions
+
+    def emit_function(self, fun: Function) -> AssemblyWriter:
+        self.writer = AssemblyWriter(namespace=fun.name)
+        self.locations = {
+            param: f'[EBP + {8 + 4 * i}]' for i, param in enumerate(fun.params)
+        }
+        registers = fun.registers
+        saved = [r for r in CALLEE_SAVED if r in registers.values()]
+        frame = 4 * len(saved)
+        self.saved = {
+            register: f'[EBP + {-4 - 4 * i}]'
+            for i, register in enumerate(saved)
+        }
+        uses = {}
+        for block in fun.blocks:
+            for instr in block.instrs:
+                if type(instr) is Phi:
+                    raise ValueError(f'phi left in {fun.name}: {instr!r}')
+                for temp in instr.temps():
+                    uses[temp] = uses.get(temp, 0) + 1
+                temp = instr.dest
+                if temp is None or temp in self.locations:
+                    continue
+                if temp in registers:
+                    self.locations[temp] = registers[temp]
+                else:
+                    frame += 4
+                    self.locations[temp] = f'[EBP + {-frame}]'
+
+        self.writer.putl(fun.name)
+        self.add('push EBP')
+        self.add('mov EBP, ESP')
+        if frame:
+            self.add(f'sub dword ESP, {frame}', 'temporaries')
+        for register, slot in self.saved.items():
+            self.add(f'mov dword {slot}, {register}', 'callee-saved')
+        for param in fun.params:
+            if param in registers:
+                self.add(
+                    f'mov dword {registers[param]}, {self.locations[param]}',
+                    f'parameter {param!r}'
+                )
+                self.locations[param] = registers[param]
+        for i, block in enumerate(fun.blocks):
+            if i:
+                self.writer.putl(self.label(block))
+            self.next_block = fun.blocks[i + 1] if i + 1 < len(fun.blocks) \
+                else None
+            self.fused = self.fusable(block, uses)
+            for instr in block.instrs:
+                getattr(self, f'emit{type(instr).__name__}')(instr)
+        return self.writer
+
+    @staticmethod
+    def fusable(block, uses: dict):
+        """
+        Comparison right before the branch ending `block` which only
+        the branch reads - it sets flags for a conditional jump.
+        """
+        if len(block.instrs) < 2:
+            return None
+        branch, compare = block.instrs[-1], block.instrs[-2]
+        if type(branch) is not Branch or type(compare) is not Binary:
+            return None
+        if compare.op not in CONDITIONS or branch.args[0] is not compare.dest:
+            return None
+        return compare if uses[compare.dest] == 1 else None
+
+    # endregion
+
+    # region Instructions
+
+    def emitCopy(self, instr: Copy):
+        self.move(self.operand(instr.dest), instr.args[0])
+
+    def emitBinary(self, instr: Binary):
+        left, right = instr.args
+        op = instr.op
+        if op in CONDITIONS:
+            register = self.register_of(left)
+            self.add(f'cmp {register}, {self.operand(right)}', repr(instr))
+            if instr is self.fused:
+                return
+            self.add(f'set{CONDITIONS[op][0]} AL')
+            self.add('movzx EAX, AL')
+            self.store(instr.dest)
+        elif op in ARITHMETIC:
+            # computed in the register of the result, if it has one
+            target = self.operand(instr.dest)
+            if not self.in_register(instr.dest) or \
+                    self.operand(right) == target:
+                target = 'EAX'
+            self.load(target, left)
+            if op is Op.MUL and type(right) is int:
+                self.add(f'imul {target}, {target}, {right}', repr(instr))
+            else:
+                self.add(
+                    f'{ARITHMETIC[op]} {target}, {self.operand(right)}',
+                    repr(instr)
+                )
+            self.store(instr.dest, target)
+        else:
+            # division clobbers EDX (and ECX), see register_allocator.py
+            self.load('EAX', left)
+            if self.in_memory(right):
+                divisor = f'dword {self.operand(right)}'
+            elif self.in_register(right) and self.operand(right) != 'EDX':
+                divisor = self.operand(right)
+            else:
+                self.load('ECX', right)
+                divisor = 'ECX'
+            self.add('cdq', repr(instr))
+            self.add(f'idiv {divisor}')
+            self.store(instr.dest, 'EDX' if op is Op.MOD else 'EAX')
+
+    def emitUnary(self, instr: Unary):
+        target = self.operand(instr.dest)
+        if not self.in_register(instr.dest):
+            target = 'EAX'
+        self.load(target, instr.args[0])
+        if instr.op is UnOp.NEG:
+            self.add(f'neg {target}', repr(instr))
+        else:
+            self.add(f'xor {target}, 1', repr(instr))
+        self.store(instr.dest, target)
+
+    def emitLoad(self, instr: Load):
+        base = self.register_of(instr.args[0])
+        target = self.operand(instr.dest)
+        if not self.in_register(instr.dest):
+            target = 'EAX'
+        self.add(f'mov {target}, [{base} + {instr.offset}]', repr(instr))
+        self.store(instr.dest, target)
+
+    def emitStore(self, instr: Store):
+        base, value = instr.args
+        if self.in_memory(value):
+            if not self.in_register(base):
+                # no register is free for the value, it waits on the stack
+                self.add(f'push dword {self.operand(value)}')
+                self.load('EAX', base)
+                self.add(f'pop dword [EAX + {instr.offset}]', repr(instr))
+                return
+            self.load('EAX', value)
+            value = 'EAX'
+        else:
+            value = self.operand(value)
+        base = self.register_of(base)
+        self.add(
+            f'mov dword [{base} + {instr.offset}], {value}', repr(instr)
+        )
+
+    def emitCall(self, instr: Call):
+        arguments = instr.arguments
+        for arg in reversed(arguments):
+            if type(arg) in (Str, VTable):
+                # addresses of data are pushed from a register
+                self.load('EAX', arg)
+                self.add('push EAX')
+            else:
+                self.add(f'push dword {self.operand(arg)}')
+        if instr.function:
+            self.add(f'call {instr.function}', repr(instr))
+        else:
+            self.add(f'call {self.register_of(instr.args[0])}', repr(instr))
+        if arguments:
+            self.add(f'add ESP, {4 * len(arguments)}', 'clean stack')
+        if instr.dest is not None:
+            self.store(instr.dest)
+
+    def emitJump(self, instr: Jump):
+        if instr.target is not self.next_block:
+            self.add(f'jmp {self.label(instr.target)}')
+
+    def emitBranch(self, instr: Branch):
+        if self.fused:
+            condition, negation = CONDITIONS[self.fused.op]
+        else:
+            register = self.register_of(instr.args[0])
+            self.add(f'cmp {register}, 0', repr(instr))
+            condition, negation = 'ne', 'e'
+        if instr.if_true is self.next_block:
+            self.add(f'j{negation} {self.label(instr.if_false)}')
+            return
+        self.add(f'j{condition} {self.label(instr.if_true)}')
+        if instr.if_false is not self.next_block:
+            self.add(f'jmp {self.label(instr.if_false)}')
+
+    def emitReturn(self, instr: Return):
+        if instr.args:
+            self.load('EAX', instr.args[0])
+        for register, slot in self.saved.items():
+            self.add(f'mov dword {register}, {slot}', 'callee-saved')
+        self.add('leave')
+        self.add('ret')
+
+    # endregion
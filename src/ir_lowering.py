@@ -0,0 +1,343 @@
+"""
+Lowering of the (checked) AST into the IR (see ir.py), function by
+function. Conditions of statements become branches, `&&` and `||`
+evaluate lazily through control flow. Order of evaluation is the one
+of AssemblyGenerator: arguments of calls right to left, then the object
+a method is called on.
+"""
+from runtime import * # noqa
+from latte_state import WithLatteState
+from scoped_table import ScopedTable
+from ir import (
+    Binary, Branch, Call, Copy, Function, Jump, Load, Return, Store, Str,
+    Unary, VTable
+)
+from latte_ast import * # noqa
+
+
+class Jumps:
+    """
+    A condition to be lowered into jumps - to `if_true` when `expr`
+    holds, to `if_false` otherwise. Visited like an AST node.
+    """
+    __slots__ = ('expr', 'if_true', 'if_false')
+
+    def __init__(self, expr: Expr, if_true, if_false):
+        self.expr = expr
+        self.if_true = if_true
+        self.if_false = if_false
+
+    def accept(self, visitor):
+        return visitor.visitJumps(self)
+
+
+class IRBuilder(NodeVisitor, WithLatteState):
+    """
+    Builds IR functions of a program (the result of visiting it).
+    Visits of expressions return their operands.
+    """
+    def __init__(self):
+        super().__init__()
+        self.functions = []
+        self.fun = None
+        self.block = None
+        self.self_temp = None
+        # variable name -> temporary holding it
+        self.variables = ScopedTable()
+
+    def emit(self, instr):
+        self.block.instrs.append(instr)
+        return instr.dest
+
+    def place(self, block):
+        """ Continues in `block` (falling through to it if need be). """
+        if not self.block.terminated:
+            self.emit(Jump(block))
+        self.fun.blocks.append(block)
+        self.block = block
+
+    def terminate(self, terminator):
+        """ Ends the current block, code after it is unreachable. """
+        self.emit(terminator)
+        self.place(self.fun.new_block())
+
+    def offset(self, cls: str, name: str) -> int:
+        return self.layouts[cls].offsets[name]
+
+    # region Definitions
+
+    def visitProgram(self, node: Program):
+        yield from self.visitChildren(node)
+        return self.functions
+
+    def visitClassDef(self, node: ClassDef):
+        self.current_object = node.name
+        for method in node.methods:
+            yield method
+        self.current_object = self.OBJECT
+
+    def visitFunDef(self, node: FunDef):
+        obj = self.current_object
+        self.fun = Function(f'{obj}__{node.name}' if obj else node.name)
+        self.variables.push()
+        if obj:
+            self.self_temp = self.fun.new_temp('self')
+            self.fun.params.append(self.self_temp)
+        for name, _ in node.args:
+            temp = self.fun.new_temp(name)
+            self.variables.declare(name, temp)
+            self.fun.params.append(temp)
+        self.block = self.fun.new_block()
+        self.fun.blocks.append(self.block)
+        yield node.body
+        if not self.block.terminated:
+            # the end of a void function (or an unreachable one)
+            self.emit(Return())
+        self.variables.pop()
+        self.fun.remove_unreachable()
+        self.functions.append(self.fun)
+
+    # endregion
+
+    # region Statements
+
+    def visitBlock(self, node: Block):
+        self.variables.push()
+        for stmt in node.stmts:
+            yield stmt
+        self.variables.pop()
+
+    def visitDecl(self, node: Decl):
+        self.current_type = node.type
+        yield from self.visitChildren(node)
+
+    def visitDef(self, node: Def):
+        if self.current_type == STRING:
+            value = Str()
+        else:
+            value = 0
+        self.declare(node.name, value)
+
+    def visitDefAss(self, node: DefAss):
+        value = yield node.expr
+        self.declare(node.name, value)
+
+    def declare(self, name: str, value):
+        temp = self.fun.new_temp(name)
+        self.emit(Copy(temp, value))
+        self.variables.declare(name, temp)
+
+    def visitAss(self, node: Ass):
+        value = yield node.expr
+        temp = self.variables.get(node.name)
+        if temp is not None:
+            self.emit(Copy(temp, value))
+        else:
+            # an attribute of self
+            offset = self.offset(self.current_object, node.name)
+            self.emit(Store(self.self_temp, offset, value))
+
+    def visitAttrAss(self, node: AttrAss):
+        obj = yield node.obj
+        value = yield node.expr
+        offset = self.offset(node.obj.expr_type, node.name)
+        self.emit(Store(obj, offset, value))
+
+    def inc_dec(self, op: Op, name: str, obj=None, cls: str = None):
+        temp = None if obj else self.variables.get(name)
+        if temp is not None:
+            self.emit(Binary(temp, op, temp, 1))
+            return
+        if obj is None:
+            obj, cls = self.self_temp, self.current_object
+        offset = self.offset(cls, name)
+        value = self.emit(Load(self.fun.new_temp(), obj, offset))
+        value = self.emit(Binary(self.fun.new_temp(), op, value, 1))
+        self.emit(Store(obj, offset, value))
+
+    def visitIncr(self, node: Incr):
+        self.inc_dec(Op.ADD, node.name)
+
+    def visitDecr(self, node: Decr):
+        self.inc_dec(Op.SUB, node.name)
+
+    def visitAttrIncr(self, node: AttrIncr):
+        obj = yield node.obj
+        self.inc_dec(Op.ADD, node.name, obj, node.obj.expr_type)
+
+    def visitAttrDecr(self, node: AttrDecr):
+        obj = yield node.obj
+        self.inc_dec(Op.SUB, node.name, obj, node.obj.expr_type)
+
+    def visitRet(self, node: Ret):
+        value = yield node.expr
+        self.terminate(Return(value))
+
+    def visitVRet(self, node: VRet):
+        self.terminate(Return())
+
+    def visitCond(self, node: Cond):
+        then, end = self.fun.new_block(), self.fun.new_block()
+        yield Jumps(node.cond, then, end)
+        self.place(then)
+        yield node.stmt
+        self.place(end)
+
+    def visitCondElse(self, node: CondElse):
+        then, other = self.fun.new_block(), self.fun.new_block()
+        end = self.fun.new_block()
+        yield Jumps(node.cond, then, other)
+        self.place(then)
+        yield node.stmt
+        if not self.block.terminated:
+            self.emit(Jump(end))
+        self.place(other)
+        yield node.else_stmt
+        self.place(end)
+
+    def visitWhile(self, node: While):
+        # the condition is checked at the bottom of the loop
+        body, check = self.fun.new_block(), self.fun.new_block()
+        end = self.fun.new_block()
+        self.emit(Jump(check))
+        self.place(body)
+        yield node.stmt
+        self.place(check)
+        yield Jumps(node.cond, body, end)
+        self.place(end)
+
+    def visitSExp(self, node: SExp):
+        yield node.expr
+
+    # endregion
+
+    # region Conditions
+
+    def visitJumps(self, jumps: Jumps):
+        expr, if_true, if_false = jumps.expr, jumps.if_true, jumps.if_false
+        if isinstance(expr, (EAnd, EOr)):
+            right = self.fun.new_block()
+            if isinstance(expr, EAnd):
+                yield Jumps(expr.left, right, if_false)
+            else:
+                yield Jumps(expr.left, if_true, right)
+            self.place(right)
+            yield Jumps(expr.right, if_true, if_false)
+        elif isinstance(expr, EUnOp) and expr.op is UnOp.NOT:
+            yield Jumps(expr.expr, if_false, if_true)
+        elif isinstance(expr, (ETrue, EFalse)):
+            self.emit(Jump(if_true if isinstance(expr, ETrue) else if_false))
+        else:
+            cond = yield expr
+            self.emit(Branch(cond, if_true, if_false))
+
+    # endregion
+
+    # region Expressions
+
+    def visitEId(self, node: EId):
+        temp = self.variables.get(node.name)
+        if temp is not None:
+            return temp
+        offset = self.offset(self.current_object, node.name)
+        return self.emit(Load(self.fun.new_temp(), self.self_temp, offset))
+
+    def visitESelf(self, node: ESelf):
+        return self.self_temp
+
+    def visitEInt(self, node: EInt):
+        return node.value
+
+    def visitETrue(self, node: ETrue):
+        return 1
+
+    def visitEFalse(self, node: EFalse):
+        return 0
+
+    def visitEStr(self, node: EStr):
+        return Str(node.text)
+
+    def visitECastNull(self, node: ECastNull):
+        return 0
+
+    def visitENewObj(self, node: ENewObj):
+        if node.type not in self.classes:
+            return 0
+        layout = self.layouts[node.type]
+        obj = self.emit(Call(self.fun.new_temp(), '_malloc', [layout.size]))
+        if layout.slots:
+            self.emit(Store(obj, 0, VTable(node.type)))
+        return obj
+
+    def visitEAttr(self, node: EAttr):
+        obj = yield node.obj
+        offset = self.offset(node.obj.expr_type, node.name)
+        return self.emit(Load(self.fun.new_temp(), obj, offset))
+
+    def arguments(self, args: list):
+        values = [None] * len(args)
+        for i in range(len(args) - 1, -1, -1):
+            values[i] = yield args[i]
+        return values
+
+    def call(self, node: Expr, function: str, args: list):
+        dest = None if node.expr_type == VOID else self.fun.new_temp()
+        self.emit(Call(dest, function, args))
+        return 0 if dest is None else dest
+
+    def method(self, obj, cls: str, name: str):
+        """ Address of method `name` of `obj` (of class `cls`). """
+        vtable = self.emit(Load(self.fun.new_temp(), obj, 0))
+        slot = self.layouts[cls].slots[name]
+        return self.emit(Load(self.fun.new_temp(), vtable, slot))
+
+    def visitEFunCall(self, node: EFunCall):
+        args = yield from self.arguments(node.args)
+        cls = self.current_object
+        if cls and node.name in self.layouts[cls].slots:
+            method = self.method(self.self_temp, cls, node.name)
+            return self.call(node, None, [method, self.self_temp] + args)
+        return self.call(node, node.name, args)
+
+    def visitEMthdCall(self, node: EMthdCall):
+        args = yield from self.arguments(node.args)
+        obj = yield node.obj
+        method = self.method(obj, node.obj.expr_type, node.name)
+        return self.call(node, None, [method, obj] + args)
+
+    def visitEUnOp(self, node: EUnOp):
+        value = yield node.expr
+        return self.emit(Unary(self.fun.new_temp(), node.op, value))
+
+    def visitEMulOp(self, node: EMulOp):
+        left = yield node.left
+        right = yield node.right
+        return self.emit(Binary(self.fun.new_temp(), node.op, left, right))
+
+    visitERelOp = visitEMulOp
+
+    def visitEAddOp(self, node: EAddOp):
+        left = yield node.left
+        right = yield node.right
+        if node.expr_type == STRING:
+            return self.emit(
+                Call(self.fun.new_temp(), '_concat', [left, right])
+            )
+        return self.emit(Binary(self.fun.new_temp(), node.op, left, right))
+
+    def visit_and_or(self, node: EBinOp):
+        result = self.fun.new_temp()
+        if_true, if_false = self.fun.new_block(), self.fun.new_block()
+        end = self.fun.new_block()
+        yield Jumps(node, if_true, if_false)
+        self.place(if_true)
+        self.emit(Copy(result, 1))
+        self.emit(Jump(end))
+        self.place(if_false)
+        self.emit(Copy(result, 0))
+        self.place(end)
+        return result
+
+    visitEAnd = visitEOr = visit_and_or
+
+    # endregion
@@ -1,137 +1,495 @@
 import argparse
+import io
+import json
 import os
-import subprocess
-
-from antlr4 import FileStream, CommonTokenStream
-from antlr4.error.ErrorListener import ErrorListener
-
-from assembly_generator import AssemblyGenerator
-from assembly_writer import AssemblyWriter
-from errors import CompilationError
-from error_checker import ErrorChecker
-from expression_evaluator import ExpressionEvaluator
-from latte_state import LatteStateLoader
-from locals_counter import LocalsCounter
-from peephole_optimizer import PeepholeOptimizer
-from return_checker import ReturnAbilityChecker
-from string_finder import StringFinder
-from tree_optimizer import TreeOptimizer
-
-from antlr4gen.LatteLexer import LatteLexer
-from antlr4gen.LatteParser import LatteParser
-
-
-class LatteErrorListener(ErrorListener):
-    """ Error listener for antlr4 errors. """
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        raise SyntaxError(
-            f"Syntax Error at line {line} and column {column}.\n"
-            f'Error message: {msg}.'
-        )
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+
+from compilation_cache import CompilationCache, file_digest
+from options import str2bool
+from pass_manager import DEFAULT_LEVEL, LEVELS, optimizations
+from pass_stats import PassStats, format_table
+from toolchain import assemble, assemble_and_link, build_in_memory, link
+
+# Parser and passes are imported only once they are needed:
+# cache hits and disabled passes do not pay for their imports.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_passes(
+        input_stream, optimizations: frozenset, stats: PassStats = None,
+        cache: CompilationCache = None, module=None, sll: bool = True,
+        fast_lexer: bool = True, lexer_listener=None, output=None,
+        codegen_jobs: int = 1, backend: str = 'ast', ssa: bool = False,
+        ir_output=None
+) -> str:
+    """
+    Runs the whole compilation pipeline on `input_stream`, with the given
+    `optimizations` (see pass_manager.py).
+    Returns generated assembly, raises on any error.
+    With a `cache`, compilation is incremental: only functions
+    changed since the last compilation are checked and generated.
+    A `module` is compiled separately - declarations of modules
+    it uses are loaded from their interfaces and its own interface
+    is stored in `module.exports`.
+    With `sll`, faster SLL parsing is tried before full LL parsing.
+    With `fast_lexer`, the source is tokenized by the hand-written lexer.
+    Lexer errors are reported to `lexer_listener` (stderr by default).
+    With `output` (a text file), functions are compiled one at a time
+    and their code is written to it as soon as generated (see
+    streaming.py), None is returned.
+    With `codegen_jobs` > 1, functions are generated by a pool of that
+    many processes (see parallel_codegen.py).
+    With `backend` 'ir', code is generated through the IR (see ir.py),
+    in SSA form with `ssa`, and the IR is written to `ir_output`
+    (a text file) if given.
+    """
+    from pass_manager import Compilation, PassManager
+    compilation = Compilation(
+        input_stream, optimizations, stats or PassStats(enabled=False),
+        cache, module, sll, fast_lexer, lexer_listener, output, codegen_jobs,
+        backend, ssa, ir_output
+    )
+    if output is not None:
+        from streaming import STREAMING_PIPELINE
+        PassManager(STREAMING_PIPELINE).run(compilation)
+        return None
+    PassManager().run(compilation)
+    writer = compilation.writer
+    if compilation.incremental:
+        writer = compilation.incremental.stitch(compilation.code_gen)
+    return writer.get_code()
 
 
-def compile(filepath: str, opt_tree: bool, peephole: bool):
+def compile(
+        filepath: str, optimizations: frozenset, stats: PassStats = None,
+        cache: CompilationCache = None, module=None, sll: bool = True,
+        fast_lexer: bool = True, output=None, codegen_jobs: int = 1,
+        backend: str = 'ast', ssa: bool = False, ir_path: str = None
+):
+    from antlr4 import FileStream
     fs = FileStream(filepath)
-    lexer = LatteLexer(fs)
-    stream = CommonTokenStream(lexer)
-    parser = LatteParser(stream, )
+    try:
+        with open(ir_path, 'w') if ir_path else nullcontext() as ir_output:
+            code = run_passes(
+                fs, optimizations, stats, cache, module, sll, fast_lexer,
+                output=output, codegen_jobs=codegen_jobs, backend=backend,
+                ssa=ssa, ir_output=ir_output
+            )
+    except Exception as e:
+        print('ERROR', file=os.sys.stderr)
+        print(str(e))
+        raise SystemExit(1)
 
-    parser.removeErrorListeners()
-    parser.addErrorListener(LatteErrorListener())
+    print('OK', file=os.sys.stderr)
+    return code
 
+
+def compile_streaming(
+        filepath: str, asm_path: str, optimizations: frozenset,
+        stats: PassStats = None, module=None, sll: bool = True,
+        fast_lexer: bool = True
+):
+    """
+    Compiles like `compile`, writing code to `asm_path` function by
+    function (the file is removed if compilation fails).
+    """
     try:
-        tree = parser.program()
+        with open(asm_path, 'w') as f:
+            compile(
+                filepath, optimizations, stats, None, module, sll,
+                fast_lexer, f
+            )
+    except SystemExit:
+        os.remove(asm_path)
+        raise
 
-        loader = LatteStateLoader()
-        loader.load(tree)
 
-        error_checker = ErrorChecker()
-        error_checker.set_state(*loader.get_state())
-        error_checker.visit(tree)
+def codegen_flags(args) -> dict:
+    """ Options which influence generated code (part of the cache key). """
+    return {
+        'optimizations': sorted(args.optimizations),
+        'pipeline': args.pipeline,
+        'incremental': args.incremental,
+        'stream': args.stream,
+        'parallel': args.codegen_jobs > 1,
+        'backend': args.backend,
+        'ssa': args.ssa,
+        'module': args.module,
+        'interfaces': [file_digest(path) for path in args.interface]
+    }
 
-        expression_evaluator = ExpressionEvaluator()
-        expression_evaluator.visit(tree)
 
-        ret_checker = ReturnAbilityChecker()
-        ret_checker.visit(tree)
+def ir_options(args, base_file: str) -> dict:
+    """ Arguments of `compile` choosing the backend. """
+    return {
+        'backend': args.backend,
+        'ssa': args.ssa,
+        'ir_path': base_file + '.ir' if args.emit_ir else None
+    }
 
-        if opt_tree:
-            tree_optimizer = TreeOptimizer()
-            tree_optimizer.visit(tree)
 
-        locals_counter = LocalsCounter()
-        locals_counter.visit(tree)
+def wants_stats(args) -> bool:
+    return args.time_passes or args.stats_json is not None
 
-        string_finder = StringFinder()
-        string_finder.visit(tree)
 
-        writer = AssemblyWriter()
-        code_gen = AssemblyGenerator(string_finder.get_strings(), writer)
-        code_gen.set_state(*loader.get_state())
-        code_gen.visit(tree)
+def build(path: str, args, stats: PassStats = None) -> int:
+    """ Compiles `path` into an executable, returns toolchain status. """
+    if args.module:
+        return build_module(path, args, stats)
+    base_file = os.path.splitext(path)[0]
 
-        if peephole:
-            po = PeepholeOptimizer(writer)
-            po.optimize()
+    # instrumented builds have to actually compile
+    use_cache = not args.no_cache and not wants_stats(args) \
+        and not args.emit_ir
+    cache = CompilationCache() if use_cache else None
+    if cache:
+        key = cache.key(path, codegen_flags(args))
+        if cache.fetch(key, base_file):
+            print('OK', file=os.sys.stderr)
+            return 0
 
-        print('OK', file=os.sys.stderr)
-        return writer.get_code()
+    if args.stream:
+        compile_streaming(
+            path, base_file + '.asm', args.optimizations, stats,
+            sll=args.sll, fast_lexer=args.fast_lexer
+        )
+        status = assemble_and_link(base_file)
+    else:
+        fragments = None
+        if args.incremental and not args.no_cache:
+            fragments = cache or CompilationCache()
+        code = compile(
+            path, args.optimizations, stats, fragments, sll=args.sll,
+            fast_lexer=args.fast_lexer, codegen_jobs=args.codegen_jobs,
+            **ir_options(args, base_file)
+        )
+        if args.pipeline:
+            status = build_in_memory(code, base_file)
+        else:
+            with open(base_file + '.asm', 'w') as f:
+                f.write(code)
+            status = assemble_and_link(base_file)
+    if cache and status == 0:
+        cache.store(key, base_file)
+    return status
 
-    except CompilationError as e:
-        print('ERROR', file=os.sys.stderr)
-        print(str(e))
-        raise SystemExit(1)
-    except Exception as e:
+
+def build_module(path: str, args, stats: PassStats = None) -> int:
+    """
+    Compiles module `path` into an object file and an interface file
+    (.lti) used by modules depending on it. Returns toolchain status.
+    """
+    from interface import Module
+    base_file = os.path.splitext(path)[0]
+
+    use_cache = not args.no_cache and not wants_stats(args) \
+        and not args.emit_ir
+    cache = CompilationCache() if use_cache else None
+    if cache:
+        key = cache.key(path, codegen_flags(args))
+        if cache.fetch(key, base_file, product='.o'):
+            print('OK', file=os.sys.stderr)
+            return 0
+
+    try:
+        module = Module(args.interface)
+    except (OSError, ValueError) as e:
         print('ERROR', file=os.sys.stderr)
         print(str(e))
         raise SystemExit(1)
+    if args.stream:
+        compile_streaming(
+            path, base_file + '.asm', args.optimizations, stats, module,
+            args.sll, args.fast_lexer
+        )
+    else:
+        fragments = None
+        if args.incremental and not args.no_cache:
+            fragments = cache or CompilationCache()
+        code = compile(
+            path, args.optimizations, stats, fragments, module, args.sll,
+            args.fast_lexer, codegen_jobs=args.codegen_jobs,
+            **ir_options(args, base_file)
+        )
+        with open(base_file + '.asm', 'w') as f:
+            f.write(code)
 
+    module.exports.save(base_file + '.lti')
+    status = assemble(base_file)
+    if cache and status == 0:
+        cache.store(key, base_file)
+    return status
 
-def str2bool(v):
-    if isinstance(v, bool):
-        return v
-    if v.lower() in ('yes', 'true', 't', 'y', '1'):
-        return True
-    elif v.lower() in ('no', 'false', 'f', 'n', '0'):
-        return False
-    else:
-        raise argparse.ArgumentTypeError('Boolean value expected.')
+
+def build_captured(path: str, args):
+    """
+    Runs `build` collecting everything it prints.
+    Used by worker processes in batch mode.
+    """
+    output = io.StringIO()
+    stats = PassStats(enabled=wants_stats(args))
+    start = time.perf_counter()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            ok = build(path, args, stats) == 0
+        except SystemExit:
+            ok = False
+    elapsed = time.perf_counter() - start
+    return ok, output.getvalue(), elapsed, stats.to_dict()
+
+
+def build_many(paths: list, args):
+    """
+    Builds all `paths` in a pool of `args.jobs` processes,
+    reporting status of each file as soon as it is known.
+    Returns True iff all files were built.
+    """
+    start = time.perf_counter()
+    failed, all_stats = 0, {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(build_captured, path, args): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            ok, output, elapsed, stats = future.result()
+            all_stats[futures[future]] = stats
+            status = 'OK' if ok else 'ERROR'
+            print(
+                f'[{status}] {futures[future]} ({elapsed:.2f}s)',
+                file=os.sys.stderr
+            )
+            if not ok:
+                failed += 1
+                print(output, end='')
+    print(
+        f'{len(paths)} files, {failed} failed, '
+        f'wall time {time.perf_counter() - start:.2f}s',
+        file=os.sys.stderr
+    )
+    report_stats({path: all_stats[path] for path in paths}, args)
+    return failed == 0
+
+
+def report_stats(all_stats: dict, args):
+    """ Outputs pass statistics of each compiled file, as requested. """
+    if args.time_passes:
+        for path, stats in all_stats.items():
+            if stats['passes']:
+                print(f'{path}:\n{format_table(stats)}', file=os.sys.stderr)
+    if args.stats_json:
+        files = [{'file': path, **stats} for path, stats in all_stats.items()]
+        with open(args.stats_json, 'w') as f:
+            json.dump({'files': files}, f, indent=2)
+
+
+def report_startup():
+    """ Prints what was loaded to compile (and how long it took). """
+    from atn_cache import STARTUP
+    if not STARTUP:
+        print('startup: parser not loaded', file=os.sys.stderr)
+        return
+    passes = sorted(
+        name for name in os.sys.modules
+        if os.path.exists(os.path.join(HERE, f'{name}.py'))
+    )
+    print(
+        f'startup: parser loaded in '
+        f'{1000 * STARTUP["import_recognizers"]:.2f} ms '
+        f'(atn cache {STARTUP["atn_cache"]}, read in '
+        f'{1000 * STARTUP["atn_cache_load"]:.2f} ms)\n'
+        f'startup: loaded modules: {", ".join(passes)}',
+        file=os.sys.stderr
+    )
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Latte compiler.")
+    parser = argparse.ArgumentParser(
+        description="Latte compiler.", fromfile_prefix_chars='@'
+    )
+    parser.add_argument(
+        '-O', type=int, choices=sorted(LEVELS), default=DEFAULT_LEVEL,
+        dest='opt_level',
+        help='Optimization level: -O0 runs only passes needed to generate '
+             'code, higher levels enable more optimizations.'
+    )
+    parser.add_argument(
+        '--peephole', type=str2bool, default=None,
+        help='[T/F] if peephole optimization should be performed '
+             '(overrides the level).'
+    )
+    parser.add_argument(
+        '--const_expr', type=str2bool, default=None,
+        help='[T/F] if constant expression optimization should be performed '
+             '(overrides the level).'
+    )
     parser.add_argument(
-        '--peephole', type=str2bool, default=True,
-        help='[T/F] if peephole optimization should be performed.'
+        '--regalloc', type=str2bool, default=None,
+        help='[T/F] if temporaries of the IR backend should be kept '
+             'in registers (overrides the level).'
     )
     parser.add_argument(
-        '--const_expr', type=str2bool, default=True,
-        help='[T/F] if constant expression optimization should be performed.'
+        '--gvn', type=str2bool, default=None,
+        help='[T/F] if computations repeated in IR in SSA form should be '
+             'reused (overrides the level).'
     )
     parser.add_argument(
-        'filepath', nargs=1, type=str, help='Path of the file to compile.'
+        '--sll', type=str2bool, default=True,
+        help='[T/F] if faster SLL parsing should be tried first '
+             '(falling back to full LL parsing).'
+    )
+    parser.add_argument(
+        '--fast_lexer', type=str2bool, default=True,
+        help='[T/F] if the hand-written lexer should be used '
+             "instead of antlr's."
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count(),
+        help='Number of worker processes used when compiling many files.'
+    )
+    parser.add_argument(
+        '--codegen-jobs', type=int, default=1, metavar='N',
+        help='Number of processes generating code of functions of a single '
+             'file (for huge programs).'
+    )
+    parser.add_argument(
+        '--backend', choices=('ast', 'ir'), default='ast',
+        help='Generate code from the AST directly, or through the '
+             'three-address IR (control-flow graph of basic blocks).'
+    )
+    parser.add_argument(
+        '--ssa', type=str2bool, default=False,
+        help='[T/F] if the IR should be put in SSA form (with --backend ir).'
+    )
+    parser.add_argument(
+        '--emit-ir', action='store_true',
+        help='Write the IR of each file to a .ir file (implies --backend ir).'
+    )
+    parser.add_argument(
+        '--pipeline', action='store_true',
+        help='Assemble in memory and link with ld directly, '
+             'against the runtime prelinked by make.'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Do not use (nor fill) the cache of compiled programs.'
+    )
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help='Cache code of every function, recompile only changed ones.'
+    )
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='Compile one function at a time, writing its code out '
+             'before the next one, so that memory use does not grow '
+             'with the size of the program.'
+    )
+    parser.add_argument(
+        '--module', action='store_true',
+        help='Compile separately: each file into an object file and '
+             'an interface file (.lti), main function is not required.'
+    )
+    parser.add_argument(
+        '--interface', type=str, metavar='PATH', action='append', default=[],
+        help='Interface (.lti) of a module used by the compiled ones '
+             '(can be repeated).'
+    )
+    parser.add_argument(
+        '--link', type=str, metavar='OUTPUT',
+        help='Link the given object files of modules into OUTPUT executable.'
+    )
+    parser.add_argument(
+        '--cache-stats', action='store_true',
+        help='Print statistics of the cache of compiled programs and exit.'
+    )
+    parser.add_argument(
+        '--time-passes', action='store_true',
+        help='Print time, peak memory and tree size of each pass.'
+    )
+    parser.add_argument(
+        '--stats-json', type=str, metavar='PATH',
+        help='Write statistics of each pass as json to PATH.'
+    )
+    parser.add_argument(
+        '--startup-stats', action='store_true',
+        help='Print how long it took to load the parser (and ATN cache).'
+    )
+    parser.add_argument(
+        '--warm-atn-cache', action='store_true',
+        help="Parse the given files and save antlr's DFAs learned "
+             'to the ATN cache (loaded by later compilations), then exit.'
+    )
+    parser.add_argument(
+        '--serve', type=str, metavar='SOCKET',
+        help='Run as a compile server listening on the given unix socket.'
+    )
+    parser.add_argument(
+        'filepath', nargs='*', type=str,
+        help='Paths of the files to compile '
+             '(@manifest reads paths from a file, one per line).'
     )
     args = parser.parse_args()
-    path = os.path.abspath(os.getcwd())
-    path = os.path.join(path, args.filepath[0])
-
-    code = compile(path, args.const_expr, args.peephole)
+    args.optimizations = optimizations(
+        args.opt_level, args.const_expr, args.peephole, args.regalloc,
+        args.gvn
+    )
+    if args.serve:
+        from compile_server import serve
+        serve(args.serve, run_passes)
+        return
+    if args.cache_stats:
+        for name, value in CompilationCache().stats().items():
+            print(f'{name}: {value}')
+        return
+    if not args.filepath:
+        parser.error('at least one file path is required')
+    if args.warm_atn_cache:
+        from atn_cache import MAX_CACHE_SIZE, warm_up
+        if not warm_up(args.filepath):
+            parser.error(f'ATN cache would be larger than {MAX_CACHE_SIZE} '
+                         'bytes, not saved')
+        return
+    if args.interface and not args.module:
+        parser.error('--interface is used only with --module')
+    if args.stream and (args.incremental or args.pipeline):
+        parser.error('--stream cannot be used with --incremental '
+                     'nor --pipeline')
+    if args.codegen_jobs > 1 and (args.incremental or args.stream):
+        parser.error('--codegen-jobs cannot be used with --incremental '
+                     'nor --stream')
+    if args.emit_ir:
+        args.backend = 'ir'
+    if args.backend == 'ir' and (
+            args.incremental or args.stream or args.codegen_jobs > 1
+    ):
+        parser.error('--backend ir cannot be used with --incremental, '
+                     '--stream nor --codegen-jobs')
+    cwd = os.path.abspath(os.getcwd())
+    paths = [os.path.join(cwd, path) for path in args.filepath]
 
-    base_file = os.path.splitext(path)[0]
+    if args.link:
+        status = link(paths, args.link)
+        if status:
+            raise SystemExit(status)
+        return
 
-    with open(base_file + '.asm', 'w') as f:
-        f.write(code)
+    if len(paths) == 1:
+        stats = PassStats(enabled=wants_stats(args))
+        try:
+            status = build(paths[0], args, stats)
+        finally:
+            report_stats({paths[0]: stats.to_dict()}, args)
+            if args.startup_stats:
+                report_startup()
+        if status:
+            raise SystemExit(status)
+        return
 
-    here = os.path.dirname(os.path.abspath(__file__))
-    runtime_path = os.path.join(here, '../lib/runtime.o')
-    subprocess.call(
-        f'nasm -f Elf32 -o {base_file}.o {base_file}.asm',
-        shell=True
-    )
-    subprocess.call(
-        f'gcc -m32 {runtime_path} {base_file}.o -o {base_file}.out',
-        shell=True
-    )
+    if not build_many(paths, args):
+        raise SystemExit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,474 @@
+"""
+Compact AST of Latte programs, lowered once from antlr's parse tree
+(see lowering.py). Nodes keep only what the passes need: interned names,
+types as strings, operators as enums and line numbers for errors.
+"""
+from enum import Enum
+from types import GeneratorType
+
+
+class Op(Enum):
+    """ Binary arithmetic and relational operators. """
+    ADD = '+'
+    SUB = '-'
+    MUL = '*'
+    DIV = '/'
+    MOD = '%'
+    LT = '<'
+    LE = '<='
+    GT = '>'
+    GE = '>='
+    EQ = '=='
+    NE = '!='
+
+
+class UnOp(Enum):
+    NEG = '-'
+    NOT = '!'
+
+
+class Node:
+    """
+    Base of all nodes. `fields` lists (in source order) the attributes
+    holding child nodes or lists of child nodes.
+    """
+    __slots__ = ('line',)
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visit_method = f'visit{cls.__name__}'
+
+    def accept(self, visitor):
+        return getattr(visitor, self.visit_method)(self)
+
+    def children(self):
+        for name in self.fields:
+            value = getattr(self, name)
+            if type(value) is list:
+                yield from value
+            elif value is not None:
+                yield value
+
+
+class Expr(Node):
+    """ Expressions get their type and (constant) value from the passes. """
+    __slots__ = ('expr_type', 'expr_value')
+
+    def __init__(self, line: int):
+        self.line = line
+        self.expr_type = None
+        self.expr_value = None
+
+
+# region Definitions
+
+class Program(Node):
+    __slots__ = ('defs', 'tokens')
+    fields = ('defs',)
+
+    def __init__(self, line, defs, tokens=None):
+        self.line = line
+        self.defs = defs
+        # tokens of the source, see FunDef.token_span
+        self.tokens = tokens
+
+
+class ClassDef(Node):
+    __slots__ = ('name', 'parent', 'field_defs', 'methods')
+    fields = ('field_defs', 'methods')
+
+    def __init__(self, line, name, parent, field_defs, methods):
+        self.line = line
+        self.name = name
+        self.parent = parent
+        self.field_defs = field_defs
+        self.methods = methods
+
+
+class FieldDef(Node):
+    __slots__ = ('type', 'names')
+
+    def __init__(self, line, type_, names):
+        self.line = line
+        self.type = type_
+        self.names = names
+
+
+class FunDef(Node):
+    __slots__ = (
+        'ret_type', 'name', 'args', 'body', 'locals_count', 'token_span'
+    )
+    fields = ('body',)
+
+    def __init__(self, line, ret_type, name, args, body, token_span=None):
+        self.line = line
+        self.ret_type = ret_type
+        self.name = name
+        # list of (name, type) pairs
+        self.args = args
+        self.body = body
+        self.locals_count = 0
+        # indices of the first and the last token of the function
+        self.token_span = token_span
+
+# endregion
+
+# region Statements
+
+
+class Block(Node):
+    __slots__ = ('stmts',)
+    fields = ('stmts',)
+
+    def __init__(self, line, stmts):
+        self.line = line
+        self.stmts = stmts
+
+
+class Empty(Node):
+    __slots__ = ()
+
+    def __init__(self, line):
+        self.line = line
+
+
+class Decl(Node):
+    __slots__ = ('type', 'items')
+    fields = ('items',)
+
+    def __init__(self, line, type_, items):
+        self.line = line
+        self.type = type_
+        self.items = items
+
+
+class Def(Node):
+    __slots__ = ('name',)
+
+    def __init__(self, line, name):
+        self.line = line
+        self.name = name
+
+
+class DefAss(Node):
+    __slots__ = ('name', 'expr')
+    fields = ('expr',)
+
+    def __init__(self, line, name, expr):
+        self.line = line
+        self.name = name
+        self.expr = expr
+
+
+class Ass(Node):
+    __slots__ = ('name', 'expr')
+    fields = ('expr',)
+
+    def __init__(self, line, name, expr):
+        self.line = line
+        self.name = name
+        self.expr = expr
+
+
+class AttrAss(Node):
+    __slots__ = ('obj', 'name', 'expr')
+    fields = ('obj', 'expr')
+
+    def __init__(self, line, obj, name, expr):
+        self.line = line
+        self.obj = obj
+        self.name = name
+        self.expr = expr
+
+
+class ArrayAss(Node):
+    __slots__ = ('array', 'index', 'expr')
+    fields = ('array', 'index', 'expr')
+
+    def __init__(self, line, array, index, expr):
+        self.line = line
+        self.array = array
+        self.index = index
+        self.expr = expr
+
+
+class Incr(Node):
+    __slots__ = ('name',)
+
+    def __init__(self, line, name):
+        self.line = line
+        self.name = name
+
+
+class Decr(Incr):
+    __slots__ = ()
+
+
+class AttrIncr(Node):
+    __slots__ = ('obj', 'name')
+    fields = ('obj',)
+
+    def __init__(self, line, obj, name):
+        self.line = line
+        self.obj = obj
+        self.name = name
+
+
+class AttrDecr(AttrIncr):
+    __slots__ = ()
+
+
+class Ret(Node):
+    __slots__ = ('expr',)
+    fields = ('expr',)
+
+    def __init__(self, line, expr):
+        self.line = line
+        self.expr = expr
+
+
+class VRet(Node):
+    __slots__ = ()
+
+    def __init__(self, line):
+        self.line = line
+
+
+class Cond(Node):
+    __slots__ = ('cond', 'stmt')
+    fields = ('cond', 'stmt')
+
+    def __init__(self, line, cond, stmt):
+        self.line = line
+        self.cond = cond
+        self.stmt = stmt
+
+
+class CondElse(Node):
+    __slots__ = ('cond', 'stmt', 'else_stmt')
+    fields = ('cond', 'stmt', 'else_stmt')
+
+    def __init__(self, line, cond, stmt, else_stmt):
+        self.line = line
+        self.cond = cond
+        self.stmt = stmt
+        self.else_stmt = else_stmt
+
+
+class While(Cond):
+    __slots__ = ()
+
+
+class ForEach(Node):
+    __slots__ = ('type', 'name', 'expr', 'stmt')
+    fields = ('expr', 'stmt')
+
+    def __init__(self, line, type_, name, expr, stmt):
+        self.line = line
+        self.type = type_
+        self.name = name
+        self.expr = expr
+        self.stmt = stmt
+
+
+class SExp(Node):
+    __slots__ = ('expr',)
+    fields = ('expr',)
+
+    def __init__(self, line, expr):
+        self.line = line
+        self.expr = expr
+
+# endregion
+
+# region Expressions
+
+
+class EId(Expr):
+    __slots__ = ('name',)
+
+    def __init__(self, line, name):
+        super().__init__(line)
+        self.name = name
+
+
+class EFunCall(Expr):
+    __slots__ = ('name', 'args')
+    fields = ('args',)
+
+    def __init__(self, line, name, args):
+        super().__init__(line)
+        self.name = name
+        self.args = args
+
+
+class EMthdCall(Expr):
+    __slots__ = ('obj', 'name', 'args')
+    fields = ('obj', 'args')
+
+    def __init__(self, line, obj, name, args):
+        super().__init__(line)
+        self.obj = obj
+        self.name = name
+        self.args = args
+
+
+class EAttr(Expr):
+    __slots__ = ('obj', 'name')
+    fields = ('obj',)
+
+    def __init__(self, line, obj, name):
+        super().__init__(line)
+        self.obj = obj
+        self.name = name
+
+
+class EArrAcc(Expr):
+    __slots__ = ('array', 'index')
+    fields = ('array', 'index')
+
+    def __init__(self, line, array, index):
+        super().__init__(line)
+        self.array = array
+        self.index = index
+
+
+class ETrue(Expr):
+    __slots__ = ()
+
+
+class EFalse(Expr):
+    __slots__ = ()
+
+
+class ESelf(Expr):
+    __slots__ = ()
+
+
+class EInt(Expr):
+    __slots__ = ('value',)
+
+    def __init__(self, line, value: int):
+        super().__init__(line)
+        self.value = value
+
+
+class EStr(Expr):
+    """ `text` is the literal as written (in quotes) or a folded value. """
+    __slots__ = ('text',)
+
+    def __init__(self, line, text: str):
+        super().__init__(line)
+        self.text = text
+
+
+class ECastNull(Expr):
+    __slots__ = ('type',)
+
+    def __init__(self, line, type_):
+        super().__init__(line)
+        self.type = type_
+
+
+class ENewObj(ECastNull):
+    __slots__ = ()
+
+
+class ENewArr(Expr):
+    __slots__ = ('type', 'size')
+    fields = ('size',)
+
+    def __init__(self, line, type_, size):
+        super().__init__(line)
+        self.type = type_
+        self.size = size
+
+
+class EUnOp(Expr):
+    __slots__ = ('op', 'expr')
+    fields = ('expr',)
+
+    def __init__(self, line, op: UnOp, expr):
+        super().__init__(line)
+        self.op = op
+        self.expr = expr
+
+
+class EBinOp(Expr):
+    __slots__ = ('op', 'left', 'right')
+    fields = ('left', 'right')
+
+    def __init__(self, line, op, left, right):
+        super().__init__(line)
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+class EMulOp(EBinOp):
+    __slots__ = ()
+
+
+class EAddOp(EBinOp):
+    __slots__ = ()
+
+
+class ERelOp(EBinOp):
+    __slots__ = ()
+
+
+class EAnd(EBinOp):
+    __slots__ = ()
+
+
+class EOr(EBinOp):
+    __slots__ = ()
+
+# endregion
+
+
+NODES = [
+    Program, ClassDef, FieldDef, FunDef,
+    Block, Empty, Decl, Def, DefAss, Ass, AttrAss, ArrayAss, Incr, Decr,
+    AttrIncr, AttrDecr, Ret, VRet, Cond, CondElse, While, ForEach, SExp,
+    EId, EFunCall, EMthdCall, EAttr, EArrAcc, ETrue, EFalse, ESelf, EInt,
+    EStr, ECastNull, ENewObj, ENewArr, EUnOp, EMulOp, EAddOp, ERelOp,
+    EAnd, EOr
+]
+
+
+class NodeVisitor:
+    """
+    Visitor of the AST, in the manner of antlr's visitors: `visit<Node>`
+    methods default to visiting children (in source order).
+    A `visit<Node>` method may be a generator: it then yields nodes which
+    are visited in turn (receiving results of their visits) and its return
+    value is the result. Such visits use an explicit stack instead of
+    recursion, so the depth of the AST is not limited by Python's stack.
+    """
+    def visit(self, node: Node):
+        result = node.accept(self)
+        if type(result) is not GeneratorType:
+            return result
+        stack, result = [result], None
+        while stack:
+            try:
+                child = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                continue
+            result = child.accept(self)
+            if type(result) is GeneratorType:
+                stack.append(result)
+                result = None
+        return result
+
+    def visitChildren(self, node: Node):
+        for child in node.children():
+            yield child
+
+
+for _node in NODES:
+    setattr(NodeVisitor, _node.visit_method, NodeVisitor.visitChildren)
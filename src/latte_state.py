@@ -2,8 +2,9 @@ from collections import OrderedDict
 
 from runtime import * # noqa
 from errors import * # noqa
+from class_layout import build_layouts
 
-from antlr4gen.LatteParser import LatteParser
+from latte_ast import ClassDef, FieldDef, FunDef, Program
 
 
 class WithLatteState:
@@ -27,6 +28,8 @@ class WithLatteState:
         }
         self.attrs = {self.OBJECT: {}}
         self.vtables = {}
+        # class -> ClassLayout, derived from the above
+        self.layouts = {}
 
         self.current_object = self.OBJECT
         self.current_fun = None
@@ -35,116 +38,97 @@ class WithLatteState:
     def get_state(self):
         return self.classes, self.methods, self.attrs, self.vtables
 
-    def set_state(self, classes, methods, attrs, vtables):
+    def set_state(self, classes, methods, attrs, vtables, layouts=None):
         self.classes = classes
         self.methods = methods
         self.attrs = attrs
         self.vtables = vtables
+        if layouts is None:
+            layouts = build_layouts(classes, attrs, vtables)
+        self.layouts = layouts
 
     def is_subtype(self, base: str, sup: str) -> bool:
-        if base in GENERIC_TYPES:
-            return base == sup
-        while base is not None:
-            if base == sup:
-                return True
-            base = self.classes[base]
-        return False
+        if base == sup:
+            return True
+        base, sup = self.layouts.get(base), self.layouts.get(sup)
+        if base is None or sup is None:
+            return False
+        return base.is_subclass_of(sup)
+
+    def method_header(self, cls, name):
+        """
+        Header of method `name` as seen in class `cls`
+        (falling back to global functions), None if there is no such.
+        """
+        layout = self.layouts.get(cls)
+        if layout is not None and name in layout.implementations:
+            return self.methods[layout.implementations[name]][name]
+        return self.methods[self.OBJECT].get(name)
 
 
 class LatteStateLoader(WithLatteState):
     """
-    Class which reads state (as above) from raw AST tree. 
+    Class which reads state (as above) from AST.
+    Layouts of classes are built at the end of loading.
     """
-    # TODO: move offset calculation here
-    def load(self, ctx: LatteParser.ProgramContext):
+    def load_interface(self, interface):
+        """ Adds declarations of a separately compiled module. """
+        self.classes.update(interface.classes)
+        self.methods[self.OBJECT].update(interface.functions)
+        self.methods.update(interface.methods)
+        self.attrs.update(interface.attrs)
+        self.vtables.update(interface.vtables)
+
+    def load(self, program: Program):
         """ Main method for reading state."""
-        functions = list(
-            ctx.getChildren(
-                lambda c: isinstance(c, LatteParser.TopFunDefContext)
-            )
-        )
-        classes = list(
-            ctx.getChildren(
-                lambda c: type(c) in {
-                    LatteParser.BaseClassDefContext,
-                    LatteParser.ExtClassDefContext
-                }
-            )
-        )
+        functions = [d for d in program.defs if isinstance(d, FunDef)]
+        classes = [d for d in program.defs if isinstance(d, ClassDef)]
         for cls in classes:
             self._load_type(cls)
             self._preload_fields(cls)
         for fun in functions:
-            self._load_function_header(self.OBJECT, fun.funDef())
+            self._load_function_header(self.OBJECT, fun)
         for cls in classes:
             self._load_headers(cls)
             self._load_fields(cls)
         self.build_vtables()
-
-    def _load_type(self, ctx):
-        name, parent = self._get_cls_and_sup(ctx)
-        if name in self.classes.keys():
-            raise ClassRedeclarationError(ctx)
-        self.classes[name] = parent
-        self.methods[name] = {}
-        self.attrs[name] = {}
-
-    def _load_fields(self, ctx):
-        cls, sup = self._get_cls_and_sup(ctx)
-        fields, ancestors = {}, [cls]
+        self.layouts = build_layouts(self.classes, self.attrs, self.vtables)
+
+    def _load_type(self, cls: ClassDef):
+        if cls.name in self.classes.keys():
+            raise ClassRedeclarationError(cls)
+        self.classes[cls.name] = cls.parent
+        self.methods[cls.name] = {}
+        self.attrs[cls.name] = {}
+
+    def _load_fields(self, cls: ClassDef):
+        sup = cls.parent
+        fields, ancestors = {}, [cls.name]
         while sup is not None:
             ancestors.append(sup)
             sup = self.classes[sup]
         for anc in ancestors[::-1]:
             fields.update(self.attrs[anc])
-        self.attrs[cls] = fields
-
-    def _preload_fields(self, ctx):
-        name, _ = self._get_cls_and_sup(ctx)
-        fields = list(
-            ctx.getChildren(
-                lambda c: isinstance(c, LatteParser.FieldDefContext)
-            )
-        )
-        for field in fields:
-            self._load_field(name, field)
-
-    def _load_field(self, name, ctx):
-        field_type = ctx.type_().getText()
-        for var_ctx in ctx.ID():
-            if var_ctx.getText() in self.attrs[name]:
-                raise VariableRedeclarationError(ctx)
-            self.attrs[name][var_ctx.getText()] = field_type
-
-    def _load_headers(self, ctx):
-        name, _ = self._get_cls_and_sup(ctx)
-        methods = list(
-            ctx.getChildren(
-                lambda c: isinstance(c, LatteParser.FunDefContext)
-            )
-        )
-        for method in methods:
-            self._load_function_header(name, method)
-
-    def _load_function_header(self, obj, ctx: LatteParser.FunDefContext):
-        name = ctx.ID().getText()
-        if name in self.methods[obj]:
-            raise FunctionRedeclarationError(ctx)
-        ret_type = ctx.type_().getText()
-        types = ctx.arg().type_() if ctx.arg() else []
-        types = [t.getText() for t in types]
-        names = ctx.arg().ID() if ctx.arg() else []
-        names = [name.getText() for name in names]
-        pairs = zip(names, types)
-        self.methods[obj][name] = (
-            ret_type,
-            list(pairs)
-        )
-
-    def _get_cls_and_sup(self, ctx):
-        if isinstance(ctx, LatteParser.BaseClassDefContext):
-            return ctx.ID().getText(), self.OBJECT
-        return ctx.ID(0).getText(), ctx.ID(1).getText()
+        self.attrs[cls.name] = fields
+
+    def _preload_fields(self, cls: ClassDef):
+        for field in cls.field_defs:
+            self._load_field(cls.name, field)
+
+    def _load_field(self, name, field: FieldDef):
+        for var in field.names:
+            if var in self.attrs[name]:
+                raise VariableRedeclarationError(field)
+            self.attrs[name][var] = field.type
+
+    def _load_headers(self, cls: ClassDef):
+        for method in cls.methods:
+            self._load_function_header(cls.name, method)
+
+    def _load_function_header(self, obj, fun: FunDef):
+        if fun.name in self.methods[obj]:
+            raise FunctionRedeclarationError(fun)
+        self.methods[obj][fun.name] = (fun.ret_type, list(fun.args))
 
     def build_vtables(self):
         for cls in self.classes:
@@ -1,12 +1,10 @@
 from errors import * # noqa
 from runtime import * # noqa
+from fusion import Analysis
+from latte_ast import * # noqa
 
 
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
-
-
-class LocalsCounter(LatteVisitor):
+class LocalsCounter(Analysis):
     """
     Counts local variables for any functian (assuming reusing).
     Later used by VariableAllocator.
@@ -14,47 +12,47 @@ class LocalsCounter(LatteVisitor):
     def __init__(self):
         self.count = 0
         self.max = 0
+        self.in_class = False
+        # counts before entering blocks
+        self.counts = []
+        # expressions of DefAss are not counted
+        self.skip_depth = 0
 
-    def visitFunDef(self, ctx: LatteParser.FunDefContext):
-        self.count = 0
+    def enterClassDef(self, node: ClassDef):
+        self.in_class = True
+
+    def exitClassDef(self, node: ClassDef):
+        self.in_class = False
+
+    def enterFunDef(self, node: FunDef):
+        self.count = len(node.args)
         self.max = 0
-        self.visitChildren(ctx)
-        to_ad = 1
-        if isinstance(ctx.parentCtx, LatteParser.TopFunDefContext):
-            to_ad = 0
-        ctx.locals_count = self.max + to_ad
-
-    def visitArg(self, ctx: LatteParser.ArgContext):
-        self.count += len(ctx.ID())
-
-    def visitBlock(self, ctx: LatteParser.BlockStmtContext):
-        count = self.count
-        self.visitChildren(ctx)
-        if self.count > self.max:
-            self.max = self.count
-        self.count = count
 
-    def visitDecl(self, ctx: LatteParser.DeclContext):
-        self.visitChildren(ctx)
+    def exitFunDef(self, node: FunDef):
+        to_ad = 1 if self.in_class else 0
+        node.locals_count = self.max + to_ad
 
-    def visitDef(self, ctx: LatteParser.DefContext):
-        self.count += 1
+    def enterBlock(self, node: Block):
+        self.counts.append(self.count)
 
-    def visitDefAss(self, ctx: LatteParser.DefAssContext):
-        self.count += 1
+    def exitBlock(self, node: Block):
+        if self.count > self.max:
+            self.max = self.count
+        self.count = self.counts.pop()
 
-    def visitEAddOp(self, ctx: LatteParser.EAddOpContext):
-        self.visitChildren(ctx)
+    def exitDef(self, node: Def):
         self.count += 1
 
-    def visitEMulOp(self, ctx: LatteParser.EMulOpContext):
-        self.visitChildren(ctx)
+    def enterDefAss(self, node: DefAss):
         self.count += 1
+        self.skip_depth += 1
 
-    def visitERelOp(self, ctx: LatteParser.ERelOpContext):
-        self.visitChildren(ctx)
-        self.count += 1
+    def exitDefAss(self, node: DefAss):
+        self.skip_depth -= 1
 
-    def visitAttrAss(self, ctx: LatteParser.AttrAssContext):
-        self.visitChildren(ctx)
-        self.count += 1
+    def _count_temporary(self, node):
+        if not self.skip_depth:
+            self.count += 1
+
+    exitEAddOp = exitEMulOp = exitERelOp = _count_temporary
+    exitAttrAss = _count_temporary
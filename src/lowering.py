@@ -0,0 +1,247 @@
+"""
+Lowering of antlr's parse tree into the compact AST (latte_ast.py).
+"""
+from sys import intern
+
+from latte_ast import * # noqa
+
+from antlr4gen.LatteParser import LatteParser
+from antlr4gen.LatteVisitor import LatteVisitor
+
+
+def lower(tree: LatteParser.ProgramContext) -> Program:
+    return Lowering().visit(tree)
+
+
+class Lowering(LatteVisitor):
+    """
+    Builds AST nodes from parse tree contexts.
+    Parentheses are dropped, names and types are interned.
+    """
+    @staticmethod
+    def name(terminal) -> str:
+        return intern(terminal.getText())
+
+    def exprs(self, ctxs) -> list:
+        return [self.visit(ctx) for ctx in ctxs]
+
+    # region Definitions
+
+    def visitProgram(self, ctx: LatteParser.ProgramContext):
+        return Program(
+            ctx.start.line,
+            [self.visit(top_def) for top_def in ctx.topDef()],
+            ctx.tokens
+        )
+
+    def visitTopFunDef(self, ctx: LatteParser.TopFunDefContext):
+        return self.visit(ctx.funDef())
+
+    def visitBaseClassDef(self, ctx: LatteParser.BaseClassDefContext):
+        return ClassDef(
+            ctx.start.line, self.name(ctx.ID()), None,
+            [self.visit(f) for f in ctx.fieldDef()],
+            [self.visit(f) for f in ctx.funDef()]
+        )
+
+    def visitExtClassDef(self, ctx: LatteParser.ExtClassDefContext):
+        return ClassDef(
+            ctx.start.line, self.name(ctx.ID(0)), self.name(ctx.ID(1)),
+            [self.visit(f) for f in ctx.fieldDef()],
+            [self.visit(f) for f in ctx.funDef()]
+        )
+
+    def visitFieldDef(self, ctx: LatteParser.FieldDefContext):
+        return FieldDef(
+            ctx.start.line, self.visit(ctx.type_()),
+            [self.name(name) for name in ctx.ID()]
+        )
+
+    def visitFunDef(self, ctx: LatteParser.FunDefContext):
+        args = []
+        if ctx.arg():
+            args = [
+                (self.name(name), self.visit(type_))
+                for name, type_ in zip(ctx.arg().ID(), ctx.arg().type_())
+            ]
+        return FunDef(
+            ctx.start.line, self.visit(ctx.type_()), self.name(ctx.ID()),
+            args, self.visit(ctx.block()),
+            (ctx.start.tokenIndex, ctx.stop.tokenIndex)
+        )
+
+    # endregion
+
+    # region Statements
+
+    def visitBlock(self, ctx: LatteParser.BlockContext):
+        return Block(ctx.start.line, [self.visit(s) for s in ctx.stmt()])
+
+    def visitEmpty(self, ctx: LatteParser.EmptyContext):
+        return Empty(ctx.start.line)
+
+    def visitBlockStmt(self, ctx: LatteParser.BlockStmtContext):
+        return self.visit(ctx.block())
+
+    def visitDecl(self, ctx: LatteParser.DeclContext):
+        return Decl(
+            ctx.start.line, self.visit(ctx.type_()),
+            [self.visit(item) for item in ctx.item()]
+        )
+
+    def visitDef(self, ctx: LatteParser.DefContext):
+        return Def(ctx.start.line, self.name(ctx.ID()))
+
+    def visitDefAss(self, ctx: LatteParser.DefAssContext):
+        return DefAss(
+            ctx.start.line, self.name(ctx.ID()), self.visit(ctx.expr())
+        )
+
+    def visitAss(self, ctx: LatteParser.AssContext):
+        return Ass(ctx.start.line, self.name(ctx.ID()), self.visit(ctx.expr()))
+
+    def visitAttrAss(self, ctx: LatteParser.AttrAssContext):
+        return AttrAss(
+            ctx.start.line, self.visit(ctx.expr(0)), self.name(ctx.ID()),
+            self.visit(ctx.expr(1))
+        )
+
+    def visitArrayAss(self, ctx: LatteParser.ArrayAssContext):
+        return ArrayAss(ctx.start.line, *self.exprs(ctx.expr()))
+
+    def visitIncr(self, ctx: LatteParser.IncrContext):
+        return Incr(ctx.start.line, self.name(ctx.ID()))
+
+    def visitDecr(self, ctx: LatteParser.DecrContext):
+        return Decr(ctx.start.line, self.name(ctx.ID()))
+
+    def visitAttrIncr(self, ctx: LatteParser.AttrIncrContext):
+        return AttrIncr(
+            ctx.start.line, self.visit(ctx.expr()), self.name(ctx.ID())
+        )
+
+    def visitAttrDecr(self, ctx: LatteParser.AttrDecrContext):
+        return AttrDecr(
+            ctx.start.line, self.visit(ctx.expr()), self.name(ctx.ID())
+        )
+
+    def visitRet(self, ctx: LatteParser.RetContext):
+        return Ret(ctx.start.line, self.visit(ctx.expr()))
+
+    def visitVRet(self, ctx: LatteParser.VRetContext):
+        return VRet(ctx.start.line)
+
+    def visitCond(self, ctx: LatteParser.CondContext):
+        return Cond(
+            ctx.start.line, self.visit(ctx.expr()), self.visit(ctx.stmt())
+        )
+
+    def visitCondElse(self, ctx: LatteParser.CondElseContext):
+        return CondElse(
+            ctx.start.line, self.visit(ctx.expr()),
+            self.visit(ctx.stmt(0)), self.visit(ctx.stmt(1))
+        )
+
+    def visitWhile(self, ctx: LatteParser.WhileContext):
+        return While(
+            ctx.start.line, self.visit(ctx.expr()), self.visit(ctx.stmt())
+        )
+
+    def visitForEach(self, ctx: LatteParser.ForEachContext):
+        return ForEach(
+            ctx.start.line, self.visit(ctx.type_()), self.name(ctx.ID()),
+            self.visit(ctx.expr()), self.visit(ctx.stmt())
+        )
+
+    def visitSExp(self, ctx: LatteParser.SExpContext):
+        return SExp(ctx.start.line, self.visit(ctx.expr()))
+
+    # endregion
+
+    # region Types
+
+    def visitInt(self, ctx: LatteParser.IntContext):
+        return intern(ctx.getText())
+
+    visitStr = visitBool = visitVoid = visitClass = visitArray = visitInt
+
+    # endregion
+
+    # region Expressions
+
+    def visitEMthdCall(self, ctx: LatteParser.EMthdCallContext):
+        exprs = self.exprs(ctx.expr())
+        return EMthdCall(
+            ctx.start.line, exprs[0], self.name(ctx.ID()), exprs[1:]
+        )
+
+    def visitEAttr(self, ctx: LatteParser.EAttrContext):
+        return EAttr(
+            ctx.start.line, self.visit(ctx.expr()), self.name(ctx.ID())
+        )
+
+    def visitEUnOp(self, ctx: LatteParser.EUnOpContext):
+        return EUnOp(
+            ctx.start.line, UnOp(ctx.unOp().getText()), self.visit(ctx.expr())
+        )
+
+    def binary(self, node_type, ctx, op):
+        left, right = self.exprs(ctx.expr())
+        return node_type(ctx.start.line, op, left, right)
+
+    def visitEMulOp(self, ctx: LatteParser.EMulOpContext):
+        return self.binary(EMulOp, ctx, Op(ctx.mulOp().getText()))
+
+    def visitEAddOp(self, ctx: LatteParser.EAddOpContext):
+        return self.binary(EAddOp, ctx, Op(ctx.addOp().getText()))
+
+    def visitERelOp(self, ctx: LatteParser.ERelOpContext):
+        return self.binary(ERelOp, ctx, Op(ctx.relOp().getText()))
+
+    def visitEAnd(self, ctx: LatteParser.EAndContext):
+        return self.binary(EAnd, ctx, None)
+
+    def visitEOr(self, ctx: LatteParser.EOrContext):
+        return self.binary(EOr, ctx, None)
+
+    def visitEId(self, ctx: LatteParser.EIdContext):
+        return EId(ctx.start.line, self.name(ctx.ID()))
+
+    def visitEInt(self, ctx: LatteParser.EIntContext):
+        return EInt(ctx.start.line, int(ctx.getText()))
+
+    def visitETrue(self, ctx: LatteParser.ETrueContext):
+        return ETrue(ctx.start.line)
+
+    def visitEFalse(self, ctx: LatteParser.EFalseContext):
+        return EFalse(ctx.start.line)
+
+    def visitENewObj(self, ctx: LatteParser.ENewObjContext):
+        return ENewObj(ctx.start.line, self.visit(ctx.type_()))
+
+    def visitEFunCall(self, ctx: LatteParser.EFunCallContext):
+        return EFunCall(
+            ctx.start.line, self.name(ctx.ID()), self.exprs(ctx.expr())
+        )
+
+    def visitEStr(self, ctx: LatteParser.EStrContext):
+        return EStr(ctx.start.line, ctx.getText())
+
+    def visitECastNull(self, ctx: LatteParser.ECastNullContext):
+        return ECastNull(ctx.start.line, self.visit(ctx.type_()))
+
+    def visitEParen(self, ctx: LatteParser.EParenContext):
+        return self.visit(ctx.expr())
+
+    def visitEArrAcc(self, ctx: LatteParser.EArrAccContext):
+        return EArrAcc(ctx.start.line, *self.exprs(ctx.expr()))
+
+    def visitENewArr(self, ctx: LatteParser.ENewArrContext):
+        return ENewArr(
+            ctx.start.line, self.visit(ctx.type_()), self.visit(ctx.expr())
+        )
+
+    def visitESelf(self, ctx: LatteParser.ESelfContext):
+        return ESelf(ctx.start.line)
+
+    # endregion
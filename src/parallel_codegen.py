@@ -0,0 +1,107 @@
+"""
+Parallel code generation - once declarations are loaded (and the AST is
+checked), every function is generated independently. Functions are sent
+in batches to a pool of processes, each generating and peephole
+optimizing them by writers of their own (labels are namespaced by
+function, labels of data do not depend on the order of generation).
+Code of functions is joined in source order, so it does not depend on
+the number of processes.
+"""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from assembly_generator import AssemblyGenerator
+from assembly_writer import AssemblyWriter
+from deep_recursion import run_deep
+from incremental import find_functions
+from latte_ast import Program
+
+# batches per process, more of them balance the work better
+BATCHES_PER_JOB = 4
+
+# generator of a worker process, set up by `init_worker`
+_code_gen = None
+_peephole = False
+
+
+def init_worker(context: bytes):
+    global _code_gen, _peephole
+    state, strings, _peephole = pickle.loads(context)
+    _code_gen = AssemblyGenerator(strings, None)
+    # layouts (read-only views) are built again from the state
+    _code_gen.set_state(*state)
+    _code_gen.prepare_stable_labels()
+
+
+def generate_batch(batch: bytes):
+    """
+    Code of each function of the (pickled) batch of (function, class)
+    pairs, as (instructions, comments, instructions before peephole).
+    Returns them with whether the empty string was used.
+    """
+    from peephole_optimizer import PeepholeOptimizer
+    _code_gen.empty_string_used = 0
+    results = []
+    for fun, obj in pickle.loads(batch):
+        writer = _code_gen.generate_function(fun, obj)
+        generated = len(writer.instructions)
+        if _peephole:
+            PeepholeOptimizer(writer).optimize()
+        results.append((writer.instructions, writer.comments, generated))
+    return results, _code_gen.empty_string_used
+
+
+def split(items: list, parts: int) -> list:
+    """ `items` in at most `parts` consecutive batches of similar size. """
+    size, rest = divmod(len(items), parts)
+    batches, start = [], 0
+    for i in range(parts):
+        end = start + size + (i < rest)
+        if end > start:
+            batches.append(items[start:end])
+        start = end
+    return batches
+
+
+class ParallelBuild:
+    """
+    Generates functions of `program` on `jobs` processes (peephole
+    optimizing them too, with `peephole`) and joins their code.
+    """
+    def __init__(self, program: Program, jobs: int, peephole: bool):
+        self.program = program
+        self.jobs = jobs
+        self.peephole = peephole
+        # instructions generated, before peephole optimization
+        self.generated = 0
+
+    def generate(self, code_gen: AssemblyGenerator) -> AssemblyWriter:
+        """ Code of the whole program, with text and data sections. """
+        code_gen.prepare_stable_labels()
+        functions = [
+            (fun, obj) for fun, obj, _ in find_functions(self.program)
+        ]
+        batches = [
+            run_deep(pickle.dumps, batch)
+            for batch in split(functions, BATCHES_PER_JOB * self.jobs)
+        ]
+        context = pickle.dumps((
+            code_gen.get_state(), code_gen.strings, self.peephole
+        ))
+
+        writer = AssemblyWriter()
+        empty_string_used = False
+        with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(batches)) or 1,
+                initializer=init_worker, initargs=(context,)
+        ) as executor:
+            for results, empty in executor.map(generate_batch, batches):
+                empty_string_used |= bool(empty)
+                for instructions, comments, generated in results:
+                    writer.instructions += instructions
+                    writer.comments += comments
+                    self.generated += generated
+        sections = len(writer.instructions)
+        code_gen.gen_sections(writer, empty_string_used)
+        self.generated += len(writer.instructions) - sections
+        return writer
@@ -0,0 +1,203 @@
+"""
+Parsing of Latte sources into antlr's parse tree.
+"""
+from antlr4 import CommonTokenStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from atn_cache import import_recognizers
+from fast_lexer import FastLexer
+
+
+LatteLexer, LatteParser = import_recognizers()
+
+# alternatives `if (...) stmt` and `if (...) stmt else stmt` of rule stmt
+# (numbered in order of Latte.g4)
+COND, COND_ELSE = 13, 14
+
+
+class ElseBindingATNSimulator(ParserATNSimulator):
+    """
+    SLL prediction ignores what surrounds a statement, so an `else` may
+    always follow it and every `if` is a conflict between Cond and CondElse.
+    antlr resolves SLL conflicts with the first alternative (Cond), failing
+    on every `else`; CondElse is predicted instead. It binds `else` to the
+    innermost `if`, as full LL prediction does (when an `if` takes an `else`
+    meant for an outer one, SLL parsing fails and LL decides).
+    """
+    def computeTargetState(self, dfa, previousD, t):
+        state = super().computeTargetState(dfa, previousD, t)
+        prefer_else(state)
+        return state
+
+
+def prefer_else(state):
+    if state.requiresFullContext and \
+            state.configs.conflictingAlts == {COND, COND_ELSE}:
+        state.prediction = COND_ELSE
+
+
+# DFAs loaded from the ATN cache might predate the simulator
+for _dfa in LatteParser.decisionsToDFA:
+    for _state in _dfa.states:
+        prefer_else(_state)
+
+
+class LatteSyntaxError(SyntaxError):
+    """ Syntax error with its position in the source. """
+    def __init__(self, line: int, column: int, msg: str):
+        super().__init__(
+            f"Syntax Error at line {line} and column {column}.\n"
+            f'Error message: {msg}.'
+        )
+        self.line = line
+        self.column = column
+
+
+class LatteErrorListener(ErrorListener):
+    """ Error listener for antlr4 errors. """
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        raise LatteSyntaxError(line, column, msg)
+
+
+# parsers not in use, each parse takes one (or creates it) and returns it
+_idle_parsers = []
+
+
+def _take_parser(stream: CommonTokenStream) -> LatteParser:
+    try:
+        parser = _idle_parsers.pop()
+    except IndexError:
+        parser = LatteParser(stream)
+        parser._interp = ElseBindingATNSimulator(
+            parser, parser.atn, parser.decisionsToDFA,
+            parser.sharedContextCache
+        )
+    else:
+        parser.setTokenStream(stream)
+    parser.removeErrorListeners()
+    return parser
+
+
+def _return_parser(parser: LatteParser):
+    # an idle parser must not keep tokens (nor trees) of its last source
+    parser.setTokenStream(None)
+    parser._interp._input = parser._interp._outerContext = None
+    _idle_parsers.append(parser)
+
+
+def _token_stream(input_stream, fast_lexer: bool, lexer_listener):
+    input_stream.seek(0)
+    lexer = (FastLexer if fast_lexer else LatteLexer)(input_stream)
+    if lexer_listener:
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(lexer_listener)
+    return CommonTokenStream(lexer)
+
+
+def parse(
+        input_stream, sll: bool = True, fast_lexer: bool = True,
+        lexer_listener: ErrorListener = None
+) -> LatteParser.ProgramContext:
+    """
+    Parses `input_stream` (from its beginning). With `sll`, the source
+    is parsed with faster SLL prediction first and parsed again with full
+    LL only if that fails, so that exactly the same inputs are accepted.
+    Which prediction produced the tree is kept in its `prediction` field,
+    tokens of the source in its `tokens` field.
+    With `fast_lexer`, tokens come from the hand-written FastLexer.
+    Lexer errors go to `lexer_listener` (if given) instead of stderr.
+    """
+    stream = _token_stream(input_stream, fast_lexer, lexer_listener)
+    parser = _take_parser(stream)
+
+    tree = None
+    if sll:
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        try:
+            tree = parser.program()
+            tree.prediction = 'SLL'
+        except ParseCancellationException:
+            # either a syntax error or a construct SLL cannot decide
+            stream.seek(0)
+            parser.reset()
+
+    if tree is None:
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        parser.addErrorListener(LatteErrorListener())
+        tree = parser.program()
+        tree.prediction = 'LL'
+    tree.tokens = stream.tokens
+    _return_parser(parser)
+    return tree
+
+
+# tokens which can start a top level definition
+TOP_DEF_START = LatteParser.atn.nextTokens(
+    LatteParser.atn.ruleToStartState[LatteParser.RULE_topDef]
+)
+
+
+class TopDefParser:
+    """
+    Parses the source one top level definition (function or class) at a
+    time - iterating yields their parse trees, in order. Tokens of parsed
+    definitions are dropped, so only the current one is held in memory.
+    Accepts the same sources as `parse` does (with the same options),
+    SLL prediction falls back to LL for a single definition.
+    """
+    def __init__(
+            self, input_stream, sll: bool = True, fast_lexer: bool = True,
+            lexer_listener: ErrorListener = None
+    ):
+        self.stream = _token_stream(input_stream, fast_lexer, lexer_listener)
+        self.sll = sll
+        # definitions parsed with full LL prediction
+        self.ll_fallbacks = 0
+
+    def __iter__(self):
+        parser = _take_parser(self.stream)
+        try:
+            if self.stream.LA(1) not in TOP_DEF_START:
+                # the error is reported by the rule of the whole program
+                self._parse(parser, parser.program)
+                return
+            while self.stream.LA(1) in TOP_DEF_START:
+                yield self._parse(parser, parser.topDef)
+                self._drop_parsed()
+        finally:
+            _return_parser(parser)
+
+    def _parse(self, parser: LatteParser, rule):
+        stream, start = self.stream, self.stream.index
+        if self.sll:
+            parser._interp.predictionMode = PredictionMode.SLL
+            parser._errHandler = BailErrorStrategy()
+            try:
+                return rule()
+            except ParseCancellationException:
+                self.ll_fallbacks += 1
+                parser.reset()
+                stream.seek(start)
+
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        parser.addErrorListener(LatteErrorListener())
+        try:
+            return rule()
+        finally:
+            parser.removeErrorListeners()
+
+    def _drop_parsed(self):
+        """ Forgets tokens before the current one, renumbering the rest. """
+        stream = self.stream
+        rest = stream.tokens[stream.index:]
+        for i, token in enumerate(rest):
+            token.tokenIndex = i
+        stream.tokens = rest
+        stream.index = 0
@@ -0,0 +1,526 @@
+"""
+Pass manager - compilation is a pipeline of passes, each declaring which
+results (annotations of the AST, like `expr_type`, or products, like the
+assembly) it requires and provides. The optimization level chooses which
+optimizations run, other passes run only when their results are needed.
+"""
+from deep_recursion import run_deep
+from fusion import FusedTraversal
+
+
+# optimizations enabled by -O0 ... -O3
+LEVELS = {
+    0: (),
+    1: ('PeepholeOptimizer', 'RegisterAllocator'),
+    2: (
+        'ConstantPropagator', 'TreeOptimizer', 'PeepholeOptimizer',
+        'ValueNumbering', 'RegisterAllocator'
+    ),
+    3: (
+        'ConstantPropagator', 'TreeOptimizer', 'PeepholeOptimizer',
+        'ValueNumbering', 'RegisterAllocator'
+    ),
+}
+DEFAULT_LEVEL = 2
+
+
+def optimizations(
+        level: int = DEFAULT_LEVEL, const_expr: bool = None,
+        peephole: bool = None, regalloc: bool = None, gvn: bool = None
+) -> frozenset:
+    """
+    Names of optimizations of `level`, with the tree optimizer (and
+    constant propagation feeding it), the peephole optimizer, the
+    register allocator and value numbering switched on or off explicitly
+    unless `const_expr`, `peephole`, `regalloc` and `gvn` are None.
+    """
+    chosen = set(LEVELS[level])
+    for name, enabled in (
+            ('ConstantPropagator', const_expr), ('TreeOptimizer', const_expr),
+            ('PeepholeOptimizer', peephole), ('RegisterAllocator', regalloc),
+            ('ValueNumbering', gvn)
+    ):
+        if enabled is True:
+            chosen.add(name)
+        elif enabled is False:
+            chosen.discard(name)
+    return frozenset(chosen)
+
+
+class Compilation:
+    """ Everything passes know about the compiled source. """
+    def __init__(
+            self, input_stream, optimizations: frozenset, stats,
+            cache=None, module=None, sll: bool = True,
+            fast_lexer: bool = True, lexer_listener=None, output=None,
+            codegen_jobs: int = 1, backend: str = 'ast', ssa: bool = False,
+            ir_output=None
+    ):
+        self.input_stream = input_stream
+        self.optimizations = optimizations
+        self.stats = stats
+        self.cache = cache
+        self.module = module
+        self.sll = sll
+        self.fast_lexer = fast_lexer
+        self.lexer_listener = lexer_listener
+        # file written by streaming compilation (see streaming.py)
+        self.output = output
+        # processes generating code (see parallel_codegen.py)
+        self.codegen_jobs = codegen_jobs
+        # 'ast' generates code from the AST, 'ir' through the IR (see ir.py)
+        self.backend = backend
+        self.ssa = ssa
+        # file the IR is written to (see --emit-ir)
+        self.ir_output = ir_output
+
+        # the parse tree, then the AST
+        self.tree = None
+        self.loader = None
+        self.incremental = None
+        self.parallel = None
+        self.strings = None
+        # IR functions of the program
+        self.ir = None
+        self.writer = None
+        self.code_gen = None
+        # writers of generated functions, when compiled one by one
+        self.writers = None
+        # results provided by passes run so far
+        self.available = set()
+
+
+class Pass:
+    """
+    A step of compilation, which can run once results it `requires`
+    are available. Then its results (`provides`) are available
+    and results it `invalidates` are not.
+    A pass is a `goal` if it runs even when none of its results are
+    needed - semantic checks, code generation and optimizations.
+    """
+    name = ''
+    requires = ()
+    provides = ()
+    invalidates = ()
+    goal = False
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return True
+
+    def run(self, compilation: Compilation):
+        raise NotImplementedError
+
+
+class Optimization(Pass):
+    """ A pass run only when enabled by the optimization level. """
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return self.name in compilation.optimizations
+
+
+class AnalysisPass(Pass):
+    """
+    A pass made of an Analysis (see fusion.py).
+    Consecutive analyses run fused, in a single traversal.
+    """
+    def analysis(self, compilation: Compilation):
+        raise NotImplementedError
+
+    def finish(self, compilation: Compilation, analysis):
+        """ Takes results of `analysis` once it has run. """
+
+
+class Parse(Pass):
+    name = 'parse'
+    provides = ('parse_tree',)
+
+    def run(self, compilation: Compilation):
+        from parsing import parse
+        c = compilation
+        c.tree = run_deep(
+            parse, c.input_stream, c.sll, c.fast_lexer, c.lexer_listener
+        )
+        c.stats.watch(c.tree)
+        if c.sll:
+            c.stats.count('ll_fallback', int(c.tree.prediction == 'LL'))
+
+
+class Lower(Pass):
+    name = 'lower'
+    requires = ('parse_tree',)
+    provides = ('ast',)
+    invalidates = ('parse_tree',)
+
+    def run(self, compilation: Compilation):
+        from lowering import lower
+        compilation.tree = run_deep(lower, compilation.tree)
+        compilation.stats.watch(compilation.tree)
+
+
+class LoadState(Pass):
+    name = 'LatteStateLoader'
+    requires = ('ast',)
+    provides = ('state',)
+
+    def run(self, compilation: Compilation):
+        from latte_state import LatteStateLoader
+        module = compilation.module
+        loader = LatteStateLoader()
+        if module:
+            for interface in module.imports:
+                loader.load_interface(interface)
+        loader.load(compilation.tree)
+        if module:
+            from interface import ModuleInterface
+            module.exports = ModuleInterface.from_state(
+                loader.get_state(), module.imports
+            )
+        compilation.loader = loader
+
+
+class PruneUnchanged(Pass):
+    """ Leaves only functions without cached code in the AST. """
+    name = 'IncrementalBuild'
+    requires = ('state',)
+    provides = ('pruned',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.cache is not None
+
+    def run(self, compilation: Compilation):
+        from incremental import IncrementalBuild
+        c = compilation
+        c.incremental = IncrementalBuild(
+            c.cache, c.tree, c.loader.get_state(),
+            {'optimizations': sorted(c.optimizations)}
+        )
+        c.incremental.prune()
+
+
+class CheckTypes(AnalysisPass):
+    name = 'ErrorChecker'
+    requires = ('ast', 'state')
+    provides = ('expr_type',)
+    goal = True
+
+    def analysis(self, compilation: Compilation):
+        from error_checker import ErrorChecker
+        loader = compilation.loader
+        checker = ErrorChecker(require_main=compilation.module is None)
+        checker.set_state(*loader.get_state(), loader.layouts)
+        return checker
+
+
+class EvaluateConstants(AnalysisPass):
+    name = 'ExpressionEvaluator'
+    requires = ('expr_type',)
+    provides = ('expr_value',)
+
+    def analysis(self, compilation: Compilation):
+        from expression_evaluator import ExpressionEvaluator
+        return ExpressionEvaluator()
+
+
+class CheckReturns(AnalysisPass):
+    name = 'ReturnAbilityChecker'
+    requires = ('expr_value',)
+    provides = ('returns_checked',)
+    goal = True
+
+    def analysis(self, compilation: Compilation):
+        from return_checker import ReturnAbilityChecker
+        return ReturnAbilityChecker()
+
+
+class PropagateConstants(Optimization):
+    name = 'ConstantPropagator'
+    # values it finds must not make more functions return
+    requires = ('expr_value', 'returns_checked')
+    provides = ('constants_propagated',)
+
+    def run(self, compilation: Compilation):
+        from constant_propagator import ConstantPropagator
+        propagator = ConstantPropagator()
+        propagator.visit(compilation.tree)
+        compilation.stats.count('constants_propagated', propagator.propagated)
+
+
+class OptimizeTree(Optimization):
+    name = 'TreeOptimizer'
+    requires = ('expr_value',)
+    provides = ('tree_optimized',)
+    # they describe the tree before it was changed
+    invalidates = ('locals_count', 'strings')
+
+    def run(self, compilation: Compilation):
+        from tree_optimizer import TreeOptimizer
+        TreeOptimizer().visit(compilation.tree)
+
+
+class CountLocals(AnalysisPass):
+    name = 'LocalsCounter'
+    requires = ('ast',)
+    provides = ('locals_count',)
+
+    def analysis(self, compilation: Compilation):
+        from locals_counter import LocalsCounter
+        return LocalsCounter()
+
+
+class FindStrings(AnalysisPass):
+    name = 'StringFinder'
+    requires = ('ast',)
+    provides = ('strings',)
+
+    def analysis(self, compilation: Compilation):
+        from string_finder import StringFinder
+        return StringFinder()
+
+    def finish(self, compilation: Compilation, analysis):
+        compilation.strings = analysis.get_strings()
+
+
+class LowerToIR(Pass):
+    name = 'IRBuilder'
+    requires = ('state', 'expr_type')
+    provides = ('ir',)
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.backend == 'ir'
+
+    def run(self, compilation: Compilation):
+        from ir_lowering import IRBuilder
+        c = compilation
+        builder = IRBuilder()
+        builder.set_state(*c.loader.get_state(), c.loader.layouts)
+        c.ir = builder.visit(c.tree)
+        c.stats.count('ir_functions', len(c.ir))
+
+
+class BuildSSA(Pass):
+    name = 'SSABuilder'
+    requires = ('ir',)
+    provides = ('ssa',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.backend == 'ir' and compilation.ssa
+
+    def run(self, compilation: Compilation):
+        import ssa
+        for fun in compilation.ir:
+            ssa.build(fun)
+
+
+class NumberValues(Optimization):
+    name = 'ValueNumbering'
+    requires = ('ssa',)
+    provides = ('values_numbered',)
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return super().enabled(compilation) and \
+            BuildSSA().enabled(compilation)
+
+    def run(self, compilation: Compilation):
+        from value_numbering import number_values
+        removed = sum(number_values(fun) for fun in compilation.ir)
+        compilation.stats.count('redundant_instructions', removed)
+
+
+class DumpIR(Pass):
+    name = 'IRPrinter'
+    requires = ('ir',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.ir_output is not None
+
+    def run(self, compilation: Compilation):
+        from ir import format_functions
+        compilation.ir_output.write(format_functions(compilation.ir))
+
+
+class LeaveSSA(Pass):
+    name = 'SSADestructor'
+    requires = ('ssa',)
+    invalidates = ('ssa',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return BuildSSA().enabled(compilation)
+
+    def run(self, compilation: Compilation):
+        import ssa
+        for fun in compilation.ir:
+            ssa.destruct(fun)
+
+
+class AllocateRegisters(Optimization):
+    name = 'RegisterAllocator'
+    requires = ('ir',)
+    provides = ('registers',)
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return super().enabled(compilation) and compilation.backend == 'ir'
+
+    def run(self, compilation: Compilation):
+        from register_allocator import allocate
+        for fun in compilation.ir:
+            allocate(fun)
+        compilation.stats.count('registers_allocated', sum(
+            len(fun.registers) for fun in compilation.ir
+        ))
+
+
+class EmitAssembly(Pass):
+    name = 'IREmitter'
+    requires = ('ir', 'state', 'strings')
+    provides = ('assembly',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.backend == 'ir'
+
+    def run(self, compilation: Compilation):
+        from assembly_generator import AssemblyGenerator
+        from ir_emitter import IREmitter
+        c = compilation
+        c.code_gen = AssemblyGenerator(c.strings, None, c.module)
+        c.code_gen.set_state(*c.loader.get_state(), c.loader.layouts)
+        c.code_gen.prepare_stable_labels()
+        c.writer = IREmitter(c.code_gen).emit(c.ir)
+        c.stats.count('instructions', instructions(c))
+
+
+class GenerateCode(Pass):
+    name = 'AssemblyGenerator'
+    requires = ('state', 'expr_type', 'locals_count', 'strings')
+    provides = ('assembly',)
+    goal = True
+
+    def enabled(self, compilation: Compilation) -> bool:
+        return compilation.backend == 'ast'
+
+    def run(self, compilation: Compilation):
+        from assembly_generator import AssemblyGenerator
+        from assembly_writer import AssemblyWriter
+        c = compilation
+        c.writer = AssemblyWriter()
+        strings = c.strings
+        if c.incremental:
+            strings = c.incremental.strings(strings)
+        c.code_gen = AssemblyGenerator(strings, c.writer, c.module)
+        c.code_gen.set_state(*c.loader.get_state(), c.loader.layouts)
+        if c.incremental:
+            c.incremental.generate(c.code_gen)
+        elif c.codegen_jobs > 1:
+            from parallel_codegen import ParallelBuild
+            c.parallel = ParallelBuild(
+                c.tree, c.codegen_jobs, 'PeepholeOptimizer' in c.optimizations
+            )
+            c.writer = c.parallel.generate(c.code_gen)
+        else:
+            c.code_gen.visit(c.tree)
+        c.stats.count(
+            'instructions',
+            c.parallel.generated if c.parallel else instructions(c)
+        )
+
+
+class OptimizePeephole(Optimization):
+    name = 'PeepholeOptimizer'
+    requires = ('assembly',)
+    provides = ('peephole_optimized',)
+
+    def enabled(self, compilation: Compilation) -> bool:
+        # its patterns assume code of AssemblyGenerator
+        return super().enabled(compilation) and compilation.backend == 'ast'
+
+    def run(self, compilation: Compilation):
+        c = compilation
+        if c.incremental:
+            c.incremental.optimize()
+        elif not c.parallel:
+            # (functions built in parallel are optimized as generated)
+            from peephole_optimizer import PeepholeOptimizer
+            PeepholeOptimizer(c.writer).optimize()
+        c.stats.count('instructions_after_peephole', instructions(c))
+
+
+def instructions(compilation: Compilation) -> int:
+    if compilation.incremental:
+        return compilation.incremental.instructions()
+    return len(compilation.writer.instructions)
+
+
+# in order of running
+PIPELINE = [
+    Parse(), Lower(), LoadState(), PruneUnchanged(),
+    CheckTypes(), EvaluateConstants(), CheckReturns(),
+    PropagateConstants(), OptimizeTree(),
+    CountLocals(), FindStrings(),
+    LowerToIR(), BuildSSA(), NumberValues(), DumpIR(), LeaveSSA(),
+    AllocateRegisters(),
+    GenerateCode(), EmitAssembly(), OptimizePeephole(),
+]
+
+
+class PassManager:
+    """
+    Runs enabled goals of the pipeline and passes providing what they
+    (transitively) require. A pass is skipped when all its results
+    are already available.
+    """
+    def __init__(self, pipeline: list = None):
+        self.pipeline = PIPELINE if pipeline is None else pipeline
+
+    def schedule(self, compilation: Compilation) -> list:
+        """ Passes to run, in order of the pipeline. """
+        enabled = [p for p in self.pipeline if p.enabled(compilation)]
+        needed = set()
+        scheduled = []
+        for p in reversed(enabled):
+            if p.goal or needed & set(p.provides):
+                scheduled.append(p)
+                needed.update(p.requires)
+        return scheduled[::-1]
+
+    def run(self, compilation: Compilation):
+        analyses = []
+        for p in self.schedule(compilation):
+            if p.provides and compilation.available.issuperset(p.provides):
+                continue
+            missing = set(p.requires) - compilation.available
+            missing -= {r for a in analyses for r in a.provides}
+            if missing:
+                raise ValueError(
+                    f'{p.name} requires {", ".join(sorted(missing))}, '
+                    f'which no earlier pass provides'
+                )
+            if isinstance(p, AnalysisPass):
+                analyses.append(p)
+                continue
+            self._run_analyses(analyses, compilation)
+            analyses = []
+            with compilation.stats.measure(p.name):
+                p.run(compilation)
+            self._update(p, compilation)
+        self._run_analyses(analyses, compilation)
+
+    def _run_analyses(self, passes: list, compilation: Compilation):
+        if not passes:
+            return
+        analyses = [p.analysis(compilation) for p in passes]
+        fused = FusedTraversal(analyses)
+        with compilation.stats.measure(fused.name):
+            fused.run(compilation.tree)
+        for p, analysis in zip(passes, analyses):
+            p.finish(compilation, analysis)
+            self._update(p, compilation)
+
+    @staticmethod
+    def _update(p: Pass, compilation: Compilation):
+        compilation.available.update(p.provides)
+        compilation.available.difference_update(p.invalidates)
@@ -0,0 +1,96 @@
+"""
+Instrumentation of compiler passes (see --time-passes, --stats-json).
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+def count_nodes(tree) -> int:
+    """ Number of nodes in parse tree or AST (without recursion). """
+    count, stack = 0, [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        children = getattr(node, 'children', None) or []
+        # AST nodes generate their children, antlr's contexts list them
+        stack.extend(children() if callable(children) else children)
+    return count
+
+
+class PassStats:
+    """
+    Records wall time, peak traced memory and parse tree size
+    after each pass, plus arbitrary counters (e.g. instruction counts).
+    When disabled, measuring costs nothing. Tracing memory slows passes
+    down considerably, so it can be turned off for timing.
+    """
+    def __init__(self, enabled: bool = True, trace_memory: bool = True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.passes = []
+        self.counters = {}
+        self.tree = None
+
+    def watch(self, tree):
+        """ Makes following measurements count nodes of `tree`. """
+        self.tree = tree
+
+    @contextmanager
+    def measure(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        if self.trace_memory:
+            was_tracing = tracemalloc.is_tracing()
+            # restart, so that peak is measured for this pass only
+            tracemalloc.stop()
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = 0
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                if not was_tracing:
+                    tracemalloc.stop()
+            self.passes.append({
+                'pass': name,
+                'time': elapsed,
+                'peak_memory': peak,
+                'nodes': count_nodes(self.tree) if self.tree else None
+            })
+
+    def count(self, name: str, value: int):
+        if self.enabled:
+            self.counters[name] = value
+
+    def to_dict(self) -> dict:
+        return {
+            'passes': self.passes,
+            'total_time': sum(p['time'] for p in self.passes),
+            'counters': self.counters
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def format_table(stats: dict) -> str:
+    """ Human readable form of `PassStats.to_dict()`. """
+    lines = [
+        f'{"pass":<24}{"time [ms]":>12}{"peak mem [KiB]":>16}{"nodes":>10}'
+    ]
+    for p in stats['passes']:
+        nodes = '' if p['nodes'] is None else p['nodes']
+        lines.append(
+            f'{p["pass"]:<24}{1000 * p["time"]:>12.2f}'
+            f'{p["peak_memory"] / 1024:>16.1f}{nodes:>10}'
+        )
+    lines.append(f'{"total":<24}{1000 * stats["total_time"]:>12.2f}')
+    for name, value in stats['counters'].items():
+        lines.append(f'{name}: {value}')
+    return '\n'.join(lines)
@@ -1,5 +1,8 @@
 from assembly_writer import AssemblyWriter
 
+# instructions which (also) write EAX without naming it
+WRITES_EAX = {'mul', 'idiv', 'cdq', 'call'}
+
 
 class PeepholeOptimizer:
     """
@@ -50,7 +53,7 @@ class PeepholeOptimizer:
     def mov_ab_xd_ba(self):
         to_remove = []
         for i, (ab, xd, ba) in self.iter_instructions(3):
-            if ':' in xd:
+            if ':' in xd or xd[0] in WRITES_EAX:
                 continue
             if len(ab) == len(ba) == 3:
                 if ab[0] == ba[0] == 'mov':
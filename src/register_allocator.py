@@ -0,0 +1,182 @@
+"""
+Linear scan register allocation of IR functions (Poletto and Sarkar),
+run after SSA form is left. Every temporary gets a live interval over
+the instructions in order of emission. Intervals are scanned by their
+start, each taking a free register; when none is free, the interval
+used least (uses weighted by loop depth) is spilled to the stack.
+EAX is left to the emitter as scratch (and for return values).
+"""
+from bisect import bisect_left
+
+from ir import Binary, Call, Function, Temp
+from latte_ast import Op
+from ssa import reverse_postorder
+
+# in order of preference - caller-saved ones need not be saved
+REGISTERS = ('ECX', 'EDX', 'EBX', 'ESI', 'EDI')
+CALLEE_SAVED = ('EBX', 'ESI', 'EDI')
+# how much more a use in a loop weighs than one outside
+LOOP_WEIGHT = 10
+# loops deeper than that do not weigh more
+MAX_LOOP_DEPTH = 8
+
+
+def clobbers(instr) -> bool:
+    """ If `instr` overwrites caller-saved registers. """
+    if type(instr) is Call:
+        return True
+    return type(instr) is Binary and instr.op in (Op.DIV, Op.MOD)
+
+
+def loop_depths(fun: Function) -> dict:
+    """
+    Block -> number of (natural) loops containing it. Graphs of structured
+    code are reducible, so edges going back in reverse postorder are
+    exactly the back edges of loops.
+    """
+    preds = fun.predecessors()
+    order = reverse_postorder(fun)
+    index = {block: i for i, block in enumerate(order)}
+    # loop header -> blocks of its loops
+    loops = {}
+    for block in order:
+        for succ in block.successors():
+            if index[succ] > index[block]:
+                continue
+            # blocks reaching the back edge without the header loop
+            body = loops.setdefault(succ, {succ})
+            work = [block]
+            while work:
+                member = work.pop()
+                if member not in body:
+                    body.add(member)
+                    work += preds[member]
+    depths = dict.fromkeys(fun.blocks, 0)
+    for body in loops.values():
+        for block in body:
+            depths[block] += 1
+    return depths
+
+
+def liveness(fun: Function) -> tuple:
+    """ Temporaries live at the start and at the end of each block. """
+    used, defined = {}, {}
+    for block in fun.blocks:
+        gen, kill = set(), set()
+        for instr in block.instrs:
+            gen.update(t for t in instr.temps() if t not in kill)
+            if instr.dest is not None:
+                kill.add(instr.dest)
+        used[block], defined[block] = gen, kill
+    live_in = {block: set() for block in fun.blocks}
+    out = {block: set() for block in fun.blocks}
+    changed = True
+    while changed:
+        changed = False
+        for block in reversed(fun.blocks):
+            live = set()
+            for succ in block.successors():
+                live |= live_in[succ]
+            if live != out[block]:
+                out[block] = live
+                changed = True
+            live_in[block] = used[block] | (live - defined[block])
+    return live_in, out
+
+
+class Interval:
+    """
+    Positions where a temporary is live. An instruction at index i reads
+    its operands at 2i and writes its result at 2i + 1.
+    """
+    __slots__ = ('temp', 'start', 'end', 'weight', 'register')
+
+    def __init__(self, temp: Temp, position: int):
+        self.temp = temp
+        self.start = self.end = position
+        self.weight = 0
+        self.register = None
+
+    def cover(self, position: int):
+        if position < self.start:
+            self.start = position
+        elif position > self.end:
+            self.end = position
+
+
+class LinearScan:
+    """ Allocates registers to temporaries of `fun`. """
+    def __init__(self, fun: Function):
+        self.fun = fun
+        self.intervals = {}
+        # indices of instructions overwriting caller-saved registers
+        self.clobbers = []
+
+    def allocate(self) -> dict:
+        """ Temporary -> register, for temporaries not spilled. """
+        self.build_intervals()
+        active = []
+        for interval in sorted(
+                self.intervals.values(), key=lambda i: (i.start, i.temp.id)
+        ):
+            active = [i for i in active if i.end >= interval.start]
+            allowed = REGISTERS if not self.crosses_clobber(interval) \
+                else CALLEE_SAVED
+            taken = {i.register for i in active}
+            free = [r for r in allowed if r not in taken]
+            if free:
+                interval.register = free[0]
+                active.append(interval)
+                continue
+            victim = min(
+                (i for i in active if i.register in allowed),
+                key=lambda i: (i.weight, -i.end)
+            )
+            if victim.weight < interval.weight:
+                interval.register, victim.register = victim.register, None
+                active.remove(victim)
+                active.append(interval)
+        return {
+            temp: interval.register
+            for temp, interval in self.intervals.items() if interval.register
+        }
+
+    def build_intervals(self):
+        fun = self.fun
+        depths = loop_depths(fun)
+        live_in, live_out = liveness(fun)
+        for param in fun.params:
+            self.intervals[param] = Interval(param, -1)
+        index = 0
+        for block in fun.blocks:
+            weight = LOOP_WEIGHT ** min(depths[block], MAX_LOOP_DEPTH)
+            for temp in live_in[block]:
+                self.occur(temp, 2 * index, 0)
+            for instr in block.instrs:
+                if clobbers(instr):
+                    self.clobbers.append(index)
+                for temp in instr.temps():
+                    self.occur(temp, 2 * index, weight)
+                if instr.dest is not None:
+                    self.occur(instr.dest, 2 * index + 1, weight)
+                index += 1
+            for temp in live_out[block]:
+                self.occur(temp, 2 * index - 1, 0)
+
+    def occur(self, temp: Temp, position: int, weight: int):
+        interval = self.intervals.get(temp)
+        if interval is None:
+            interval = self.intervals[temp] = Interval(temp, position)
+        interval.cover(position)
+        interval.weight += weight
+
+    def crosses_clobber(self, interval: Interval) -> bool:
+        """ If the interval is live while a clobbering instruction runs. """
+        i = bisect_left(self.clobbers, (interval.start + 1) // 2)
+        return i < len(self.clobbers) and \
+            2 * self.clobbers[i] + 2 <= interval.end
+
+
+def allocate(fun: Function):
+    """ Keeps temporaries of `fun` in registers (see Function.registers). """
+    fun.registers = LinearScan(fun).allocate()
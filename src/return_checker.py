@@ -1,51 +1,51 @@
 from errors import * # noqa
 from runtime import * # noqa
+from fusion import Analysis
+from latte_ast import * # noqa
 
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
 
-
-class ReturnAbilityChecker(LatteVisitor):
+class ReturnAbilityChecker(Analysis):
     """
     Validates return statements
     (each branching in each function should have one).
+    Whether a statement always returns is decided after its substatements,
+    using values of constant conditions.
     """
+    requires = ('ExpressionEvaluator',)
+
     def __init__(self):
-        self.ok = False
-
-    def visitFunDef(self, ctx: LatteParser.FunDefContext):
-        function_type = ctx.type_().getText()
-        if function_type != VOID: # noqa
-            self.ok = False
-            self.visitChildren(ctx)
-            if not self.ok:
-                raise UnreachableReturnError(ctx) # noqa
-
-    def visitRet(self, ctx: LatteParser.RetContext):
-        self.ok = True
-
-    def visitVRet(self, ctx: LatteParser.VRetContext):
-        self.ok = True
-
-    def visitCond(self, ctx: LatteParser.CondContext):
-        if ctx.expr().expr_value:
-            self.visit(ctx.stmt())
-
-    def visitCondElse(self, ctx: LatteParser.CondElseContext):
-        if self.ok:
-            return
-        cond = ctx.expr().expr_value
+        # statements which always return
+        self.returning = set()
+
+    def exitFunDef(self, node: FunDef):
+        if node.ret_type != VOID: # noqa
+            if node.body not in self.returning:
+                raise UnreachableReturnError(node) # noqa
+        self.returning.clear()
+
+    def exitRet(self, node: Ret):
+        self.returning.add(node)
+
+    def exitVRet(self, node: VRet):
+        self.returning.add(node)
+
+    def exitBlock(self, node: Block):
+        if any(stmt in self.returning for stmt in node.stmts):
+            self.returning.add(node)
+
+    def exitCond(self, node: Cond):
+        if node.cond.expr_value and node.stmt in self.returning:
+            self.returning.add(node)
+
+    def exitCondElse(self, node: CondElse):
+        cond = node.cond.expr_value
         if cond is True:
-            self.visit(ctx.stmt(0))
+            branches = [node.stmt]
         elif cond is False:
-            self.visit(ctx.stmt(1))
+            branches = [node.else_stmt]
         else:
-            self.visit(ctx.stmt(0))
-            if not self.ok:
-                return
-            self.ok = False
-            self.visit(ctx.stmt(1))
-
-    def visitWhile(self, ctx: LatteParser.WhileContext):
-        if ctx.expr().expr_value:
-            self.visit(ctx.stmt())
+            branches = [node.stmt, node.else_stmt]
+        if all(stmt in self.returning for stmt in branches):
+            self.returning.add(node)
+
+    exitWhile = exitCond
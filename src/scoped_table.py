@@ -0,0 +1,65 @@
+"""
+Symbol table of nested scopes.
+"""
+
+_MISSING = object()
+
+
+class ScopedTable:
+    """
+    Mapping of names visible in the current scope.
+    Declarations are recorded in an undo log, so entering a scope
+    is constant time and leaving it costs only as much as the number
+    of declarations made inside.
+    """
+    def __init__(self):
+        # name -> (value, depth of the declaring scope)
+        self._bindings = {}
+        # (name, shadowed binding or _MISSING)
+        self._log = []
+        # lengths of the log when scopes were entered
+        self._marks = []
+
+    @property
+    def depth(self) -> int:
+        return len(self._marks)
+
+    def push(self):
+        self._marks.append(len(self._log))
+
+    def pop(self) -> list:
+        """
+        Leaves the current scope, returning values of the names declared
+        in it (latest first).
+        """
+        mark = self._marks.pop()
+        dropped = []
+        while len(self._log) > mark:
+            name, shadowed = self._log.pop()
+            dropped.append(self._bindings[name][0])
+            if shadowed is _MISSING:
+                del self._bindings[name]
+            else:
+                self._bindings[name] = shadowed
+        return dropped
+
+    def declare(self, name, value):
+        """ Declares `name`, replacing its declaration in the same scope. """
+        binding = self._bindings.get(name, _MISSING)
+        if binding is _MISSING or binding[1] != self.depth:
+            self._log.append((name, binding))
+        self._bindings[name] = (value, self.depth)
+
+    def in_current_scope(self, name) -> bool:
+        binding = self._bindings.get(name)
+        return binding is not None and binding[1] == self.depth
+
+    def get(self, name, default=None):
+        binding = self._bindings.get(name)
+        return default if binding is None else binding[0]
+
+    def __getitem__(self, name):
+        return self._bindings[name][0]
+
+    def __contains__(self, name) -> bool:
+        return name in self._bindings
@@ -0,0 +1,210 @@
+"""
+Static single assignment form of IR functions.
+
+`build` puts phis where values of a temporary assigned more than once meet
+(at dominance frontiers of its assignments, only for temporaries live
+across blocks) and renames the temporaries, so each is assigned once.
+`destruct` turns phis back into copies at the ends of predecessors,
+splitting critical edges first.
+"""
+from ir import Block, Copy, Function, Jump, Phi, Temp
+
+
+def reverse_postorder(fun: Function) -> list:
+    """ Blocks reachable from the entry, in reverse postorder. """
+    entry = fun.blocks[0]
+    order, visited = [], {entry}
+    stack = [(entry, iter(entry.successors()))]
+    while stack:
+        block, successors = stack[-1]
+        for succ in successors:
+            if succ not in visited:
+                visited.add(succ)
+                stack.append((succ, iter(succ.successors())))
+                break
+        else:
+            stack.pop()
+            order.append(block)
+    order.reverse()
+    return order
+
+
+def dominators(order: list, preds: dict) -> dict:
+    """
+    Immediate dominator of each block of `order` (reverse postorder),
+    the entry is its own (Cooper, Harvey and Kennedy).
+    """
+    index = {block: i for i, block in enumerate(order)}
+    idom = {order[0]: order[0]}
+    changed = True
+    while changed:
+        changed = False
+        for block in order[1:]:
+            new = None
+            for pred in preds[block]:
+                if pred not in idom:
+                    continue
+                if new is None:
+                    new = pred
+                    continue
+                a, b = pred, new
+                while a is not b:
+                    while index[a] > index[b]:
+                        a = idom[a]
+                    while index[b] > index[a]:
+                        b = idom[b]
+                new = a
+            if idom.get(block) is not new:
+                idom[block] = new
+                changed = True
+    return idom
+
+
+def frontiers(order: list, preds: dict, idom: dict) -> dict:
+    """ Dominance frontier of each block. """
+    frontier = {block: set() for block in order}
+    for block in order:
+        if len(preds[block]) < 2:
+            continue
+        for pred in preds[block]:
+            runner = pred
+            while runner is not idom[block]:
+                frontier[runner].add(block)
+                runner = idom[runner]
+    return frontier
+
+
+def build(fun: Function):
+    preds = fun.predecessors()
+    order = reverse_postorder(fun)
+    idom = dominators(order, preds)
+    frontier = frontiers(order, preds, idom)
+
+    # blocks assigning each temporary, parameters in the entry
+    assigned = {param: [order[0]] for param in fun.params}
+    # temporaries read in a block before it assigns them
+    live_across = set()
+    for block in order:
+        killed = set()
+        for instr in block.instrs:
+            live_across.update(t for t in instr.temps() if t not in killed)
+            if instr.dest is not None:
+                killed.add(instr.dest)
+                assigned.setdefault(instr.dest, []).append(block)
+    renamed = {
+        temp for temp, blocks in assigned.items()
+        if len(blocks) > 1 and temp in live_across
+    }
+
+    for temp in sorted(renamed, key=lambda t: t.id):
+        has_phi = set()
+        work = list(dict.fromkeys(assigned[temp]))
+        while work:
+            for block in frontier[work.pop()]:
+                if block in has_phi:
+                    continue
+                has_phi.add(block)
+                block.instrs.insert(len(block.phis()), Phi(
+                    temp, list(preds[block]), [temp] * len(preds[block])
+                ))
+                work.append(block)
+    renamed.update(
+        temp for temp, blocks in assigned.items() if len(blocks) > 1
+    )
+    _rename(fun, order[0], idom, renamed)
+
+
+def _rename(fun: Function, entry: Block, idom: dict, renamed: set):
+    children = {}
+    for block, parent in idom.items():
+        if block is not entry:
+            children.setdefault(parent, []).append(block)
+    # temporary -> stack of its current versions
+    versions = {temp: [temp] for temp in renamed if temp in fun.params}
+
+    def current(arg):
+        if type(arg) is not Temp or arg not in renamed:
+            return arg
+        stack = versions.get(arg)
+        # read before any assignment (only on paths where it is dead)
+        return stack[-1] if stack else 0
+
+    # block -> temporaries it assigns (their versions to drop after it)
+    assigned = {}
+    work = [(entry, False)]
+    while work:
+        block, leaving = work.pop()
+        if leaving:
+            for temp in assigned.pop(block):
+                versions[temp].pop()
+            continue
+        defined = []
+        for instr in block.instrs:
+            if type(instr) is not Phi:
+                instr.args = [current(arg) for arg in instr.args]
+            temp = instr.dest
+            if temp in renamed:
+                instr.dest = fun.new_temp(temp.name)
+                versions.setdefault(temp, []).append(instr.dest)
+                defined.append(temp)
+        assigned[block] = defined
+        for succ in dict.fromkeys(block.successors()):
+            for phi in succ.phis():
+                i = phi.blocks.index(block)
+                phi.args[i] = current(phi.args[i])
+        work.append((block, True))
+        work += [(child, False) for child in children.get(block, ())]
+
+
+def destruct(fun: Function):
+    """ Replaces phis by copies on the edges leading to their blocks. """
+    placed = list(fun.blocks)
+    for block in placed:
+        phis = block.phis()
+        if not phis:
+            continue
+        del block.instrs[:len(phis)]
+        for i, pred in enumerate(phis[0].blocks):
+            copies = [(phi.dest, phi.args[i]) for phi in phis]
+            if len(pred.successors()) > 1:
+                pred = _split(fun, pred, block)
+            terminator = pred.instrs.pop()
+            pred.instrs += sequential_copies(fun, copies)
+            pred.instrs.append(terminator)
+
+
+def _split(fun: Function, pred: Block, succ: Block) -> Block:
+    """ A block placed on the edge from `pred` to `succ`. """
+    middle = fun.new_block()
+    middle.instrs.append(Jump(succ))
+    terminator = pred.instrs[-1]
+    if terminator.if_true is succ:
+        terminator.if_true = middle
+    if terminator.if_false is succ:
+        terminator.if_false = middle
+    fun.blocks.insert(fun.blocks.index(pred) + 1, middle)
+    return middle
+
+
+def sequential_copies(fun: Function, copies: list) -> list:
+    """
+    Copies doing the (dest, source) `copies` as if all at once - none
+    overwrites a source before it is read, cycles go through a new
+    temporary.
+    """
+    pending = [(dest, src) for dest, src in copies if dest is not src]
+    instrs = []
+    while pending:
+        for i, (dest, src) in enumerate(pending):
+            if all(other is not dest for _, other in pending):
+                instrs.append(Copy(dest, src))
+                del pending[i]
+                break
+        else:
+            dest = pending[0][0]
+            saved = fun.new_temp(dest.name)
+            instrs.append(Copy(saved, dest))
+            pending = [
+                (d, saved if s is dest else s) for d, s in pending
+            ]
+    return instrs
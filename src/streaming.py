@@ -0,0 +1,163 @@
+"""
+Streaming compilation - the source is parsed one top level definition
+at a time, and once declarations of the whole program are loaded, each
+function is checked, optimized, generated and written to the output on
+its own. Its code and (most of) its AST are released before the next
+one, so memory does not hold parse trees, tokens nor assembly of the
+whole program. The data section is written at the end.
+"""
+from latte_ast import ClassDef, FunDef, Program
+from deep_recursion import run_deep
+from pass_manager import (
+    CheckReturns, CheckTypes, Compilation, CountLocals, EvaluateConstants,
+    FindStrings, GenerateCode, LoadState, OptimizePeephole, OptimizeTree,
+    Pass, PassManager, PropagateConstants
+)
+from pass_stats import PassStats
+
+
+def parse_and_lower(compilation: Compilation) -> Program:
+    """ AST of the program, built without its whole parse tree. """
+    from lowering import lower
+    from parsing import TopDefParser
+    c = compilation
+    parser = TopDefParser(
+        c.input_stream, c.sll, c.fast_lexer, c.lexer_listener
+    )
+    defs = [lower(top_def) for top_def in parser]
+    c.stats.count('ll_fallback', parser.ll_fallbacks)
+    return Program(defs[0].line, defs)
+
+
+def units(program: Program):
+    """
+    Yields (and forgets) pieces of `program` compiled separately,
+    each a program of a single function. A class is split into shells
+    holding one method each (the first one with its fields).
+    """
+    defs = program.defs
+    defs.reverse()
+    while defs:
+        top_def = defs.pop()
+        if isinstance(top_def, FunDef):
+            yield Program(program.line, [top_def])
+            continue
+        methods = top_def.methods
+        methods.reverse()
+        fields = top_def.field_defs
+        while fields is not None or methods:
+            yield Program(program.line, [ClassDef(
+                top_def.line, top_def.name, top_def.parent, fields or [],
+                [methods.pop()] if methods else []
+            )])
+            fields = None
+
+
+def functions(program: Program):
+    """ Yields (function, class or None) of a unit. """
+    top_def = program.defs[0]
+    if isinstance(top_def, FunDef):
+        yield top_def, None
+    else:
+        for fun in top_def.methods:
+            yield fun, top_def.name
+
+
+class ParseByDefinitions(Pass):
+    name = 'parse'
+    provides = ('ast',)
+
+    def run(self, compilation: Compilation):
+        compilation.tree = run_deep(parse_and_lower, compilation)
+        compilation.stats.watch(compilation.tree)
+
+
+class GenerateFunctions(GenerateCode):
+    """ Generates functions of a unit, each by a writer of its own. """
+    def run(self, compilation: Compilation):
+        c = compilation
+        c.code_gen.add_strings(c.strings)
+        c.writers = [
+            c.code_gen.generate_function(fun, obj)
+            for fun, obj in functions(c.tree)
+        ]
+
+
+class OptimizeFunctions(OptimizePeephole):
+    def run(self, compilation: Compilation):
+        from peephole_optimizer import PeepholeOptimizer
+        for writer in compilation.writers:
+            PeepholeOptimizer(writer).optimize()
+
+
+# passes run for every unit, with declarations already loaded
+UNIT_PIPELINE = [
+    CheckTypes(), EvaluateConstants(), CheckReturns(),
+    PropagateConstants(), OptimizeTree(),
+    CountLocals(), FindStrings(),
+    GenerateFunctions(), OptimizeFunctions(),
+]
+
+
+class CompileUnits(Pass):
+    """
+    Compiles units of the program one by one, writing their code to
+    `compilation.output`, followed by the data section.
+    """
+    name = 'CompileUnits'
+    requires = ('ast', 'state')
+    provides = ('assembly',)
+    goal = True
+
+    def run(self, compilation: Compilation):
+        from assembly_generator import AssemblyGenerator
+        from assembly_writer import AssemblyWriter
+        c = compilation
+        code_gen = AssemblyGenerator([], None, c.module)
+        code_gen.set_state(*c.loader.get_state(), c.loader.layouts)
+        code_gen.prepare_stable_labels()
+        write = CodeOutput(c.output)
+
+        writer = AssemblyWriter()
+        code_gen.gen_text_intro(writer)
+        write(writer)
+        manager = PassManager(UNIT_PIPELINE)
+        instructions = 0
+        for unit in units(c.tree):
+            unit_compilation = Compilation(
+                None, c.optimizations, PassStats(enabled=False),
+                module=c.module
+            )
+            unit_compilation.tree = unit
+            unit_compilation.loader = c.loader
+            unit_compilation.code_gen = code_gen
+            unit_compilation.available.update(('ast', 'state'))
+            manager.run(unit_compilation)
+            for writer in unit_compilation.writers:
+                instructions += len(writer.instructions)
+                write(writer)
+
+        writer = AssemblyWriter()
+        code_gen.gen_data_section(writer, code_gen.empty_string_used)
+        # comments of data (vtables) follow right after it
+        write(writer, 0)
+        c.stats.count('instructions_written', instructions)
+
+
+class CodeOutput:
+    """ Writes code of writers (each aligned on its own) to `output`. """
+    def __init__(self, output):
+        self.output = output
+        self.first = True
+
+    def __call__(self, writer, width: int = None):
+        if not writer.instructions:
+            return
+        if not self.first:
+            self.output.write('\n')
+        self.output.write(writer.format(width))
+        self.first = False
+
+
+# in order of running
+STREAMING_PIPELINE = [ParseByDefinitions(), LoadState(), CompileUnits()]
@@ -1,8 +1,8 @@
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
+from fusion import Analysis
+from latte_ast import * # noqa
 
 
-class StringFinder(LatteVisitor):
+class StringFinder(Analysis):
     """
     Finds and returns all strings in program.
     """
@@ -12,5 +12,5 @@ class StringFinder(LatteVisitor):
     def get_strings(self):
         return self._strings
 
-    def visitEStr(self, ctx: LatteParser.EStrContext):
-        self._strings.append(ctx.getText())
+    def exitEStr(self, node: EStr):
+        self._strings.append(node.text)
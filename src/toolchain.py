@@ -0,0 +1,84 @@
+"""
+Assembling and linking of generated code.
+"""
+import os
+import shlex
+import subprocess
+import tempfile
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.join(HERE, '../lib')
+RUNTIME_PATH = os.path.join(LIB, 'runtime.o')
+
+# prelinked by `make`: crt startup objects + runtime, crt epilogue objects
+# and ld options otherwise worked out by gcc driver (libc path, loader)
+RUNTIME_BUNDLE_PATH = os.path.join(LIB, 'runtime_bundle.o')
+RUNTIME_END_PATH = os.path.join(LIB, 'runtime_end.o')
+LD_FLAGS_PATH = os.path.join(LIB, 'ld_flags')
+
+# in-memory filesystem for intermediate files, if there is one
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def run_tool(command: list) -> int:
+    """ Runs toolchain command, forwarding its output through `print`. """
+    try:
+        proc = subprocess.run(
+            command,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    except FileNotFoundError:
+        print(f'{command[0]}: command not found')
+        return 127
+    if proc.stdout:
+        print(proc.stdout, end='')
+    return proc.returncode
+
+
+def assemble(base_file: str) -> int:
+    """ Turns `base_file`.asm into `base_file`.o object file. """
+    return run_tool(
+        ['nasm', '-f', 'Elf32', '-o', f'{base_file}.o', f'{base_file}.asm']
+    )
+
+
+def link(objects: list, output: str) -> int:
+    """ Links object files (of one or many modules) with the runtime. """
+    return run_tool(['gcc', '-m32', RUNTIME_PATH, *objects, '-o', output])
+
+
+def assemble_and_link(base_file: str) -> int:
+    """
+    Turns `base_file`.asm into `base_file`.out executable.
+    Stops at the first failing step, returning its exit code (or 0).
+    """
+    status = assemble(base_file)
+    if status:
+        return status
+    return link([f'{base_file}.o'], f'{base_file}.out')
+
+
+def build_in_memory(code: str, base_file: str) -> int:
+    """
+    Turns assembly `code` into `base_file`.out executable,
+    keeping intermediate files in memory (when possible) and linking
+    with `ld` directly against prelinked runtime bundle.
+    Stops at the first failing step, returning its exit code (or 0).
+    """
+    if not os.path.exists(LD_FLAGS_PATH):
+        print('Prelinked runtime not found, run `make` first.')
+        return 1
+    with open(LD_FLAGS_PATH) as f:
+        ld_flags = shlex.split(f.read())
+    with tempfile.TemporaryDirectory(dir=SCRATCH_DIR) as tmp:
+        asm, obj = os.path.join(tmp, 'code.asm'), os.path.join(tmp, 'code.o')
+        with open(asm, 'w') as f:
+            f.write(code)
+        status = run_tool(['nasm', '-f', 'Elf32', '-o', obj, asm])
+        if status:
+            return status
+        return run_tool(
+            ['ld', '-m', 'elf_i386', *ld_flags, '-o', f'{base_file}.out',
+             RUNTIME_BUNDLE_PATH, obj, '-lc', RUNTIME_END_PATH]
+        )
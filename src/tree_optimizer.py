@@ -1,67 +1,80 @@
-from antlr4gen.LatteParser import LatteParser
-from antlr4gen.LatteVisitor import LatteVisitor
+from latte_ast import * # noqa
 
+LITERALS = (EInt, ETrue, EFalse, EStr)
 
-class TreeOptimizer(LatteVisitor):
+
+class TreeOptimizer(NodeVisitor):
     """
-    Fronted optimizer which (to some extent) removes dead code.
+    Fronted optimizer which (to some extent) removes dead code
+    and replaces expressions of known value by literals.
     """
-    def visitCond(self, ctx: LatteParser.CondContext):
-        val = ctx.expr().expr_value
-        idx = ctx.parentCtx.children.index(ctx)
+    def visitBlock(self, node: Block):
+        stmts = node.stmts
+        for i, stmt in enumerate(stmts):
+            replacement = yield stmt
+            if replacement is not None:
+                stmts[i] = replacement
+
+    def optimized(self, stmt):
+        """ `stmt`, or what replaces it. """
+        replacement = yield stmt
+        return stmt if replacement is None else replacement
+
+    def visitCond(self, node: Cond):
+        val = node.cond.expr_value
         if val:
-            ctx.parentCtx.children[idx] = ctx.stmt()
+            return (yield from self.optimized(node.stmt))
         if val is False:
-            ctx.parentCtx.children[idx] =\
-                LatteParser.EmptyContext(LatteParser, ctx.parentCtx)
+            return Empty(node.line)
+        yield from self.fold_children(node)
 
-    def visitCondElse(self, ctx: LatteParser.CondElseContext):
-        cond = ctx.expr().expr_value
-        idx = ctx.parentCtx.children.index(ctx)
+    def visitCondElse(self, node: CondElse):
+        cond = node.cond.expr_value
         if cond is True:
-            ctx.parentCtx.children[idx] = ctx.stmt(0)
+            return (yield from self.optimized(node.stmt))
         elif cond is False:
-            ctx.parentCtx.children[idx] = ctx.stmt(1)
-
-    def visitWhile(self, ctx: LatteParser.WhileContext):
-        cond = ctx.expr().expr_value
-        idx = ctx.parentCtx.children.index(ctx)
-        if cond is False:
-            ctx.parentCtx.children[idx] =\
-                LatteParser.EmptyContext(LatteParser, ctx.parentCtx)
+            return (yield from self.optimized(node.else_stmt))
+        yield from self.fold_children(node)
 
-    def visitDefAss(self, ctx: LatteParser.DefAssContext):
-        expr = ctx.expr()
-        if expr.expr_value is not None:
-            idx = ctx.children.index(expr)
-            ctx.children[idx] = self.make_node(expr.expr_value, ctx)
+    def visitWhile(self, node: While):
+        if node.cond.expr_value is False:
+            return Empty(node.line)
+        yield from self.fold_children(node)
 
-    def visitAss(self, ctx: LatteParser.AssContext):
-        expr = ctx.children[2]
-        if expr.expr_value is not None:
-            ctx.children[2] = self.make_node(expr.expr_value, ctx)
+    def fold_children(self, node: Node):
+        """
+        Replaces children of `node` which are expressions of known value
+        (and constant subexpressions of the others) by literals.
+        """
+        for name in node.fields:
+            child = getattr(node, name)
+            if type(child) is list:
+                for i, arg in enumerate(child):
+                    child[i] = yield from self.fold(arg)
+            elif isinstance(child, Expr):
+                setattr(node, name, (yield from self.fold(child)))
+            elif child is not None:
+                setattr(node, name, (yield from self.optimized(child)))
 
-    def visitEFunCall(self, ctx: LatteParser.EFunCallContext):
-        for i, expr in enumerate(ctx.expr()):
-            if expr.expr_value is not None:
-                # add 1 for ID and 1 for '(' - terminal node
-                ctx.children[2 + 2 * i] = self.make_node(expr.expr_value, ctx)
+    def fold(self, expr: Expr):
+        if expr.expr_value is not None and type(expr) not in LITERALS:
+            return self.make_node(expr)
+        yield expr
+        return expr
 
-    def visitEMthdCall(self, ctx: LatteParser.EMthdCallContext):
-        args = [e for e in ctx.expr()][1:]
-        for i, arg in enumerate(args):
-            if arg.expr_value is not None:
-                # add 4 for expr, '.' and '('
-                ctx.children[4 + 2 * i] = self.make_node(arg.expr_value, ctx)
+    visitDefAss = visitAss = visitAttrAss = visitRet = fold_children
+    visitEFunCall = visitEMthdCall = visitEAttr = fold_children
+    visitEUnOp = visitEMulOp = visitEAddOp = visitERelOp = fold_children
+    visitEAnd = visitEOr = fold_children
 
     @staticmethod
-    def make_node(expr_value, parent):
-        node_type = {
-            str: LatteParser.EStrContext,
-            int: LatteParser.EIntContext,
-            True: LatteParser.ETrueContext,
-            False: LatteParser.EFalseContext
-        }[expr_value if isinstance(expr_value, bool) else type(expr_value)]
-        node = node_type(LatteParser, parent)
-        node.getText = lambda: str(expr_value)
+    def make_node(expr: Expr) -> Expr:
+        """ A literal of the value of `expr`. """
+        value = expr.expr_value
+        if isinstance(value, bool):
+            node = (ETrue if value else EFalse)(expr.line)
+        else:
+            node = EInt(expr.line, value)
+        node.expr_type = expr.expr_type
+        node.expr_value = value
         return node
@@ -0,0 +1,133 @@
+"""
+Global value numbering of IR functions in SSA form (see ssa.py).
+
+Blocks are visited down the dominator tree. An arithmetic or comparison
+computed again in a block dominated by the one computing it first
+reuses the first result, copies are dropped and their destinations
+replaced by their sources. Reads of fields are reused only while memory
+is known not to have changed: within a block and into blocks whose only
+predecessor is their immediate dominator. A store forgets reads at its
+offset (and remembers the value stored), a call forgets all of them.
+"""
+from expression_evaluator import arithmetic, relation
+from ir import Binary, Call, Copy, Function, Load, Phi, Store, Temp, Unary
+from latte_ast import Op, UnOp
+from ssa import dominators, reverse_postorder
+
+COMMUTATIVE = (Op.ADD, Op.MUL, Op.EQ, Op.NE)
+RELATIONS = (Op.LT, Op.LE, Op.GT, Op.GE, Op.EQ, Op.NE)
+
+
+def fold(instr):
+    """
+    Value of an operation on integer constants (or comparing a value
+    with itself), if it has one.
+    """
+    args = instr.args
+    if type(instr) is Binary and instr.op in RELATIONS and \
+            type(args[0]) is Temp and args[0] is args[1]:
+        return int(instr.op in (Op.LE, Op.GE, Op.EQ))
+    if any(type(a) is not int for a in args):
+        return None
+    if type(instr) is Unary:
+        if instr.op is UnOp.NEG:
+            return arithmetic(Op.SUB, 0, args[0])
+        return int(not args[0])
+    if instr.op in RELATIONS:
+        return int(relation(instr.op, *args))
+    return arithmetic(instr.op, *args)
+
+
+def key(instr) -> tuple:
+    """ What an arithmetic or comparison computes. """
+    args = instr.args
+    if type(instr) is Binary and instr.op in COMMUTATIVE:
+        args = sorted(args, key=repr)
+    return (type(instr), instr.op, *args)
+
+
+def number_values(fun: Function) -> int:
+    """ Removes redundant instructions of `fun`, returns their number. """
+    preds = fun.predecessors()
+    order = reverse_postorder(fun)
+    idom = dominators(order, preds)
+    entry = order[0]
+    children = {}
+    for block, parent in idom.items():
+        if block is not entry:
+            children.setdefault(parent, []).append(block)
+
+    # temporary -> operand holding its value
+    replaced = {}
+
+    def operand(arg):
+        return replaced.get(arg, arg) if type(arg) is Temp else arg
+
+    # computation -> operand holding its result
+    available = {}
+    # offset -> {base -> operand} read or written at the end of a block
+    memory_at_end = {}
+    # block -> computations it made available
+    added = {}
+    removed = 0
+    work = [(entry, False)]
+    while work:
+        block, leaving = work.pop()
+        if leaving:
+            for computation in added.pop(block):
+                del available[computation]
+            continue
+        parent = idom[block]
+        if block is not entry and preds[block] == [parent]:
+            memory = dict(memory_at_end[parent])
+        else:
+            memory = {}
+        computations, kept = [], []
+        for instr in block.instrs:
+            instr_type = type(instr)
+            if instr_type is not Phi:
+                instr.args = [operand(arg) for arg in instr.args]
+            if instr_type is Copy:
+                replaced[instr.dest] = instr.args[0]
+            elif instr_type in (Binary, Unary):
+                value = fold(instr)
+                computation = key(instr)
+                if value is None:
+                    value = available.get(computation)
+                if value is None:
+                    available[computation] = instr.dest
+                    computations.append(computation)
+                    kept.append(instr)
+                    continue
+                replaced[instr.dest] = value
+            elif instr_type is Load:
+                base, offset = instr.args[0], instr.offset
+                read = memory.get(offset, {})
+                value = read.get(base)
+                if value is None:
+                    # (copied - blocks dominated by this one share them)
+                    memory[offset] = {**read, base: instr.dest}
+                    kept.append(instr)
+                    continue
+                replaced[instr.dest] = value
+            else:
+                if instr_type is Store:
+                    base, value = instr.args
+                    # another base may be the same object
+                    memory[instr.offset] = {base: value}
+                elif instr_type is Call:
+                    memory = {}
+                kept.append(instr)
+                continue
+            removed += 1
+        block.instrs = kept
+        memory_at_end[block] = memory
+        added[block] = computations
+        work.append((block, True))
+        work += [(child, False) for child in children.get(block, ())]
+
+    # values coming from blocks dominated by the phis (through back edges)
+    for block in order:
+        for phi in block.phis():
+            phi.args = [operand(arg) for arg in phi.args]
+    return removed
@@ -1,38 +1,43 @@
+from scoped_table import ScopedTable
 
 
 class VariableAllocator:
     """
     Keeps mapping: variable name -> offset.
     Reuses 4 * `locals_count` memory when allocating variables.
+    Variables declared in a scope give their memory back when it is left.
     """
     def __init__(self, locals_count: int):
-        self._free = {- 4 * k for k in range(1, locals_count + 1)}
-        self.names = {}
+        # a stack, offsets closest to EBP are taken first
+        self._free = [- 4 * k for k in range(locals_count, 0, -1)]
+        self.names = ScopedTable()
 
     def __setitem__(self, key, value):
-        if key in self.names:
-            self._free.add(self.names[key])
-        self.names[key] = value
+        if self.names.in_current_scope(key):
+            self._free.append(self.names[key])
+        self.names.declare(key, value)
         if value in self._free:
             self._free.remove(value)
 
     def __getitem__(self, key):
         return self.names[key]
 
-    def __delitem__(self, key):
-        self._free.add(self.names[key])
-        del self.names[key]
-
     def __contains__(self, item):
         return item in self.names
 
     def new(self, name=None):
         val = self._free.pop()
         if name:
-            if name in self.names:
-                self._free.add(self.names[name])
-            self.names[name] = val
+            if self.names.in_current_scope(name):
+                self._free.append(self.names[name])
+            self.names.declare(name, val)
         return val
 
     def free(self, val):
-        self._free.add(val)
+        self._free.append(val)
+
+    def push_scope(self):
+        self.names.push()
+
+    def pop_scope(self):
+        self._free += self.names.pop()